@@ -0,0 +1,67 @@
+"""Benchmark parallel loading of N-Triples files with `tripper.bulkload`.
+
+A generated N-Triples file is loaded into an in-memory rdflib triplestore
+with `Triplestore.parse()` and with `bulkload()` for different numbers of
+worker processes.
+
+Usage:
+
+    python benchmarks/bulkload.py [--size SIZE] [--workers WORKERS]
+
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from tripper import RDFS, XSD, Triplestore
+from tripper.bulkload import bulkload
+
+EX = "http://example.com/bench#"
+
+
+def write_ntriples(path, ntriples):
+    """Write `ntriples` generated triples to the N-Triples file `path`."""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(ntriples):
+            s = f"<{EX}item{i // 3}>"
+            if i % 3 == 0:
+                f.write(f"{s} <{RDFS.subClassOf}> <{EX}class{i % 17}> .\n")
+            elif i % 3 == 1:
+                f.write(f'{s} <{RDFS.label}> "Item {i}"@en .\n')
+            else:
+                f.write(f'{s} <{EX}value> "{i}"^^<{XSD.integer}> .\n')
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=300_000)
+    parser.add_argument(
+        "--workers",
+        default="1,2,4",
+        help="Comma-separated list of number of worker processes.",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "bench.nt"
+        write_ntriples(path, args.size)
+
+        print("Throughput in triples per second")
+        ts = Triplestore("rdflib")
+        t0 = time.perf_counter()
+        ts.parse(str(path), format="ntriples")
+        print(f"{'parse':>12}{args.size / (time.perf_counter() - t0):>12.0f}")
+
+        for workers in args.workers.split(","):
+            ts = Triplestore("rdflib")
+            t0 = time.perf_counter()
+            bulkload(ts, path, workers=int(workers), chunk_size=2**20)
+            rate = args.size / (time.perf_counter() - t0)
+            print(f"{'workers=' + workers:>12}{rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark loading and reading large graphs with the rdflib backend.
+
+Measures the number of triples per second added with `add_triples()`
+and read back with `triples()`.  The generated data reuses a limited set
+of classes, predicates and literals, as is typical for real graphs, such
+that the effect of the term conversion caches of the rdflib backend can
+be measured by comparing with `--cache-size 0`.
+
+Usage:
+
+    python benchmarks/rdflib_backend.py [--triples TRIPLES]
+        [--cache-size CACHE_SIZE] [--repeat REPEAT]
+
+"""
+
+import argparse
+import time
+
+from tripper import RDF, RDFS, Literal, Triplestore
+from tripper.backends import rdflib as rdflib_backend
+
+EX = "http://example.com/bench#"
+
+
+def generate_triples(ntriples):
+    """Return a list of `ntriples` generated triples."""
+    triples = []
+    for i in range(ntriples):
+        s = f"{EX}item{i // 4}"
+        if i % 4 == 0:
+            triples.append((s, RDF.type, f"{EX}Class{i % 50}"))
+        elif i % 4 == 1:
+            triples.append((s, RDFS.label, Literal(f"Item {i // 4}")))
+        elif i % 4 == 2:
+            triples.append((s, f"{EX}status", Literal(f"state{i % 7}")))
+        else:
+            triples.append((s, f"{EX}value", Literal(i % 1000)))
+    return triples
+
+
+def timeit(func, repeat):
+    """Return the best time of `repeat` calls to `func`."""
+    best = float("inf")
+    for _ in range(repeat):
+        rdflib_backend.clear_term_caches()
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--triples", type=int, default=200_000)
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=rdflib_backend.TERM_CACHE_SIZE,
+        help="Size of the term conversion caches.  Zero disables them.",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rdflib_backend.TERM_CACHE_SIZE = args.cache_size
+    triples = generate_triples(args.triples)
+
+    def load():
+        ts = Triplestore("rdflib")
+        ts.add_triples(triples)
+        return ts
+
+    ts = load()
+
+    def read():
+        for _ in ts.triples():
+            pass
+
+    print(f"Triples: {args.triples}, cache size: {args.cache_size}")
+    print(f"{'operation':<12}{'triples/s':>12}")
+    for name, func in [("add_triples", load), ("triples", read)]:
+        print(f"{name:<12}{args.triples / timeit(func, args.repeat):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark decoding of SPARQL SELECT results in the SPARQLWrapper
+backend.
+
+Compares the number of decoded rows per second for SPARQL JSON results
+(the default) and SPARQL TSV results (`select_format="tsv"`).  Only the
+decoding is measured, using generated result documents, such that the
+numbers are not affected by the network or the triplestore.
+
+Usage:
+
+    python benchmarks/select_decoding.py [--rows ROWS] [--repeat REPEAT]
+
+"""
+
+import argparse
+import json
+import time
+
+from tripper.backends.sparqlwrapper import (
+    convert_json_entrydict,
+    decode_tsv_row,
+)
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+
+def generate_results(nrows):
+    """Return a `(json_document, tsv_lines)` tuple with `nrows` rows of
+    generated SELECT results with an IRI, a language-tagged literal and
+    an integer column."""
+    bindings = []
+    lines = [b"?s\t?label\t?n\n"]
+    for i in range(nrows):
+        iri = f"http://example.com/item/{i}"
+        label = f"Item number {i}"
+        bindings.append(
+            {
+                "s": {"type": "uri", "value": iri},
+                "label": {"type": "literal", "value": label, "xml:lang": "en"},
+                "n": {
+                    "type": "literal",
+                    "value": str(i),
+                    "datatype": f"{XSD}integer",
+                },
+            }
+        )
+        lines.append(f'<{iri}>\t"{label}"@en\t{i}\n'.encode("utf-8"))
+    document = json.dumps(
+        {
+            "head": {"vars": ["s", "label", "n"]},
+            "results": {"bindings": bindings},
+        }
+    ).encode("utf-8")
+    return document, lines
+
+
+def decode_json(document):
+    """Decode SPARQL JSON results like the SPARQLWrapper backend."""
+    ret = json.loads(document.decode("utf-8"))
+    names = ret["head"]["vars"]
+    return [
+        [
+            convert_json_entrydict(binding[name]) if name in binding else None
+            for name in names
+        ]
+        for binding in ret["results"]["bindings"]
+    ]
+
+
+def decode_tsv(lines):
+    """Decode SPARQL TSV results like the SPARQLWrapper backend."""
+    it = iter(lines)
+    next(it)
+    return [decode_tsv_row(line) for line in it]
+
+
+def timeit(func, arg, repeat):
+    """Return the best time of `repeat` calls to `func(arg)`."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    document, lines = generate_results(args.rows)
+    assert decode_json(document) == decode_tsv(lines)  # nosec
+
+    size_json = len(document)
+    size_tsv = sum(len(line) for line in lines)
+    t_json = timeit(decode_json, document, args.repeat)
+    t_tsv = timeit(decode_tsv, lines, args.repeat)
+
+    print(f"{'format':<8}{'size (MB)':>12}{'rows/s':>14}")
+    for name, size, t in (
+        ("json", size_json, t_json),
+        ("tsv", size_tsv, t_tsv),
+    ):
+        print(f"{name:<8}{size / 1e6:>12.2f}{args.rows / t:>14.0f}")
+    print(f"TSV speedup: {t_json / t_tsv:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
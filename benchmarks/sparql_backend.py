@@ -0,0 +1,154 @@
+"""Benchmark the SPARQLWrapper backend against a local SPARQL endpoint.
+
+A local SPARQL endpoint backed by an rdflib graph (see
+`tests/sparql_endpoint.py`) is started in a background thread, such that
+no network access or external triplestore is needed.  For each data size
+and chunk size, the following operations are timed:
+
+- add: `add_triples()` with INSERT DATA requests of `update_chunk_size`
+  triples
+- triples: iterating over `triples()` with pages of `page_size` triples
+- select-json, select-tsv: a SELECT query returning all triples, with
+  JSON and TSV results
+- construct: a CONSTRUCT query returning all triples as N-Triples
+- remove: `remove_triples()` with DELETE DATA requests of
+  `update_chunk_size` triples
+
+Since the endpoint evaluates queries with rdflib, the absolute numbers
+are dominated by rdflib for large data sizes.  The benchmark is intended
+for comparing changes to the client side of the SPARQL backends.
+
+Usage (from the root of the repository, such that the endpoint can be
+imported from `tests`):
+
+    python -m benchmarks.sparql_backend [--sizes SIZES] [--chunks CHUNKS]
+        [--repeat REPEAT]
+
+"""
+
+import argparse
+import time
+
+from tests.sparql_endpoint import SparqlEndpoint
+from tripper import RDFS, Literal, Triplestore
+
+EX = "http://example.com/bench#"
+
+
+def generate_triples(ntriples):
+    """Return a list of `ntriples` generated triples with IRI, literal
+    and language-tagged literal objects."""
+    triples = []
+    for i in range(ntriples):
+        s = f"{EX}item{i // 3}"
+        if i % 3 == 0:
+            triples.append((s, RDFS.subClassOf, f"{EX}class{i % 17}"))
+        elif i % 3 == 1:
+            triples.append((s, RDFS.label, Literal(f"Item {i}", lang="en")))
+        else:
+            triples.append((s, f"{EX}value", Literal(i)))
+    return triples
+
+
+def run(endpoint, triples, chunk, repeat):
+    """Time all operations for the given triples and chunk size.
+
+    Returns a dict mapping operation names to the best time in seconds.
+    """
+    url = endpoint.url
+    ts = Triplestore(
+        backend="sparqlwrapper",
+        base_iri=url,
+        update_iri=url,
+        page_size=chunk,
+        update_chunk_size=chunk,
+    )
+    ts_tsv = Triplestore(
+        backend="sparqlwrapper", base_iri=url, select_format="tsv"
+    )
+    select = "SELECT ?s ?p ?o WHERE { ?s ?p ?o }"
+    construct = "CONSTRUCT WHERE { ?s ?p ?o }"
+
+    times = {}
+
+    def measure(name, func, setup=None, check=None):
+        best = float("inf")
+        for _ in range(repeat):
+            if setup:
+                setup()
+            t0 = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - t0)
+            if check:
+                assert check(result), name  # nosec
+        times[name] = best
+
+    def clear():
+        endpoint.graph.remove((None, None, None))
+
+    def fill():
+        clear()
+        ts.add_triples(triples)
+
+    n = len(triples)
+    measure("add", lambda: ts.add_triples(triples), setup=clear)
+    fill()
+    measure("triples", lambda: sum(1 for _ in ts.triples()), check=n.__eq__)
+    measure("select-json", lambda: len(ts.query(select)), check=n.__eq__)
+    measure("select-tsv", lambda: len(ts_tsv.query(select)), check=n.__eq__)
+    measure(
+        "construct",
+        lambda: sum(1 for _ in ts.query(construct)),
+        check=n.__eq__,
+    )
+    measure("remove", lambda: ts.remove_triples(triples), setup=fill)
+    assert len(endpoint.graph) == 0  # nosec
+    return times
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default="1000,10000",
+        help="Comma-separated list of number of triples.",
+    )
+    parser.add_argument(
+        "--chunks",
+        default="1000,10000",
+        help=(
+            "Comma-separated list of chunk sizes, used for `page_size` and "
+            "`update_chunk_size`."
+        ),
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    chunks = [int(chunk) for chunk in args.chunks.split(",")]
+    operations = [
+        "add",
+        "triples",
+        "select-json",
+        "select-tsv",
+        "construct",
+        "remove",
+    ]
+
+    print("Throughput in triples per second")
+    header = "".join(f"{op:>13}" for op in operations)
+    print(f"{'triples':>8}{'chunk':>8}{header}")
+    with SparqlEndpoint() as endpoint:
+        for size in sizes:
+            triples = generate_triples(size)
+            for chunk in chunks:
+                times = run(endpoint, triples, chunk, args.repeat)
+                print(
+                    f"{size:>8}{chunk:>8}"
+                    + "".join(f"{size / times[o]:>13.0f}" for o in operations)
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Test the native in-memory backend."""
+
+# pylint: disable=invalid-name
+
+
+def test_memory_backend():
+    """Test memory backend."""
+    from tripper import RDF, RDFS, XSD, Literal, Triplestore
+
+    ts = Triplestore("memory")
+    EX = ts.bind("ex", "http://example.com#")
+    assert not list(ts.triples())
+
+    triples = [
+        (EX.Animal, RDFS.subClassOf, EX.Organism),
+        (EX.Dog, RDFS.subClassOf, EX.Animal),
+        (EX.Dog, RDFS.label, Literal("Dog", lang="en")),
+        (EX.Dog, RDFS.label, Literal("Hund", lang="no")),
+        (EX.fido, RDF.type, EX.Dog),
+        (EX.fido, EX.hasAge, Literal(3)),
+        (EX.fido, EX.hasName, Literal(EX.fido)),
+        ("_:bn1", RDFS.subClassOf, EX.Dog),
+    ]
+    ts.add_triples(triples)
+    ts.add_triples(triples[:2])  # adding existing triples has no effect
+    assert len(ts.backend) == len(triples)
+    assert set(ts.triples()) == set(triples)
+
+    # Test all combinations of bound subject, predicate and object
+    assert set(ts.triples(subject=EX.Dog)) == set(triples[1:4])
+    assert set(ts.triples(predicate=RDFS.label)) == set(triples[2:4])
+    assert set(ts.triples(object=EX.Dog)) == {triples[4], triples[7]}
+    assert set(ts.triples(EX.Dog, RDFS.label)) == set(triples[2:4])
+    assert set(ts.triples(EX.fido, object=Literal(3))) == {triples[5]}
+    assert set(ts.triples(predicate=RDF.type, object=EX.Dog)) == {triples[4]}
+    assert list(ts.triples(*triples[0])) == [triples[0]]
+    assert not list(ts.triples(EX.Cat))
+    assert not list(ts.triples(EX.Dog, RDF.type, EX.Animal))
+
+    # Literals are returned unchanged and are not confused with IRIs
+    age = ts.value(EX.fido, EX.hasAge)
+    assert isinstance(age, Literal)
+    assert age.datatype == XSD.integer
+    assert age.value == 3
+    assert ts.value(EX.fido, EX.hasAge) == Literal(3, datatype=XSD.integer)
+    assert not ts.has(EX.fido, EX.hasAge, Literal("3"))
+    assert not ts.has(EX.fido, EX.hasName, EX.fido)
+    assert ts.has(EX.fido, EX.hasName, Literal(EX.fido))
+    assert ts.value(predicate=RDFS.subClassOf, object=EX.Dog) == "_:bn1"
+    assert ts.value(EX.Dog, RDFS.label, lang="no") == "Hund"
+    assert set(ts.subject_objects(RDFS.subClassOf)) == {
+        (EX.Animal, EX.Organism),
+        (EX.Dog, EX.Animal),
+        ("_:bn1", EX.Dog),
+    }
+
+    # Test remove
+    ts.remove(EX.Dog, RDFS.label)
+    assert not ts.has(EX.Dog, RDFS.label)
+    assert len(ts.backend) == len(triples) - 2
+    ts.remove(object=EX.Dog)
+    assert set(ts.triples()) == {triples[0], triples[1], *triples[5:7]}
+    ts.remove(EX.Cat)  # removing non-existing triples has no effect
+    assert len(ts.backend) == 4
+
+    # Test that the store can be modified while iterating
+    for s, p, o in ts.triples(predicate=RDFS.subClassOf):
+        ts.remove(s, p, o)
+    assert not ts.has(predicate=RDFS.subClassOf)
+
+    ts.set((EX.fido, EX.hasAge, Literal(4)))
+    assert ts.value(EX.fido, EX.hasAge) == Literal(4)
+
+    ts.remove()
+    assert not list(ts.triples())
+    assert len(ts.backend) == 0
+
+    assert ts.prefer_sparql is False
+
+
+def test_memory_serialize():
+    """Test parsing and serialisation with the memory backend, which
+    falls back to rdflib."""
+    import pytest
+
+    pytest.importorskip("rdflib")
+
+    from tripper import RDFS, Literal, Triplestore
+
+    ts = Triplestore("memory")
+    EX = ts.bind("ex", "http://example.com#")
+    ts.add_triples(
+        [
+            (EX.Dog, RDFS.subClassOf, EX.Animal),
+            (EX.Dog, RDFS.label, Literal("Dog", lang="en")),
+        ]
+    )
+    dump = ts.serialize(format="turtle")
+    assert "ex:Dog" in dump
+
+    ts2 = Triplestore("memory")
+    ts2.parse(data=dump, format="turtle")
+    assert set(ts2.triples()) == set(ts.triples())
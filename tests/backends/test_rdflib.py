@@ -3,7 +3,7 @@
 Most of the rdflib backend is already tested in tests/test_triplestore.py.
 """
 
-# pylint: disable=invalid-name
+# pylint: disable=invalid-name,protected-access
 
 
 def test_rdflib_backend():
@@ -38,3 +38,199 @@ def test_rdflib_backend():
     assert ts.value(predicate=RDFS.subClassOf, object=EX.s) == "_:bn1"
 
     assert ts.prefer_sparql is False
+
+
+def test_term_caches():
+    """Test conversion of terms with the term caches."""
+    import pytest
+
+    pytest.importorskip("rdflib")
+
+    from rdflib import ConjunctiveGraph, URIRef
+
+    from tripper import RDFS, XSD, Literal, Triplestore
+    from tripper.backends import rdflib as backend
+
+    backend.clear_term_caches()
+    EX = "http://ex#"
+
+    # Literals that compare equal must not share cache entries
+    values = [
+        Literal("1"),
+        Literal("1", datatype=XSD.string),
+        Literal("1", lang="en"),
+        Literal(1),
+        EX + "1",
+        "_:1",
+    ]
+    terms = [backend.tordflib(v) for v in values]
+    assert len(set(terms)) == len(values)
+    assert [backend.tordflib(v) for v in values] == terms
+    assert [backend.fromrdflib(t) for t in terms] == values
+    assert [backend.fromrdflib(t) for t in terms] == values
+
+    # The caches are bounded
+    backend.TERM_CACHE_SIZE, size = 3, backend.TERM_CACHE_SIZE
+    try:
+        for i in range(10):
+            assert backend.tordflib(f"{EX}{i}") == URIRef(f"{EX}{i}")
+        assert len(backend._tordflib_cache) <= 3
+    finally:
+        backend.TERM_CACHE_SIZE = size
+
+    # Bulk addition to graphs and to the default context of datasets
+    triples = [(f"{EX}{i}", RDFS.label, Literal(i)) for i in range(5)]
+    for graph in None, ConjunctiveGraph():
+        ts = Triplestore("rdflib", graph=graph)
+        ts.add_triples(triples)
+        assert sorted(ts.triples()) == triples
+
+
+def test_project():
+    """Test that subjects(), objects(), etc. only convert the requested
+    terms."""
+    import pytest
+
+    pytest.importorskip("rdflib")
+
+    from tripper import RDFS, Literal, Triplestore
+    from tripper.backends import rdflib as backend
+
+    ts = Triplestore("rdflib")
+    EX = ts.bind("ex", "http://ex#")
+    triples = [(EX[f"s{i}"], RDFS.label, Literal(f"s{i}")) for i in range(3)]
+    ts.add_triples(triples)
+    assert "project" in ts.capabilities
+
+    backend.clear_term_caches()
+    assert sorted(ts.subjects(RDFS.label)) == [EX.s0, EX.s1, EX.s2]
+    assert list(ts.predicates(EX.s1)) == [RDFS.label]
+    assert not backend._fromrdflib_cache  # no literals converted
+
+    assert list(ts.objects(EX.s1, RDFS.label)) == [Literal("s1")]
+    assert sorted(ts.subject_objects(RDFS.label)) == [
+        (s, o) for s, _, o in triples
+    ]
+    assert list(ts.predicate_objects(EX.s2)) == [(RDFS.label, "s2")]
+    assert list(ts.subject_predicates(Literal("s0"))) == [(EX.s0, RDFS.label)]
+
+
+def test_sqlite_store(tmp_path):
+    """Test the rdflib backend with a persistent SQLite store."""
+    import sqlite3
+
+    import pytest
+
+    pytest.importorskip("rdflib")
+
+    from tripper import RDFS, XSD, Literal, Triplestore
+    from tripper.errors import ArgumentValueError
+
+    store = f"sqlite:{tmp_path / 'kb.sqlite'}"
+    EX = "http://ex#"
+    triples = [
+        (f"{EX}Cat", RDFS.subClassOf, f"{EX}Animal"),
+        (f"{EX}Cat", RDFS.label, Literal("Cat", lang="en")),
+        (f"{EX}Cat", RDFS.comment, Literal('A "cat"')),
+        (f"{EX}Cat", f"{EX}legs", Literal(4)),
+        (f"{EX}Cat", f"{EX}code", Literal("4", datatype=XSD.string)),
+        ("_:b1", RDFS.subClassOf, f"{EX}Cat"),
+    ]
+
+    ts = Triplestore("rdflib", store=store)
+    ts.bind("ex", EX)
+    ts.add_triples(triples)
+    ts.update(f"INSERT DATA {{ <{EX}Dog> rdfs:subClassOf <{EX}Animal> }}")
+    ts.remove(predicate=RDFS.comment)
+    ts.close()
+
+    # Changes are kept when the store is opened again
+    ts = Triplestore("rdflib", store=store)
+    assert set(ts.triples()) == set(triples[:2] + triples[3:]) | {
+        (f"{EX}Dog", RDFS.subClassOf, f"{EX}Animal")
+    }
+    assert ts.value(f"{EX}Cat", f"{EX}legs") == 4
+    assert ts.query("SELECT ?s WHERE { ?s rdfs:subClassOf ex:Animal }") in (
+        [(f"{EX}Cat",), (f"{EX}Dog",)],
+        [(f"{EX}Dog",), (f"{EX}Cat",)],
+    )
+    assert ts.backend.namespaces()["ex"] == EX
+    assert ts.backend._parses_sparql()  # pylint: disable=protected-access
+
+    # Named graphs are recorded in the `graphs` table when added
+    ts.add((f"{EX}Cow", RDFS.subClassOf, f"{EX}Animal"), graph=f"{EX}g")
+    ts.close()
+    with sqlite3.connect(tmp_path / "kb.sqlite") as conn:
+        graphs = {g for (g,) in conn.execute("SELECT g FROM graphs")}
+    assert f"<{EX}g" in graphs
+
+    # Databases without recorded graphs are upgraded when opened
+    with sqlite3.connect(tmp_path / "kb.sqlite") as conn:
+        conn.execute("DELETE FROM graphs")
+        conn.execute("PRAGMA user_version = 0")
+    ts = Triplestore("rdflib", store=store)
+    assert ts.has(f"{EX}Cow")
+    assert set(ts.triples(graph=f"{EX}g")) == {
+        (f"{EX}Cow", RDFS.subClassOf, f"{EX}Animal")
+    }
+    ts.close()
+
+    with pytest.raises(ArgumentValueError):
+        Triplestore("rdflib", store=store, triplestore_url="kb.ttl")
+
+
+def test_journal(tmp_path):
+    """Test the rdflib backend with a change journal."""
+    import pytest
+
+    pytest.importorskip("rdflib")
+
+    from tripper import RDFS, Literal, Triplestore
+
+    url = tmp_path / "kb.ttl"
+    journal = tmp_path / "kb.ttl.journal"
+    EX = "http://ex#"
+    triples = [
+        (f"{EX}Cat", RDFS.subClassOf, f"{EX}Animal"),
+        (f"{EX}Cat", RDFS.label, Literal('The "cat"\nmeows', lang="en")),
+        (f"{EX}Cat", f"{EX}legs", Literal(4)),
+        ("_:b1", RDFS.subClassOf, f"{EX}Cat"),
+    ]
+
+    ts = Triplestore("rdflib", triplestore_url=str(url), journal=True)
+    ts.add_triples(triples)
+    ts.remove(predicate=f"{EX}legs")
+    ts.remove_triples([triples[0]])
+    ts.close()
+    assert not url.exists()
+    assert len(journal.read_text().splitlines()) == 6
+
+    # Interrupted writes are ignored
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write(f"A <{EX}Dog> <{RDFS.subClassOf}> <{EX}An")
+
+    ts = Triplestore("rdflib", triplestore_url=str(url), journal=True)
+    assert set(ts.triples()) == {triples[1], triples[3]}
+    assert len(journal.read_text().splitlines()) == 6
+
+    # Blank nodes keep their labels
+    ts.remove(subject="_:b1")
+    ts.close()
+    ts = Triplestore("rdflib", triplestore_url=str(url), journal=True)
+    assert list(ts.triples()) == [triples[1]]
+    ts.backend.compact()
+    assert url.exists()
+    assert journal.read_text() == ""
+    ts.add(triples[0])
+    ts.close()
+
+    ts = Triplestore("rdflib", triplestore_url=str(url), journal=True)
+    assert set(ts.triples()) == {triples[0], triples[1]}
+
+    # SPARQL updates are written by compacting
+    ts.update(f"DELETE DATA {{ <{EX}Cat> rdfs:subClassOf <{EX}Animal> }}")
+    assert journal.read_text() == ""
+    ts.close()
+    ts = Triplestore("rdflib", triplestore_url=str(url), journal=True)
+    assert list(ts.triples()) == [triples[1]]
+    ts.close()
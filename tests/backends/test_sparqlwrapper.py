@@ -43,3 +43,494 @@ WHERE
         else:
             raise
     assert res == [("http://www.wikidata.org/entity/Q20", "Norway")]
+
+
+def test_sparqlwrapper_local(sparql_endpoint):
+    """Test SPARQLwrapper backend against a local endpoint."""
+    import pytest
+
+    pytest.importorskip("SPARQLWrapper")
+
+    from tripper import RDFS, Literal, Triplestore
+
+    url = sparql_endpoint.url
+    ts = Triplestore(
+        backend="sparqlwrapper", base_iri=url, update_iri=url, page_size=4
+    )
+    EX = ts.bind("ex", "http://example.com#")
+    triples = [(EX[f"C{i}"], RDFS.subClassOf, EX.Base) for i in range(10)]
+    triples.append((EX.Base, RDFS.label, Literal("Base", lang="en")))
+    ts.add_triples(triples)
+
+    # triples() fetches results in pages of `page_size` triples
+    del sparql_endpoint.requests[:]
+    assert set(ts.triples(predicate=RDFS.subClassOf)) == set(triples[:10])
+    assert len(sparql_endpoint.requests) == 3
+    assert set(ts.triples()) == set(triples)
+    assert list(ts.triples(*triples[-1])) == [triples[-1]]
+    assert not list(ts.triples(EX.C1, RDFS.subClassOf, EX.C2))
+
+    # Only the first page is requested if iteration stops early
+    del sparql_endpoint.requests[:]
+    assert next(ts.triples(object=EX.Base)) in triples
+    assert len(sparql_endpoint.requests) == 1
+
+    assert ts.count() == 11
+    assert ts.count(object=EX.Base) == 10
+    assert ts.has(EX.Base, RDFS.label)
+    assert not ts.has(EX.Base, RDFS.subClassOf)
+    assert ts.value(EX.Base, RDFS.label) == Literal("Base", lang="en")
+    c1, c0 = ts.triples_many([(EX.C1, None, None), (EX.C0, RDFS.label, None)])
+    assert c1 == [triples[1]]
+    assert not c0
+
+    ts.backend.page_size = None
+    assert set(ts.triples()) == set(triples)
+
+
+def test_sparqlwrapper_modify_while_iterating(sparql_endpoint):
+    """Test that all triples are returned if the triplestore is modified
+    while iterating over triples() without paging."""
+    import pytest
+
+    pytest.importorskip("SPARQLWrapper")
+
+    from tripper import RDFS, Triplestore
+
+    url = sparql_endpoint.url
+    for select_format in "json", "tsv":
+        ts = Triplestore(
+            backend="sparqlwrapper",
+            base_iri=url,
+            update_iri=url,
+            select_format=select_format,
+        )
+        assert ts.backend.page_size is None
+        EX = ts.bind("ex", "http://example.com#")
+        ts.add_triples(
+            [(EX[f"C{i}"], RDFS.subClassOf, EX.Base) for i in range(35)]
+        )
+        for s, _, _ in ts.triples(predicate=RDFS.subClassOf):
+            ts.remove(s, RDFS.subClassOf, EX.Base)
+        assert not list(ts.triples())
+
+
+def test_sparqlwrapper_named_graphs():
+    """Test named graphs with the SPARQLwrapper backend."""
+    import pytest
+
+    pytest.importorskip("SPARQLWrapper")
+    rdflib = pytest.importorskip("rdflib")
+
+    import warnings
+
+    from sparql_endpoint import SparqlEndpoint
+
+    from tripper import RDFS, Triplestore
+
+    # rdflib.Dataset fails on INSERT DATA into the default graph
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        graph = rdflib.ConjunctiveGraph()
+
+    with SparqlEndpoint(graph) as endpoint:
+        url = endpoint.url
+        ts = Triplestore(backend="sparqlwrapper", base_iri=url, update_iri=url)
+        EX = ts.bind("ex", "http://example.com#")
+        ts.add((EX.Animal, RDFS.subClassOf, EX.Thing))
+        ts.add_triples(
+            [
+                (EX.Cat, RDFS.subClassOf, EX.Animal),
+                (EX.Dog, RDFS.subClassOf, EX.Animal),
+            ],
+            graph=EX.pets,
+        )
+        assert set(ts.triples(graph=EX.pets)) == {
+            (EX.Cat, RDFS.subClassOf, EX.Animal),
+            (EX.Dog, RDFS.subClassOf, EX.Animal),
+        }
+        assert ts.has(EX.Cat, RDFS.subClassOf, EX.Animal, graph=EX.pets)
+        assert not ts.has(EX.Animal, graph=EX.pets)
+
+        ts.remove(EX.Cat, graph=EX.pets)
+        assert not list(ts.triples(subject=EX.Cat, graph=EX.pets))
+        ts.drop_graph(EX.pets)
+        assert not list(ts.triples(graph=EX.pets))
+        assert list(ts.triples()) == [(EX.Animal, RDFS.subClassOf, EX.Thing)]
+
+
+def test_sparqlwrapper_pool(sparql_endpoint):
+    """Test that the SPARQLwrapper backend reuses connections and is
+    safe to use from several threads."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    import pytest
+
+    pytest.importorskip("SPARQLWrapper")
+    from SPARQLWrapper.SPARQLExceptions import QueryBadFormed
+
+    from tripper import RDFS, Triplestore
+
+    url = sparql_endpoint.url
+    ts = Triplestore(backend="sparqlwrapper", base_iri=url, update_iri=url)
+    EX = ts.bind("ex", "http://example.com#")
+    ts.add_triples([(EX[f"C{i}"], RDFS.subClassOf, EX.Base) for i in range(5)])
+
+    # Sequential requests reuse the same connection
+    connections = sparql_endpoint.connections
+    for i in range(5):
+        assert ts.has(EX[f"C{i}"], RDFS.subClassOf, EX.Base)
+        assert ts.count(EX[f"C{i}"]) == 1
+    assert sparql_endpoint.connections - connections <= 1
+
+    # Concurrent queries from several threads with different queries
+    def query(i):
+        ts.add((EX[f"D{i}"], RDFS.subClassOf, EX[f"C{i % 5}"]))
+        return ts.value(EX[f"D{i}"], RDFS.subClassOf)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(query, range(40)))
+    assert results == [EX[f"C{i % 5}"] for i in range(40)]
+    assert ts.count(predicate=RDFS.subClassOf) == 45
+    assert sparql_endpoint.connections - connections <= 9
+
+    with pytest.raises(QueryBadFormed):
+        ts.query("SELECT ?s WHERE { ?s ?p }")
+    assert ts.count() == 45
+
+    # Disable pooling
+    ts.backend.pool_size = 0
+    connections = sparql_endpoint.connections
+    assert ts.count() == 45
+    assert ts.count() == 45
+    assert sparql_endpoint.connections - connections == 2
+
+
+def test_sparqlwrapper_tsv(sparql_endpoint):
+    """Test decoding of SELECT results in TSV format."""
+    import pytest
+
+    pytest.importorskip("SPARQLWrapper")
+
+    from tripper import Triplestore
+    from tripper.errors import ArgumentValueError
+
+    sparql_endpoint.graph.update("""
+        PREFIX ex: <http://example.com#>
+        PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
+        INSERT DATA {
+          ex:a ex:p "tab\\there \\"q\\" \\\\ back\\nslash \\u00e5"@en ,
+            "plain", "x"^^xsd:string, -3, 2.5, 1e3, true .
+          _:b1 ex:p ex:a .
+          ex:b ex:p ex:a .
+        }
+        """)
+    url = sparql_endpoint.url
+    ts_json = Triplestore(backend="sparqlwrapper", base_iri=url)
+    ts_tsv = Triplestore(
+        backend="sparqlwrapper", base_iri=url, select_format="tsv"
+    )
+    assert ts_tsv.backend.select_format == "tsv"
+
+    query = "SELECT ?s ?o ?x WHERE { ?s ?p ?o OPTIONAL { ?o ?p ?x } }"
+    result = ts_tsv.query(query)
+    assert len(result) == 21
+    assert sorted(result, key=repr) == sorted(ts_json.query(query), key=repr)
+    assert sorted(ts_tsv.query_iter(query).fetchall(), key=repr) == sorted(
+        result, key=repr
+    )
+    assert set(ts_tsv.triples()) == set(ts_json.triples())
+    assert ts_tsv.count() == 9
+
+    with pytest.raises(ArgumentValueError):
+        Triplestore(backend="sparqlwrapper", base_iri=url, select_format="x")
+
+
+def test_sparqlwrapper_construct(sparql_endpoint, monkeypatch):
+    """Test streaming of CONSTRUCT and DESCRIBE results as N-Triples."""
+    import pytest
+
+    pytest.importorskip("SPARQLWrapper")
+    import sparql_endpoint as endpoint_module
+
+    from tripper import Literal, Triplestore
+    from tripper.backends.sparqlwrapper import decode_ntriples
+
+    sparql_endpoint.graph.update("""
+        PREFIX ex: <http://example.com#>
+        INSERT DATA {
+          ex:a ex:p "line\\nbreak \\"q\\""@en , "plain", 3, 2.5 .
+          ex:a ex:q [ ex:p ex:b ] .
+        }
+        """)
+    ts = Triplestore(backend="sparqlwrapper", base_iri=sparql_endpoint.url)
+
+    def without_bnodes(triples):
+        return {
+            tuple("_:" if str(t).startswith("_:") else t for t in triple)
+            for triple in triples
+        }
+
+    query = "CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }"
+    triples = set(ts.query(query))
+    assert len(triples) == 6
+    assert (
+        "http://example.com#a",
+        "http://example.com#p",
+        Literal('line\nbreak "q"', lang="en"),
+    ) in triples
+    assert (
+        "http://example.com#a",
+        "http://example.com#p",
+        Literal(3),
+    ) in triples
+    assert ("_:", "http://example.com#p", "http://example.com#b") in (
+        without_bnodes(triples)
+    )
+    assert len(list(ts.query("DESCRIBE <http://example.com#a>"))) == 6
+
+    # Endpoints that do not support N-Triples fall back to Turtle
+    monkeypatch.setattr(
+        endpoint_module, "GRAPH_FORMATS", {"text/turtle": "turtle"}
+    )
+    turtle = ts.query(query)
+    assert without_bnodes(turtle) == without_bnodes(triples)
+
+    assert list(
+        decode_ntriples([b"<http://ex.com#s> <http://ex.com#p> _:b0 .\n"])
+    ) == [("http://ex.com#s", "http://ex.com#p", "_:b0")]
+
+
+def test_sparqlwrapper_chunked_update(sparql_endpoint):
+    """Test chunked INSERT DATA and DELETE DATA requests."""
+    import pytest
+
+    pytest.importorskip("SPARQLWrapper")
+
+    from tripper import RDF, Literal, Triplestore
+
+    ts = Triplestore(
+        backend="sparqlwrapper",
+        base_iri=sparql_endpoint.url,
+        update_chunk_size=10,
+    )
+    EX = ts.bind("ex", "http://example.com#")
+    triples = [(EX[f"i{i}"], RDF.value, Literal(i)) for i in range(25)]
+
+    def posts():
+        return sum(m == "POST" for m, _ in sparql_endpoint.requests)
+
+    ts.add_triples(triples)
+    assert posts() == 3
+    assert set(ts.triples()) == set(triples)
+
+    # Byte budget
+    ts.backend.update_chunk_bytes = 300  # two triples
+    ts.remove_triples(triples[:5])
+    assert posts() == 3 + 3
+    assert ts.count() == 20
+
+    # Parallel submission and patterns
+    ts.backend.update_workers = 4
+    ts.backend.update_chunk_bytes = 2_000_000
+    ts.backend.update_chunk_size = 2
+    ts.remove_triples(triples[5:20] + [(None, RDF.value, Literal(24))])
+    assert ts.count() == 4
+    ts.remove_triples(triples[20:])
+    assert ts.count() == 0
+    ts.add_triples(triples)
+    assert set(ts.triples()) == set(triples)
+
+
+def test_sparqlwrapper_parse(sparql_endpoint, tmp_path):
+    """Test uploading data with the Graph Store HTTP Protocol."""
+    import io
+
+    import pytest
+
+    pytest.importorskip("SPARQLWrapper")
+
+    from tripper import RDF, RDFS, Literal, Triplestore
+
+    ts = Triplestore(
+        backend="sparqlwrapper",
+        base_iri=sparql_endpoint.url,
+        graph_store_iri=sparql_endpoint.graph_store_url,
+    )
+    EX = ts.bind("ex", "http://example.com#")
+    path = tmp_path / "animals.ttl"
+    path.write_text(
+        "@prefix ex: <http://example.com#> .\n"
+        "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+        'ex:Dog rdfs:subClassOf ex:Animal ; rdfs:label "hund"@nb .\n',
+        encoding="utf-8",
+    )
+
+    ts.parse(path)
+    ts.parse(str(path))  # adding existing triples has no effect
+    ts.parse(
+        data=f"<{EX.fido}> <{RDF.type}> <{EX.Dog}> .\n",
+        format="ntriples",
+    )
+    with open(path, encoding="utf-8") as f:
+        ts.parse(io.StringIO(f.read().replace("Dog", "Cat")), format="turtle")
+
+    assert set(ts.triples()) == {
+        (EX.Dog, RDFS.subClassOf, EX.Animal),
+        (EX.Dog, RDFS.label, Literal("hund", lang="nb")),
+        (EX.Cat, RDFS.subClassOf, EX.Animal),
+        (EX.Cat, RDFS.label, Literal("hund", lang="nb")),
+        (EX.fido, RDF.type, EX.Dog),
+    }
+    posts = [p for m, p in sparql_endpoint.requests if m == "POST"]
+    assert posts == ["/data?default"] * 4
+    assert sparql_endpoint.chunked == 1
+
+    # Upload without connection pool
+    ts.backend.pool_size = 0
+    data = f"<{EX.felix}> <{RDF.type}> <{EX.Cat}> .".encode()
+    ts.parse(io.BytesIO(data), format="nt")
+    assert ts.has(EX.felix, RDF.type, EX.Cat)
+    assert sparql_endpoint.chunked == 2
+
+    # Without a graph store endpoint, the data is sent as INSERT DATA
+    ts2 = Triplestore(backend="sparqlwrapper", base_iri=sparql_endpoint.url)
+    ts2.parse(data=f"<{EX.pluto}> <{RDF.type}> <{EX.Dog}> .", format="nt")
+    assert ts.has(EX.pluto, RDF.type, EX.Dog)
+    assert sparql_endpoint.requests[-2] == ("POST", "/sparql")
+
+
+def test_sparqlwrapper_parse_url(sparql_endpoint, tmp_path):
+    """Test parsing from a URL when a graph store endpoint is set."""
+    import functools
+    import threading
+    from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+    import pytest
+
+    pytest.importorskip("SPARQLWrapper")
+
+    from tripper import RDF, RDFS, Triplestore
+
+    for name in ("Dog", "Cat"):
+        (tmp_path / f"{name}.ttl").write_text(
+            "@prefix ex: <http://example.com#> .\n"
+            "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+            f"ex:{name} rdfs:subClassOf ex:Animal .\n",
+            encoding="utf-8",
+        )
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0),
+        functools.partial(SimpleHTTPRequestHandler, directory=tmp_path),
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    ts = Triplestore(
+        backend="sparqlwrapper",
+        base_iri=sparql_endpoint.url,
+        graph_store_iri=sparql_endpoint.graph_store_url,
+    )
+    EX = ts.bind("ex", "http://example.com#")
+    try:
+        ts.parse(f"{url}/Dog.ttl")
+        ts.parse(location=f"{url}/Cat.ttl")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # URL sources are parsed with rdflib and added with INSERT DATA
+    assert ts.has(EX.Dog, RDFS.subClassOf, EX.Animal)
+    assert ts.has(EX.Cat, RDFS.subClassOf, EX.Animal)
+    posts = [p for m, p in sparql_endpoint.requests if m == "POST"]
+    assert posts == ["/sparql"] * 2
+
+    # N-Triples is parsed without rdflib when there is no graph store
+    ts.backend.graph_store_iri = None
+    ts.parse(data=f"<{EX.fido}> <{RDF.type}> <{EX.Dog}> .", format="nt")
+    assert ts.has(EX.fido, RDF.type, EX.Dog)
+
+
+def test_sparqlwrapper_no_socket_leak(sparql_endpoint):
+    """Test that responses that are not read to the end are closed."""
+    import gc
+    import warnings
+
+    import pytest
+
+    pytest.importorskip("SPARQLWrapper")
+
+    from tripper import RDFS, Triplestore
+
+    url = sparql_endpoint.url
+    ts = Triplestore(
+        backend="sparqlwrapper",
+        base_iri=url,
+        update_iri=url,
+        select_format="tsv",
+    )
+    EX = ts.bind("ex", "http://example.com#")
+    ts.add_triples(
+        [(EX[f"C{i}"], RDFS.subClassOf, EX.Base) for i in range(2000)]
+    )
+    select = "SELECT ?s ?o WHERE { ?s ?p ?o }"
+    construct = "CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }"
+
+    with warnings.catch_warnings(record=True) as records:
+        warnings.simplefilter("always", ResourceWarning)
+        for _ in range(5):
+            cursor = ts.query_iter(select)
+            assert cursor.fetchone()
+            cursor.close()
+
+            cursor = ts.query_iter(select)
+            assert cursor.fetchone()
+            del cursor
+
+            triples = ts.backend.query(construct)
+            assert next(triples)
+            del triples
+            gc.collect()
+        assert ts.count() == 2000
+        del ts
+        gc.collect()
+    assert not [r for r in records if issubclass(r.category, ResourceWarning)]
+
+
+def test_sparqlwrapper_remove_bnodes(sparql_endpoint):
+    """Test removing triples with blank nodes."""
+    import pytest
+
+    pytest.importorskip("SPARQLWrapper")
+    import rdflib
+
+    from tripper import OWL, RDF, RDFS, Triplestore
+
+    EX = rdflib.Namespace("http://example.com#")
+    graph = sparql_endpoint.graph
+    for cls in (EX.A, EX.B):
+        restriction = rdflib.BNode()
+        graph.add((cls, rdflib.RDFS.subClassOf, restriction))
+        graph.add((restriction, rdflib.RDF.type, rdflib.OWL.Restriction))
+        graph.add((restriction, rdflib.OWL.onProperty, EX.hasPart))
+        graph.add((restriction, rdflib.OWL.someValuesFrom, cls))
+
+    ts = Triplestore(backend="sparqlwrapper", base_iri=sparql_endpoint.url)
+    (restriction,) = ts.objects(str(EX.A), RDFS.subClassOf)
+    assert restriction.startswith("_:")
+    ts.remove_triples(
+        [
+            (str(EX.A), RDFS.subClassOf, restriction),
+            (restriction, RDF.type, OWL.Restriction),
+            (restriction, OWL.onProperty, str(EX.hasPart)),
+            (restriction, OWL.someValuesFrom, str(EX.A)),
+        ]
+    )
+    assert ts.count() == 4
+    assert not ts.has(str(EX.A))
+    assert ts.has(str(EX.B), RDFS.subClassOf)
+
+    (restriction,) = ts.objects(str(EX.B), RDFS.subClassOf)
+    ts.remove((restriction, None, str(EX.B)))
+    assert ts.count() == 3
+    assert not ts.has(predicate=OWL.someValuesFrom)
@@ -125,3 +125,21 @@ ex:sum__{fid}_parameter2_second_param a fno:Parameter ;
 ex:MyConcept rdfs:subClassOf owl:Thing .
 
 """
+
+
+@pytest.fixture
+def sparql_endpoint() -> "Any":
+    """Return a local SPARQL endpoint backed by an empty rdflib graph.
+
+    The endpoint is served in a background thread and stopped when the
+    test finishes.
+
+    Returns:
+        A `sparql_endpoint.SparqlEndpoint` instance.
+
+    """
+    pytest.importorskip("rdflib")
+    from sparql_endpoint import SparqlEndpoint
+
+    with SparqlEndpoint() as endpoint:
+        yield endpoint
@@ -108,3 +108,27 @@ def test_convertions():
     save_container(ts, config3, EX.config3c, recognised_keys=reg_keys)
     d3c = load_container(ts, EX.config3c, recognised_keys=reg_keys)
     assert d3c == config3
+
+
+def test_load_container_uniqueness():
+    """Test that load_container() refuses ambiguous key-value pairs."""
+    pytest.importorskip("rdflib")
+    from tripper import EMMO, OTEIO, Literal, Triplestore
+    from tripper.convert import load_container, save_container
+    from tripper.errors import UniquenessError
+
+    ts = Triplestore(backend="rdflib")
+    EX = ts.bind("ex", "http://example.com/ex#")
+    save_container(ts, {"key": "val"}, EX.config)
+    pair = ts.value(EX.config, OTEIO.hasKeyValuePair)
+    key = ts.value(pair, OTEIO.hasDictionaryKey)
+
+    ts.add((key, EMMO.hasStringValue, Literal("other")))
+    with pytest.raises(UniquenessError):
+        load_container(ts, EX.config)
+
+    ts.remove((key, EMMO.hasStringValue, Literal("other")))
+    assert load_container(ts, EX.config) == {"key": "val"}
+    ts.add((pair, OTEIO.hasDictionaryKey, EX.otherKey))
+    with pytest.raises(UniquenessError):
+        load_container(ts, EX.config)
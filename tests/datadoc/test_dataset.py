@@ -446,6 +446,42 @@ def test_store():
     }
 
 
+def test_store_named_graph():
+    """Test store() with `named_graph=True`."""
+    from tripper import Triplestore
+    from tripper.datadoc import acquire, delete_iri, store
+
+    ts = Triplestore("rdflib")
+    EX = ts.bind("ex", "http://example.com/ex#")
+    d = {
+        "@id": EX.exdata,
+        "@type": EX.ExData,
+        "creator": {"name": "John Doe"},
+        "distribution": {
+            "downloadURL": "http://example.com/downloads/exdata.csv",
+        },
+    }
+    store(ts, d, type="Dataset", named_graph=True)
+    assert ts.has(EX.exdata, graph=EX.exdata)
+    ntriples = len(list(ts.triples(graph=EX.exdata)))
+    d1 = acquire(ts, EX.exdata)
+    assert d1.distribution.downloadURL == d["distribution"]["downloadURL"]
+
+    # Overwriting drops the old graph
+    store(ts, d, type="Dataset", method="overwrite", named_graph=True)
+    assert len(list(ts.triples(graph=EX.exdata))) == ntriples
+    d2 = acquire(ts, EX.exdata)
+    assert d2.distribution.downloadURL == d1.distribution.downloadURL
+
+    # The graph is only dropped when asked for
+    delete_iri(ts, EX.exdata)
+    assert len(list(ts.triples(graph=EX.exdata))) == ntriples
+
+    delete_iri(ts, EX.exdata, named_graph=True)
+    assert not ts.has(EX.exdata)
+    assert not list(ts.triples(graph=EX.exdata))
+
+
 def test_update_context():
     """Test update_context()."""
     from tripper import HUME, OWL, SKOS, Namespace
@@ -0,0 +1,249 @@
+"""A minimal local SPARQL endpoint backed by rdflib.
+
+It makes it possible to test the SPARQL backends without a connection
+to an external triplestore.  Only the parts of the SPARQL 1.1 protocol
+and the SPARQL 1.1 Graph Store HTTP Protocol used by tripper are
+supported.
+"""
+
+# pylint: disable=broad-except,too-many-instance-attributes
+# pylint: disable=too-many-statements
+
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import rdflib
+from rdflib.namespace import XSD
+
+# Map media types to rdflib result serialisation formats
+SELECT_FORMATS = {
+    "application/sparql-results+json": "json",
+    "application/json": "json",
+    "text/tab-separated-values": "tsv",
+    "text/csv": "csv",
+    "application/sparql-results+xml": "xml",
+    "application/xml": "xml",
+}
+
+# Regular expressions matching Turtle numbers and booleans that may be
+# written without quotes in TSV results
+PLAIN_LITERALS = {
+    XSD.integer: re.compile(r"[+-]?[0-9]+$"),
+    XSD.decimal: re.compile(r"[+-]?[0-9]*\.[0-9]+$"),
+    XSD.double: re.compile(r"[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)[eE][+-]?[0-9]+$"),
+    XSD.boolean: re.compile(r"true$|false$"),
+}
+
+GRAPH_FORMATS = {
+    "application/n-triples": "nt",
+    "text/turtle": "turtle",
+    "application/rdf+xml": "xml",
+}
+
+# Formats accepted by the graph store endpoint
+UPLOAD_FORMATS = {
+    **GRAPH_FORMATS,
+    "text/n3": "n3",
+    "application/ld+json": "json-ld",
+}
+
+
+def tsv_term(term: "rdflib.term.Node") -> str:
+    """Return `term` formatted as a cell in SPARQL TSV results."""
+    if term is None:
+        return ""
+    if isinstance(term, rdflib.Literal):
+        pattern = PLAIN_LITERALS.get(term.datatype)
+        if pattern and pattern.match(str(term)):
+            return str(term)
+        value = (
+            str(term)
+            .replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+            .replace("\t", "\\t")
+        )
+        if term.language:
+            return f'"{value}"@{term.language}'
+        if term.datatype:
+            return f'"{value}"^^<{term.datatype}>'
+        return f'"{value}"'
+    return term.n3()
+
+
+def tsv_results(result: "rdflib.query.Result") -> bytes:
+    """Serialise SELECT `result` as SPARQL TSV results."""
+    lines = ["\t".join(f"?{var}" for var in result.vars)]
+    for row in result:
+        lines.append("\t".join(tsv_term(term) for term in row))
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class SparqlEndpoint:
+    """A local SPARQL endpoint serving an rdflib graph in a background
+    thread.
+
+    Attributes:
+        graph: The rdflib graph served by the endpoint.
+        url: URL of the query and update endpoint.
+        graph_store_url: URL of the graph store endpoint.
+        requests: List of `(method, path)` tuples for all requests
+            handled by the endpoint.
+        chunked: Number of requests with chunked transfer encoding.
+        connections: Number of TCP connections accepted by the endpoint.
+    """
+
+    def __init__(self, graph: "rdflib.Graph" = None):
+        self.graph = graph if graph is not None else rdflib.Graph()
+        self.requests: list = []
+        self.connections = 0
+        self.chunked = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.url = f"{base}/sparql"
+        self.graph_store_url = f"{base}/data"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        )
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        """Start serving requests."""
+        self.thread.start()
+
+    def stop(self):
+        """Stop the endpoint."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler(self):
+        """Return a request handler class bound to this endpoint."""
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Request handler for the SPARQL protocol."""
+
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with endpoint.lock:
+                    endpoint.connections += 1
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                pass
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """Handle GET requests."""
+                self.handle_request(parse_qs(urlparse(self.path).query))
+
+            def do_POST(self):  # pylint: disable=invalid-name
+                """Handle POST requests."""
+                url = urlparse(self.path)
+                params = parse_qs(url.query, keep_blank_values=True)
+                body = self.read_body()
+                ctype = self.headers.get("Content-Type", "").split(";")[0]
+                if url.path == "/data":
+                    self.handle_upload(params, body, ctype)
+                    return
+                body = body.decode("utf-8")
+                if ctype == "application/x-www-form-urlencoded":
+                    params.update(parse_qs(body))
+                elif ctype == "application/sparql-query":
+                    params["query"] = [body]
+                elif ctype == "application/sparql-update":
+                    params["update"] = [body]
+                self.handle_request(params)
+
+            def read_body(self):
+                """Read and return the request body."""
+                if self.headers.get("Transfer-Encoding") != "chunked":
+                    length = int(self.headers.get("Content-Length", 0))
+                    return self.rfile.read(length)
+                with endpoint.lock:
+                    endpoint.chunked += 1
+                chunks = []
+                while True:
+                    size = int(self.rfile.readline().split(b";")[0], 16)
+                    chunks.append(self.rfile.read(size))
+                    self.rfile.readline()
+                    if not size:
+                        return b"".join(chunks)
+
+            def handle_upload(self, params, body, ctype):
+                """Add uploaded data to the default graph."""
+                with endpoint.lock:
+                    endpoint.requests.append((self.command, self.path))
+                    if "default" not in params:
+                        self.respond(400, b"only the default graph is served")
+                    elif ctype not in UPLOAD_FORMATS:
+                        self.respond(415)
+                    else:
+                        try:
+                            endpoint.graph.parse(
+                                data=body, format=UPLOAD_FORMATS[ctype]
+                            )
+                        except Exception as exc:
+                            self.respond(400, str(exc).encode("utf-8"))
+                        else:
+                            self.respond(204)
+
+            def handle_request(self, params):
+                """Evaluate query or update in `params` and send result."""
+                with endpoint.lock:
+                    endpoint.requests.append((self.command, self.path))
+                    try:
+                        if "update" in params:
+                            endpoint.graph.update(params["update"][0])
+                            self.respond(204)
+                        elif "query" in params:
+                            self.respond_query(params["query"][0])
+                        else:
+                            self.respond(400, b"missing query")
+                    except Exception as exc:
+                        self.respond(400, str(exc).encode("utf-8"))
+
+            def respond_query(self, query):
+                """Evaluate `query` and send the result."""
+                result = endpoint.graph.query(query)
+                accept = self.headers.get("Accept", "")
+                if result.type in ("CONSTRUCT", "DESCRIBE"):
+                    formats = GRAPH_FORMATS
+                    default = "text/turtle"
+                else:
+                    formats = SELECT_FORMATS
+                    default = "application/sparql-results+json"
+                mediatype = next(
+                    (
+                        m.split(";")[0].strip()
+                        for m in accept.split(",")
+                        if m.split(";")[0].strip() in formats
+                    ),
+                    default,
+                )
+                if formats[mediatype] == "tsv":
+                    data = tsv_results(result)
+                else:
+                    data = result.serialize(format=formats[mediatype])
+                self.respond(200, data, mediatype)
+
+            def respond(self, status, data=b"", mediatype="text/plain"):
+                """Send response."""
+                self.send_response(status)
+                self.send_header("Content-Type", mediatype)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
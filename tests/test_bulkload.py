@@ -0,0 +1,82 @@
+"""Test parallel loading of N-Triples and N-Quads files."""
+
+# pylint: disable=invalid-name
+
+import pytest
+
+pytest.importorskip("rdflib")
+
+
+def test_line_ranges(tmp_path):
+    """Test line_ranges()."""
+    from tripper.bulkload import line_ranges
+
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"a\nbb\nccc\n\ndddd\n")
+    for chunk_size in 1, 2, 3, 5, 100:
+        ranges = line_ranges(path, chunk_size)
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == path.stat().st_size
+        data = path.read_bytes()
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+            assert data[end - 1 : end] == b"\n"
+    assert line_ranges(path, 2) == [(0, 2), (2, 5), (5, 9), (9, 15)]
+
+
+def test_bulkload(tmp_path):
+    """Test bulkload() and Triplestore.parse() with `workers`."""
+    from tripper import RDFS, XSD, Literal, Triplestore
+    from tripper.bulkload import bulkload
+    from tripper.errors import ArgumentValueError
+
+    EX = "http://example.com#"
+    lines = []
+    for i in range(50):
+        lines.append(f'<{EX}s{i}> <{RDFS.label}> "Label \\"{i}\\""@en .\n')
+        lines.append(f'<{EX}s{i}> <{EX}value> "{i}"^^<{XSD.integer}> .\n')
+        lines.append(f"_:b{i % 5} <{RDFS.seeAlso}> <{EX}s{i}> .\n")
+    path = tmp_path / "data.nt"
+    path.write_text("".join(lines), encoding="utf-8")
+
+    ts = Triplestore("rdflib")
+    assert bulkload(ts, path, workers=2, chunk_size=500) == 150
+    triples = set(ts.triples())
+    assert len(triples) == 150
+    assert (f"{EX}s3", RDFS.label, Literal('Label "3"', lang="en")) in triples
+    assert ts.value(f"{EX}s7", f"{EX}value") == 7
+
+    # Blank node labels are kept across chunks
+    assert len(set(ts.subjects(RDFS.seeAlso))) == 5
+
+    ts2 = Triplestore("rdflib")
+    ts2.parse(path, format="ntriples", workers=1, chunk_size=300)
+    assert len(set(ts2.triples())) == 150
+    assert len(set(ts2.subjects(RDFS.seeAlso))) == 5
+
+    with pytest.raises(ArgumentValueError):
+        bulkload(ts, path, format="turtle")
+
+
+def test_bulkload_nquads(tmp_path):
+    """Test bulkload() of N-Quads."""
+    from tripper import RDFS, Triplestore
+    from tripper.bulkload import bulkload
+
+    EX = "http://example.com#"
+    path = tmp_path / "data.nq"
+    path.write_text(
+        "".join(
+            f"<{EX}s{i}> <{RDFS.subClassOf}> <{EX}Thing> <{EX}g{i % 2}> .\n"
+            f'<{EX}s{i}> <{RDFS.label}> "s{i}" .\n'
+            for i in range(10)
+        ),
+        encoding="utf-8",
+    )
+
+    ts = Triplestore("rdflib")
+    assert bulkload(ts, path, workers=2, chunk_size=200) == 20
+    assert len(list(ts.triples())) == 20
+    assert len(list(ts.triples(graph=f"{EX}g0"))) == 5
+    assert ts.has(f"{EX}s1", RDFS.subClassOf, graph=f"{EX}g1")
+    assert not ts.has(f"{EX}s1", RDFS.label, graph=f"{EX}g1")
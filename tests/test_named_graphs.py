@@ -0,0 +1,53 @@
+"""Test named graphs."""
+
+# pylint: disable=invalid-name
+
+import pytest
+
+
+def test_named_graphs():
+    """Test the `graph` argument and drop_graph() with rdflib."""
+    pytest.importorskip("rdflib")
+    from tripper import RDFS, Triplestore
+
+    ts = Triplestore("rdflib")
+    EX = ts.bind("ex", "http://example.com#")
+    ts.add((EX.Animal, RDFS.subClassOf, EX.Thing))
+    ts.add_triples([(EX.Cat, RDFS.subClassOf, EX.Animal)], graph=EX.cats)
+    ts.add((EX.Dog, RDFS.subClassOf, EX.Animal), graph=EX.dogs)
+
+    # The default graph includes the named graphs
+    assert set(ts.subjects(RDFS.subClassOf)) == {EX.Animal, EX.Cat, EX.Dog}
+    assert list(ts.triples(graph=EX.cats)) == [
+        (EX.Cat, RDFS.subClassOf, EX.Animal)
+    ]
+    assert ts.has(EX.Dog, graph=EX.dogs)
+    assert not ts.has(EX.Dog, graph=EX.cats)
+    assert ts.query("SELECT ?s WHERE { GRAPH ex:dogs { ?s ?p ?o } }") == [
+        (EX.Dog,)
+    ]
+
+    ts.remove(EX.Dog, graph=EX.cats)
+    assert ts.has(EX.Dog)
+    ts.drop_graph(EX.dogs)
+    assert not ts.has(EX.Dog)
+    assert ts.has(EX.Cat)
+
+    nquads = ts.serialize(format="nquads")
+    assert f"<{EX.cats}> ." in nquads
+
+    # Without `graph`, triples are removed from all graphs
+    ts.add((EX.Cat, RDFS.label, EX.Cat), graph=EX.cats)
+    ts.add((EX.Cat, RDFS.label, EX.Cat))
+    ts.remove(EX.Cat, RDFS.subClassOf)
+    assert not ts.has(EX.Cat, RDFS.subClassOf)
+    assert not ts.has(EX.Cat, RDFS.subClassOf, graph=EX.cats)
+    ts.remove_triples([(EX.Cat, RDFS.label, EX.Cat)])
+    assert not ts.has(EX.Cat)
+    assert ts.has(EX.Animal)
+
+    ts2 = Triplestore("memory")
+    with pytest.raises(NotImplementedError):
+        ts2.add((EX.Dog, RDFS.subClassOf, EX.Animal), graph=EX.dogs)
+    with pytest.raises(NotImplementedError):
+        ts2.drop_graph(EX.dogs)
@@ -0,0 +1,146 @@
+"""Test the N-Triples and N-Quads reader and writer."""
+
+# pylint: disable=invalid-name
+
+import pytest
+
+EX = "http://example.com#"
+DATA = rf"""# A comment
+
+<{EX}s> <{EX}p> "tab\tnewline\n\"quoted\" \\ é \U0001F600" .
+<{EX}sé> <{EX}p> "x"@en-GB .   # trailing comment
+_:b1 <{EX}p> "4"^^<http://www.w3.org/2001/XMLSchema#integer> .
+_:b.1 <{EX}p> "abc"^^<http://www.w3.org/2001/XMLSchema#string>.
+<{EX}s> <{EX}p> "" .
+<{EX}s> <{EX}p> "backslash\\" .
+"""
+
+
+def test_parse():
+    """Test parse()."""
+    from tripper import XSD, Literal
+    from tripper.ntriples import parse
+
+    expected = [
+        (f"{EX}s", f"{EX}p", Literal('tab\tnewline\n"quoted" \\ é 😀')),
+        (f"{EX}sé", f"{EX}p", Literal("x", lang="en-GB")),
+        ("_:b1", f"{EX}p", Literal(4)),
+        ("_:b.1", f"{EX}p", Literal("abc", datatype=XSD.string)),
+        (f"{EX}s", f"{EX}p", Literal("")),
+        (f"{EX}s", f"{EX}p", Literal("backslash\\")),
+    ]
+    triples = list(parse(data=DATA))
+    assert triples == expected
+    for triple, exp in zip(triples, expected):
+        assert triple[2].lang == exp[2].lang
+        assert triple[2].datatype == exp[2].datatype
+
+    assert list(parse(data=DATA.encode(), bnode_prefix="x")) == [
+        (f"_:x{s[2:]}" if s.startswith("_:") else s, p, o)
+        for s, p, o in expected
+    ]
+
+
+def test_parse_errors():
+    """Test that syntax errors are reported."""
+    from tripper.errors import ParseError
+    from tripper.ntriples import parse
+
+    for line in (
+        f"<{EX}s> <{EX}p> <{EX}o>",
+        f"<{EX}s> <{EX}p> <{EX}o . ",
+        f'<{EX}s> <{EX}p> "abc .',
+        f'<{EX}s> <{EX}p> "a\\qb" .',
+        f"<{EX}s> <{EX}p> <{EX}o> . <{EX}o>",
+        f"<{EX}s> <{EX}p> .",
+        f"<{EX}s> <{EX}p> <{EX}o> <{EX}g> .",
+    ):
+        with pytest.raises(ParseError):
+            list(parse(data=f"\n{line}\n"))
+
+
+def test_parse_triples():
+    """Test parse_triples()."""
+    from tripper.errors import ParseError
+    from tripper.ntriples import parse, parse_triples
+
+    assert list(parse_triples(data=DATA)) == list(parse(data=DATA))
+    with pytest.raises(ParseError, match="line 2: graph label"):
+        list(parse_triples(data=f"\n<{EX}s> <{EX}p> <{EX}o> <{EX}g> .\n"))
+
+
+def test_terms():
+    """Test parse_term(), literal_term() and the `literal_type` argument."""
+    from tripper import Literal
+    from tripper.errors import ParseError
+    from tripper.ntriples import literal_term, parse_line, parse_term, term
+
+    assert parse_term(f"<{EX}s>") == f"{EX}s"
+    assert parse_term("_:b1", bnode_prefix="x") == "_:xb1"
+    assert parse_term('"a\\tb"@en') == Literal("a\tb", lang="en")
+    with pytest.raises(ParseError):
+        parse_term(f"<{EX}s> <{EX}p>")
+
+    assert literal_term('a"b', datatype=f"{EX}dt") == f'"a\\"b"^^<{EX}dt>'
+    assert term(Literal("x", lang="en")) == literal_term("x", lang="en")
+
+    def literal_type(lexical, lang=None, datatype=None):
+        return (lexical, lang, datatype)
+
+    line = f'<{EX}s> <{EX}p> "01"^^<{EX}dt> .'
+    assert parse_line(line, literal_type=literal_type) == (
+        f"{EX}s",
+        f"{EX}p",
+        ("01", None, f"{EX}dt"),
+    )
+
+
+def test_files(tmp_path):
+    """Test parsing and serialising files and quads."""
+    from tripper import Literal
+    from tripper.ntriples import parse, serialize
+
+    path = tmp_path / "data.nt"
+    path.write_text(DATA, encoding="utf-8")
+    triples = list(parse(path))
+    assert list(parse(path, use_mmap=True)) == triples
+    with open(path, "rt", encoding="utf-8") as f:
+        assert list(parse(f)) == triples
+
+    serialize(triples, tmp_path / "out.nt")
+    assert list(parse(tmp_path / "out.nt")) == triples
+
+    quads = [
+        (f"{EX}s", f"{EX}p", Literal("a"), f"{EX}g"),
+        (f"{EX}s", f"{EX}p", "_:o", None),
+    ]
+    data = serialize(quads, format="nquads")
+    assert data == (
+        f'<{EX}s> <{EX}p> "a" <{EX}g> .\n' f"<{EX}s> <{EX}p> _:o .\n"
+    )
+    assert list(parse(data=data, format="nquads")) == quads
+
+
+def test_triplestore_fallback(tmp_path):
+    """Test that Triplestore.parse() and serialize() use this module for
+    backends that don't implement parse and serialize."""
+    from tripper import Triplestore
+    from tripper.ntriples import parse
+
+    ts = Triplestore("memory")
+    assert "parse" not in ts.capabilities
+    ts.parse(data=DATA, format="ntriples")
+    triples = set(ts.triples())
+    expected = set(parse(data=DATA))
+    assert len(triples) == len(expected)
+    assert {t for t in triples if not t[0].startswith("_:")} == {
+        t for t in expected if not t[0].startswith("_:")
+    }
+
+    # Blank nodes from separate documents are not merged
+    ts.parse(data=DATA, format="ntriples")
+    assert len(set(ts.triples())) == len(triples) + 2
+
+    path = tmp_path / "data.nt"
+    ts.serialize(path, format="ntriples")
+    assert set(parse(path)) == set(ts.triples())
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
 
 
 # @pytest.mark.parametrize("backend", ["rdflib", "ontopy", "collection"])
-@pytest.mark.parametrize("backend", ["rdflib", "collection"])
+@pytest.mark.parametrize("backend", ["rdflib", "collection", "memory"])
 def test_triplestore(  # pylint: disable=too-many-locals
     backend: str,
     example_function: "Callable[[Any, Any], Any]",
@@ -113,6 +113,7 @@ def test_triplestore(  # pylint: disable=too-many-locals
     # Test the `prefer_sparql` property
     facit = {
         "collection": False,
+        "memory": False,
         "ontopy": False,
         "rdflib": False,
         "sparqlwrapper": True,
@@ -623,3 +624,232 @@ def test_value():
         default="a",
     )
     assert t == "a"
+
+
+def test_capabilities(monkeypatch):
+    """Test that backend capabilities are resolved once."""
+    pytest.importorskip("rdflib")
+    from tripper import Triplestore
+
+    ts = Triplestore(backend="rdflib")
+    assert ts.backend_class.__name__ == "RdflibStrategy"
+    assert {"parse", "serialize", "query", "update"}.issubset(ts.capabilities)
+    assert "create_database" not in ts.capabilities
+
+    ts2 = Triplestore(backend="memory")
+    assert ts2.capabilities == {"count", "triples_many"}
+
+    # Neither backend lookup nor capability checks should search for
+    # backends after the triplestore has been created
+    def fail(*args, **kwargs):
+        raise AssertionError("backend lookup should be cached")
+
+    monkeypatch.setattr(Triplestore, "_load_backend", fail)
+    ts.query("SELECT ?s WHERE { ?s ?p ?o }")
+    ts.update("INSERT DATA { <http://ex#a> <http://ex#b> <http://ex#c> }")
+    assert ts.serialize(format="ntriples")
+    assert Triplestore(backend="rdflib").backend_class is ts.backend_class
+    with pytest.raises(NotImplementedError):
+        ts2.query("SELECT ?s WHERE { ?s ?p ?o }")
+
+
+def test_batch():  # pylint: disable=too-many-statements
+    """Test buffering of write operations with Triplestore.batch()."""
+    from tripper import RDF, RDFS, Literal, Triplestore
+
+    ts = Triplestore(backend="memory")
+    EX = ts.bind("ex", "http://example.com#")
+
+    calls = []
+    add_triples = ts.backend.add_triples
+    remove = ts.backend.remove
+
+    def add_triples_spy(triples):
+        calls.append(("add", len(triples)))
+        add_triples(triples)
+
+    def remove_spy(triple):
+        calls.append(("remove", triple))
+        remove(triple)
+
+    ts.backend.add_triples = add_triples_spy
+    ts.backend.remove = remove_spy
+
+    with ts.batch():
+        ts.add((EX.Cat, RDFS.subClassOf, EX.Animal))
+        ts.add((EX.Dog, RDFS.subClassOf, EX.Animal))
+        ts.add_triples([(EX.fido, RDF.type, EX.Dog)])
+        ts.set((EX.fido, RDFS.label, Literal("Fido")))
+        ts.add((EX.felix, RDF.type, EX.Cat))
+        assert not calls
+    assert calls == [
+        ("add", 3),
+        ("remove", (EX.fido, RDFS.label, None)),
+        ("add", 2),
+    ]
+    assert len(ts.backend) == 5
+
+    # Reads flush the buffer
+    calls.clear()
+    with ts.batch():
+        ts.remove(EX.felix)
+        assert not ts.has(EX.felix)
+        assert calls == [("remove", (EX.felix, None, None))]
+        ts.add((EX.felix, RDF.type, EX.Cat))
+    assert ts.has(EX.felix)
+
+    # Buffer is flushed when full
+    calls.clear()
+    with ts.batch(max_triples=3):
+        with ts.batch():  # nested batch
+            ts.add_triples((EX[f"a{i}"], RDF.type, EX.A) for i in range(4))
+            ts.add((EX.b, RDF.type, EX.B))
+        assert calls == [("add", 4)]
+    assert calls == [("add", 4), ("add", 1)]
+
+    # The buffer is thread-local, so reads in other threads neither see
+    # nor flush it
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with ts.batch():
+            ts.add((EX.d, RDF.type, EX.D))
+            assert not executor.submit(ts.has, EX.d).result()
+            assert executor.submit(ts.has, EX.b).result()
+            assert ts._batch.operations  # pylint: disable=protected-access
+        assert executor.submit(ts.has, EX.d).result()
+
+    # Buffered operations are flushed also if an exception is raised
+    with pytest.raises(ValueError):
+        with ts.batch():
+            ts.add((EX.c, RDF.type, EX.C))
+            raise ValueError()
+    assert ts.has(EX.c)
+
+    # Consecutive removals of triples are collected
+    calls.clear()
+    ts.capabilities = ts.capabilities | {"remove_triples"}
+    ts.backend.remove_triples = lambda triples: calls.append(
+        ("remove_triples", list(triples))
+    )
+    with ts.batch():
+        ts.remove(EX.a0, RDF.type, EX.A)
+        ts.remove_triples([(EX.a1, RDF.type, EX.A), (EX.a2, RDF.type, EX.A)])
+        ts.remove(EX.b)
+    assert calls == [
+        (
+            "remove_triples",
+            [(EX[f"a{i}"], RDF.type, EX.A) for i in range(3)],
+        ),
+        ("remove", (EX.b, None, None)),
+    ]
+
+
+@pytest.mark.parametrize("backend", ["memory", "rdflib"])
+def test_triples_many(backend):
+    """Test looking up several triple patterns with one call."""
+    if backend == "rdflib":
+        pytest.importorskip("rdflib")
+    from tripper import OWL, RDF, RDFS, Literal, Triplestore
+
+    ts = Triplestore(backend=backend)
+    EX = ts.bind("ex", "http://example.com#")
+    triples = [
+        (EX.Animal, RDFS.subClassOf, OWL.Thing),
+        (EX.Dog, RDFS.subClassOf, EX.Animal),
+        (EX.Dog, RDFS.label, Literal("Dog", lang="en")),
+        (EX.fido, RDF.type, EX.Dog),
+    ]
+    ts.add_triples(triples)
+
+    patterns = [
+        (EX.Dog, None, None),
+        (None, RDFS.subClassOf, None),
+        (None, None, Literal("Dog", lang="en")),
+        (EX.Cat, None, None),
+        (None, RDF.type, EX.Dog),
+    ]
+    result = ts.triples_many(patterns)
+    assert [set(r) for r in result] == [
+        set(ts.triples(*pattern)) for pattern in patterns
+    ]
+    assert set(result[0]) == set(triples[1:3])
+    assert result[3] == []
+    assert ts.triples_many([]) == []
+
+    # Pending batched writes are flushed before lookup
+    with ts.batch():
+        ts.add((EX.Cat, RDFS.subClassOf, EX.Animal))
+        assert ts.triples_many([(EX.Cat, None, None)]) == [
+            [(EX.Cat, RDFS.subClassOf, EX.Animal)]
+        ]
+
+    # Fallback for backends that don't implement triples_many()
+    ts.capabilities = ts.capabilities - {"triples_many"}
+    assert [set(r) for r in ts.triples_many(patterns)] == [
+        set(ts.triples(*pattern)) for pattern in patterns
+    ]
+
+
+@pytest.mark.parametrize("backend", ["memory", "rdflib"])
+def test_count(backend):
+    """Test count() and that has() and value() use the ask() and first()
+    backend hooks when available."""
+    if backend == "rdflib":
+        pytest.importorskip("rdflib")
+    from tripper import RDF, RDFS, Literal, Triplestore
+    from tripper.errors import UniquenessError
+
+    ts = Triplestore(backend=backend)
+    EX = ts.bind("ex", "http://example.com#")
+    ts.add_triples(
+        [
+            (EX.Dog, RDFS.subClassOf, EX.Animal),
+            (EX.Cat, RDFS.subClassOf, EX.Animal),
+            (EX.Dog, RDFS.label, Literal("Dog", lang="en")),
+            (EX.fido, RDF.type, EX.Dog),
+        ]
+    )
+    assert ts.count() == 4
+    assert ts.count(EX.Dog) == 2
+    assert ts.count(predicate=RDFS.subClassOf) == 2
+    assert ts.count(EX.Dog, RDFS.subClassOf) == 1
+    assert ts.count(predicate=RDFS.subClassOf, object=EX.Animal) == 2
+    assert ts.count(EX.fido, object=EX.Dog) == 1
+    assert ts.count(object=Literal("Dog", lang="en")) == 1
+    assert ts.count(EX.Dog, RDFS.subClassOf, EX.Animal) == 1
+    assert ts.count(EX.Cow) == 0
+    with ts.batch():
+        ts.add((EX.Cow, RDFS.subClassOf, EX.Animal))
+        assert ts.count(object=EX.Animal) == 3
+
+    # Emulate a backend implementing the ask() and first() hooks
+    from itertools import islice
+
+    calls = []
+
+    def ask(triple):
+        calls.append(("ask", triple))
+        return any(True for _ in ts.backend.triples(triple))
+
+    def first(triple, limit=1):
+        calls.append(("first", limit))
+        return list(islice(ts.backend.triples(triple), limit))
+
+    ts.backend.ask = ask
+    ts.backend.first = first
+    ts.capabilities = ts.capabilities | {"ask", "first"}
+
+    assert ts.has(EX.Dog, RDFS.subClassOf)
+    assert not ts.has(EX.Dog, RDF.type)
+    assert calls == [
+        ("ask", (EX.Dog, RDFS.subClassOf, None)),
+        ("ask", (EX.Dog, RDF.type, None)),
+    ]
+    calls.clear()
+    assert ts.value(EX.Dog, RDFS.subClassOf) == EX.Animal
+    assert ts.value(predicate=RDFS.subClassOf, object=EX.Animal, any=True)
+    with pytest.raises(UniquenessError):
+        ts.value(predicate=RDFS.subClassOf, object=EX.Animal)
+    assert ts.value(EX.Cow, RDF.type, default="x") == "x"
+    assert calls == [("first", 2), ("first", 1), ("first", 2), ("first", 2)]
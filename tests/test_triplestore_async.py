@@ -0,0 +1,165 @@
+"""Test the asyncio frontend to the triplestore."""
+
+# pylint: disable=duplicate-code,invalid-name,too-many-locals
+
+
+def test_async_fallback():
+    """Test AsyncTriplestore with a backend without asynchronous
+    methods."""
+    import asyncio
+
+    import pytest
+
+    from tripper import RDFS, AsyncTriplestore, Triplestore
+
+    ts = Triplestore("memory")
+    EX = ts.bind("ex", "http://example.com#")
+    triples = [(EX[f"C{i}"], RDFS.subClassOf, EX.Base) for i in range(5)]
+
+    async def main():
+        async with AsyncTriplestore(ts) as ats:
+            assert not ats.triplestore.capabilities & {"aquery", "atriples"}
+            await ats.add_triples(triples)
+            await ats.add((EX.Base, RDFS.subClassOf, EX.Root))
+            results = await asyncio.gather(
+                *[ats.triples(subject=EX[f"C{i}"]) for i in range(5)],
+                ats.triples(object=EX.Root),
+            )
+            await ats.remove(predicate=RDFS.subClassOf, object=EX.Root)
+            remaining = await ats.triples()
+            with pytest.raises(NotImplementedError):
+                await ats.query("SELECT * WHERE { ?s ?p ?o }")
+            return results, remaining
+
+    results, remaining = asyncio.run(main())
+    assert results == [[t] for t in triples] + [
+        [(EX.Base, RDFS.subClassOf, EX.Root)]
+    ]
+    assert set(remaining) == set(triples)
+    assert ts.closed
+
+
+def test_async_sparqlwrapper(sparql_endpoint):
+    """Test AsyncTriplestore with the asyncio HTTP client of the
+    SPARQLWrapper backend against a local endpoint."""
+    import asyncio
+
+    import pytest
+
+    pytest.importorskip("SPARQLWrapper")
+    from SPARQLWrapper.SPARQLExceptions import QueryBadFormed
+
+    from tripper import RDFS, AsyncTriplestore, Literal
+
+    url = sparql_endpoint.url
+    ats = AsyncTriplestore(
+        "sparqlwrapper",
+        base_iri=url,
+        update_iri=url,
+        page_size=3,
+        update_chunk_size=2,
+        update_workers=2,
+    )
+    assert "aquery" in ats.triplestore.capabilities
+    EX = ats.bind("ex", "http://example.com#")
+    triples = [(EX[f"C{i}"], RDFS.subClassOf, EX.Base) for i in range(10)]
+    triples.append((EX.Base, RDFS.label, Literal("Base å", lang="en")))
+
+    async def main():
+        await ats.add_triples(triples)
+        assert len(sparql_endpoint.requests) == 6
+
+        del sparql_endpoint.requests[:]
+        results = await asyncio.gather(
+            ats.triples(predicate=RDFS.subClassOf),
+            ats.triples(*triples[-1]),
+            ats.triples(EX.C1, RDFS.subClassOf, EX.C2),
+            ats.query(
+                "SELECT ?s WHERE { ?s $p $o }",
+                iris={"p": RDFS.label},
+                literals={"o": Literal("Base å", lang="en")},
+            ),
+            ats.query(f"ASK {{ <{EX.C3}> ?p ?o }}"),
+            ats.query(f"CONSTRUCT WHERE {{ <{EX.Base}> ?p ?o }}"),
+        )
+        assert len(sparql_endpoint.requests) == 4 + 1 + 1 + 1 + 1 + 1
+
+        with pytest.raises(QueryBadFormed):
+            await ats.query("SELECT ?s WHERE { ?s ?p }")
+
+        await ats.remove(predicate=RDFS.label)
+        await ats.update(
+            "DELETE DATA { $s $p $o }",
+            iris={"s": EX.C0, "p": RDFS.subClassOf, "o": EX.Base},
+        )
+        remaining = await ats.triples()
+        await ats.close()
+        return results, remaining
+
+    results, remaining = asyncio.run(main())
+    subclasses, label, none, select, ask, construct = results
+    assert set(subclasses) == set(triples[:10])
+    assert label == [triples[-1]]
+    assert none == []
+    assert select == [(EX.Base,)]
+    assert ask is True
+    assert construct == [triples[-1]]
+    assert set(remaining) == set(triples[1:10])
+
+    # The asynchronous backend methods decode TSV results as well
+    ats = AsyncTriplestore("sparqlwrapper", base_iri=url, select_format="tsv")
+    result = asyncio.run(ats.query("SELECT ?s ?o WHERE { ?s ?p ?o }"))
+    assert set(result) == {(s, o) for s, _, o in triples[1:10]}
+
+
+def test_async_sparqlwrapper_graphs():
+    """Test named graphs and keep-alive connections with the asyncio HTTP
+    client of the SPARQLWrapper backend."""
+    import asyncio
+    import warnings
+
+    import pytest
+
+    pytest.importorskip("SPARQLWrapper")
+    rdflib = pytest.importorskip("rdflib")
+    from sparql_endpoint import SparqlEndpoint
+
+    from tripper import RDFS, AsyncTriplestore
+
+    # rdflib.Dataset fails on INSERT DATA into the default graph
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        graph = rdflib.ConjunctiveGraph()
+
+    with SparqlEndpoint(graph) as endpoint:
+        ats = AsyncTriplestore(
+            "sparqlwrapper",
+            base_iri=endpoint.url,
+            update_iri=endpoint.url,
+            update_chunk_size=1,
+            update_workers=2,
+        )
+        EX = ats.bind("ex", "http://example.com#")
+        pets = [(EX[f"Pet{i}"], RDFS.subClassOf, EX.Animal) for i in range(6)]
+
+        async def main():
+            await ats.add((EX.Animal, RDFS.subClassOf, EX.Thing))
+            await ats.add_triples(pets, graph=EX.pets)
+            # At most `update_workers` connections, which are reused
+            assert endpoint.connections <= 2
+            in_pets = await ats.triples(graph=EX.pets)
+            has_pet = await ats.triples(*pets[0], graph=EX.pets)
+            has_animal = await ats.triples(
+                EX.Animal, RDFS.subClassOf, EX.Thing, graph=EX.pets
+            )
+            await ats.remove(subject=EX.Pet0, graph=EX.pets)
+            remaining = await ats.triples(graph=EX.pets)
+            await ats.close()
+            return in_pets, has_pet, has_animal, remaining
+
+        in_pets, has_pet, has_animal, remaining = asyncio.run(main())
+        assert set(in_pets) == set(pets)
+        assert has_pet == [pets[0]]
+        assert has_animal == []
+        assert set(remaining) == set(pets[1:])
+        assert len(endpoint.requests) > endpoint.connections
@@ -0,0 +1,143 @@
+"""Test querying several triplestores as one."""
+
+# pylint: disable=invalid-name
+
+import pytest
+
+
+def test_federated_triples():
+    """Test triples(), has() and error handling."""
+    from tripper import RDF, RDFS, FederatedTriplestore, Triplestore
+
+    ts1 = Triplestore("memory")
+    ts2 = Triplestore("memory")
+    EX = ts1.bind("ex", "http://example.com#")
+    ts1.add_triples(
+        [
+            (EX.Cat, RDFS.subClassOf, EX.Animal),
+            (EX.felix, RDF.type, EX.Cat),
+        ]
+    )
+    ts2.add_triples(
+        [
+            (EX.Cat, RDFS.subClassOf, EX.Animal),
+            (EX.Dog, RDFS.subClassOf, EX.Animal),
+        ]
+    )
+
+    fts = FederatedTriplestore([ts1, ts2])
+    assert fts.namespaces["ex"] == EX
+    assert fts.expand_iri("ex:Cat") == EX.Cat
+
+    triples = list(fts.triples(predicate=RDFS.subClassOf))
+    assert len(triples) == 2
+    assert set(triples) == {
+        (EX.Cat, RDFS.subClassOf, EX.Animal),
+        (EX.Dog, RDFS.subClassOf, EX.Animal),
+    }
+    assert set(fts.subjects(RDFS.subClassOf, EX.Animal)) == {EX.Cat, EX.Dog}
+    assert list(fts.objects(EX.felix, RDF.type)) == [EX.Cat]
+    assert fts.has(EX.felix)
+    assert fts.has(EX.Dog)
+    assert not fts.has(EX.fido)
+
+    # Stopping early is allowed
+    assert next(fts.triples()) in set(ts1.triples()) | set(ts2.triples())
+
+    # At most `queue_size` results are buffered, and members do not block
+    # after the consumer has stopped
+    produced = []
+
+    def many(triple):  # pylint: disable=unused-argument
+        for i in range(1000):
+            produced.append(i)
+            yield (EX[f"c{i}"], RDF.type, EX.Cat)
+
+    ts3 = Triplestore("memory")
+    ts3.backend.triples = many
+    fts3 = FederatedTriplestore([ts3], queue_size=2)
+    results = fts3.triples()
+    next(results)
+    assert len(produced) <= 4
+    results.close()
+    fts3.close()  # waits for the member to stop
+    assert len(produced) <= 5
+
+    # Errors in a member are raised by the consumer
+    def fail(triple):
+        raise RuntimeError(f"cannot look up {triple}")
+
+    ts2.backend.triples = fail
+    with pytest.raises(RuntimeError):
+        list(fts.triples())
+
+    # Members passed by the caller are not closed
+    fts.close()
+    assert not ts1.closed and not ts2.closed
+
+
+def test_federated_query():
+    """Test query() and datadoc.search()."""
+    pytest.importorskip("rdflib")
+    from tripper import DCAT, RDF, RDFS, FederatedTriplestore, Triplestore
+
+    ts1 = Triplestore("rdflib")
+    ts2 = Triplestore("rdflib")
+    with FederatedTriplestore([ts1, ts2]) as fts:
+        EX = fts.bind("ex", "http://example.com#")
+        assert ts1.namespaces["ex"] == ts2.namespaces["ex"] == EX
+        ts1.add_triples(
+            [
+                (EX.Cat, RDFS.subClassOf, EX.Animal),
+                (EX.data1, RDF.type, DCAT.Dataset),
+            ]
+        )
+        ts2.add_triples(
+            [
+                (EX.Cat, RDFS.subClassOf, EX.Animal),
+                (EX.Dog, RDFS.subClassOf, EX.Animal),
+                (EX.data2, RDF.type, DCAT.Dataset),
+            ]
+        )
+
+        select = "SELECT ?s WHERE { ?s rdfs:subClassOf $cls }"
+        rows = fts.query(select, iris={"cls": "ex:Animal"})
+        assert sorted(rows) == [(EX.Cat,), (EX.Cat,), (EX.Dog,)]
+        assert sorted(fts.query_iter(select, iris={"cls": EX.Animal})) == [
+            (EX.Cat,),
+            (EX.Cat,),
+            (EX.Dog,),
+        ]
+        distinct = (
+            "PREFIX sel: <http://example.com/select#>  # SELECT\n"
+            "select distinct ?s WHERE { ?s rdfs:subClassOf ex:Animal }"
+        )
+        assert sorted(fts.query(distinct)) == [(EX.Cat,), (EX.Dog,)]
+        assert sorted(fts.query_iter(distinct)) == [(EX.Cat,), (EX.Dog,)]
+        assert fts.query("ASK { ex:Dog ?p ?o }") is True
+        assert fts.query("ASK { ex:Cow ?p ?o }") is False
+        construct = fts.query("CONSTRUCT WHERE { ?s rdfs:subClassOf ?o }")
+        assert len(construct) == 2
+
+        pytest.importorskip("pyld")
+        pytest.importorskip("yaml")
+        from tripper.datadoc import search
+
+        assert set(search(fts, type=DCAT.Dataset)) == {EX.data1, EX.data2}
+
+
+def test_federated_from_session(tmp_path):
+    """Test that close() closes the members created from a session."""
+    pytest.importorskip("rdflib")
+    pytest.importorskip("yaml")
+    from tripper import FederatedTriplestore, Session
+
+    config = tmp_path / "session.yaml"
+    config.write_text(
+        "Store1:\n  backend: rdflib\nStore2:\n  backend: rdflib\n",
+        encoding="utf-8",
+    )
+    fts = FederatedTriplestore.from_session(Session(config=config))
+    assert len(fts.triplestores) == 2
+    fts.close()
+    assert all(ts.closed for ts in fts.triplestores)
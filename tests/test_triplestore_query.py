@@ -0,0 +1,283 @@
+"""Test querying the triplestore with the query cache, prepared
+queries, cursors and single-flight."""
+
+# pylint: disable=invalid-name
+
+import pytest
+
+
+def test_query_cache():
+    """Test the query result cache."""
+    pytest.importorskip("rdflib")
+    from tripper import RDF, RDFS, Triplestore
+
+    ts = Triplestore(backend="rdflib", query_cache_size=2)
+    EX = ts.bind("ex", "http://example.com#")
+    ts.add_triples(
+        [
+            (EX.Cat, RDFS.subClassOf, EX.Animal),
+            (EX.Dog, RDFS.subClassOf, EX.Animal),
+        ]
+    )
+
+    queries = []
+    query = ts.backend.query
+
+    def query_spy(query_object, **kwargs):
+        queries.append(query_object)
+        return query(query_object, **kwargs)
+
+    ts.backend.query = query_spy
+
+    select = "SELECT ?s WHERE { ?s rdfs:subClassOf $cls }"
+    rows = ts.query(select, iris={"cls": "ex:Animal"})
+    assert sorted(rows) == [(EX.Cat,), (EX.Dog,)]
+    rows.clear()  # modifying the result must not affect the cache
+    rows = ts.query(select, iris={"cls": EX.Animal})
+    assert sorted(rows) == [(EX.Cat,), (EX.Dog,)]
+    assert len(queries) == 1
+
+    # Test CONSTRUCT and ASK
+    construct = "CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }"
+    assert len(list(ts.query(construct))) == 2
+    assert len(list(ts.query(construct))) == 2
+    assert len(queries) == 2
+    ask = "ASK { ?s ?p ?o }"
+    assert ts.query(ask) is True
+    assert ts.query(ask) is True
+    assert len(queries) == 3
+
+    # The least recently used query is evicted
+    ts.query(select, iris={"cls": EX.Animal})
+    assert len(queries) == 4
+
+    # Writes invalidate the cache
+    generation = ts.generation
+    ts.add((EX.fido, RDF.type, EX.Dog))
+    assert ts.generation > generation
+    assert len(list(ts.query(construct))) == 3
+    assert len(queries) == 5
+    ts.remove(EX.fido)
+    assert len(list(ts.query(construct))) == 2
+    ts.update("DELETE WHERE { ?s ?p ex:Animal }")
+    assert ts.query(ask) is False
+    assert len(queries) == 7
+
+    ts.clear_query_cache()
+    assert ts.query(ask) is False
+    assert len(queries) == 8
+
+
+def test_query_cache_threads():
+    """Test the query cache when queried from several threads."""
+    pytest.importorskip("rdflib")
+    from concurrent.futures import ThreadPoolExecutor
+
+    from tripper import RDFS, Triplestore
+
+    ts = Triplestore(backend="rdflib", query_cache_size=2)
+    EX = ts.bind("ex", "http://example.com#")
+    ts.add_triples(
+        [(EX[f"C{i}"], RDFS.subClassOf, EX[f"B{i % 5}"]) for i in range(20)]
+    )
+
+    def worker(n):
+        for i in range(50):
+            j = (n + i) % 5
+            rows = ts.query(
+                "SELECT ?s WHERE { ?s rdfs:subClassOf $base }",
+                iris={"base": EX[f"B{j}"]},
+            )
+            assert len(rows) == 4
+        return n
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert sorted(executor.map(worker, range(8))) == list(range(8))
+    assert len(ts._query_cache) <= 2  # pylint: disable=protected-access
+
+
+def test_prepare():
+    """Test prepared queries."""
+    pytest.importorskip("rdflib")
+    from tripper import RDF, RDFS, Literal, Triplestore
+
+    ts = Triplestore(backend="rdflib")
+    EX = ts.bind("ex", "http://example.com#")
+    ts.add_triples(
+        [
+            (EX.Cat, RDFS.subClassOf, EX.Animal),
+            (EX.Dog, RDFS.subClassOf, EX.Animal),
+            (EX.fido, RDF.type, EX.Dog),
+            (EX.fido, RDFS.label, Literal("Fido")),
+        ]
+    )
+    query = "SELECT ?s WHERE { ?s $pred ${obj} . FILTER(?s != $$x) }"
+
+    # Compiled by the backend
+    q = ts.prepare(query)
+    assert q.variables == {"pred", "obj"}
+    assert q.substitute(iris={"pred": "rdf:type", "obj": EX.Dog}) == (
+        f"SELECT ?s WHERE {{ ?s <{RDF.type}> <{EX.Dog}> . "
+        "FILTER(?s != $x) }"
+    )
+    assert sorted(
+        q(iris={"pred": RDFS.subClassOf, "obj": "ex:Animal"})
+    ) == sorted(
+        ts.query(query, iris={"pred": RDFS.subClassOf, "obj": EX.Animal})
+    )
+    assert q(iris={"pred": RDF.type, "obj": "ex:Dog"}) == []
+
+    q2 = ts.prepare("SELECT ?s WHERE { ?s $pred $label }")
+    assert q2(iris={"pred": RDFS.label}, literals={"label": "Fido"}) == [
+        (EX.fido,)
+    ]
+    q3 = ts.prepare("ASK { $s rdfs:subClassOf ex:Animal }")
+    assert q3(iris={"s": EX.Cat}) is True
+    assert q3(iris={"s": EX.fido}) is False
+
+    # Parameters are neither projected by `SELECT *` nor collide with
+    # query variables of the same name
+    for select in (
+        "SELECT * WHERE { ?s rdfs:label $label }",
+        "SELECT * WHERE { ?s rdfs:label ?label . FILTER(?label = $label) }",
+    ):
+        assert ts.prepare(select)(literals={"label": "Fido"}) == ts.query(
+            select, literals={"label": "Fido"}
+        )
+
+    # Prepared queries use the query cache
+    ts2 = Triplestore(backend="rdflib", query_cache_size=4)
+    ts2.add_triples(ts.triples())
+    calls = []
+    query = ts2.backend.query
+
+    def query_spy(query_object, **kwargs):
+        calls.append(query_object)
+        return query(query_object, **kwargs)
+
+    ts2.backend.query = query_spy
+    q5 = ts2.prepare("SELECT ?s WHERE { ?s rdfs:subClassOf $cls }")
+    for _ in range(3):
+        assert sorted(q5(iris={"cls": EX.Animal})) == [(EX.Cat,), (EX.Dog,)]
+    assert len(calls) == 1
+    q5(iris={"cls": EX.Dog})
+    assert len(calls) == 2
+
+    # Without cache and single-flight, compiled queries are evaluated
+    # without substituting the variables into the query string
+    def substitute_spy(*args, **kwargs):
+        raise AssertionError("substitute() should not be called")
+
+    q.substitute = substitute_spy
+    assert q(iris={"pred": RDF.type, "obj": "ex:Dog"}) == []
+
+    # Fallback for backends that cannot compile queries
+    ts.capabilities = ts.capabilities - {"prepare"}
+    q4 = ts.prepare("SELECT ?s WHERE { ?s $pred $label }")
+    assert q4(iris={"pred": RDFS.label}, literals={"label": "Fido"}) == [
+        (EX.fido,)
+    ]
+
+    with pytest.raises(NotImplementedError):
+        Triplestore(backend="memory").prepare("ASK { ?s ?p ?o }")
+
+
+def test_query_iter():
+    """Test streaming query results with Triplestore.query_iter()."""
+    pytest.importorskip("rdflib")
+    from tripper import RDFS, Triplestore
+    from tripper.errors import ArgumentValueError
+
+    ts = Triplestore(backend="rdflib")
+    EX = ts.bind("ex", "http://example.com#")
+    ts.add_triples(
+        [(EX[f"C{i}"], RDFS.subClassOf, EX.Base) for i in range(10)]
+    )
+    query = "SELECT ?s WHERE { ?s rdfs:subClassOf $base }"
+
+    cursor = ts.query_iter(query, iris={"base": "ex:Base"})
+    assert cursor.fetchone() in [(EX[f"C{i}"],) for i in range(10)]
+    assert len(cursor.fetchmany(4)) == 4
+    assert cursor.rowcount == 5
+    cursor.close()
+    assert cursor.closed
+    assert cursor.fetchone() is None
+    assert not cursor.fetchall()
+
+    with ts.query_iter(query, iris={"base": EX.Base}) as cursor:
+        rows = cursor.fetchall()
+    assert sorted(rows) == sorted(ts.query(query, iris={"base": EX.Base}))
+
+    construct = "CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }"
+    assert set(ts.query_iter(construct)) == set(ts.triples())
+
+    with pytest.raises(ArgumentValueError):
+        ts.query_iter("ASK { ?s ?p ?o }")
+
+    # Fallback for backends that don't implement query_iter()
+    ts.capabilities = ts.capabilities - {"query_iter"}
+    with ts.query_iter(query, iris={"base": EX.Base}) as cursor:
+        assert sorted(cursor) == sorted(rows)
+    with pytest.raises(ArgumentValueError):
+        ts.query_iter("ASK { ?s ?p ?o }")
+
+
+def test_single_flight():
+    """Test that identical concurrent calls share one backend call."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from tripper import RDFS, Triplestore
+
+    ts = Triplestore(backend="memory", single_flight=True)
+    EX = ts.bind("ex", "http://example.com#")
+    triples = [(EX[f"C{i}"], RDFS.subClassOf, EX.Base) for i in range(3)]
+    ts.add_triples(triples)
+
+    calls = []
+    backend_triples = ts.backend.triples
+    barrier = threading.Barrier(5)
+
+    def triples_spy(triple):
+        calls.append(triple)
+        time.sleep(0.2)  # let the other threads join the flight
+        if triple[0] == EX.Fail:
+            raise RuntimeError("backend failure")
+        return backend_triples(triple)
+
+    ts.backend.triples = triples_spy
+
+    def lookup(subject=None):
+        barrier.wait()
+        return set(ts.triples(subject=subject))
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(lookup, [None] * 5))
+    assert results == [set(triples)] * 5
+    assert len(calls) == 1
+
+    # Different calls are not shared
+    calls.clear()
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        subjects = [None, EX.C1, None, EX.C1, EX.C2]
+        results = list(executor.map(lookup, subjects))
+    assert results[1] == {triples[1]}
+    assert len(calls) == 3
+
+    # Exceptions are raised in all callers
+    calls.clear()
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(lookup, EX.Fail) for _ in range(5)]
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result()
+    assert len(calls) == 1
+    assert not ts._flights  # pylint: disable=protected-access
+
+    # Sequential calls are not shared
+    calls.clear()
+    barrier = threading.Barrier(1)
+    assert lookup(EX.C0) == {triples[0]}
+    assert lookup(EX.C0) == {triples[0]}
+    assert len(calls) == 2
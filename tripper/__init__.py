@@ -41,7 +41,9 @@ from .namespace import (
 )
 from .session import Session
 from .triplestore import Triplestore, backend_packages
+from .triplestore_async import AsyncTriplestore
 from .triplestore_extend import Tripper
+from .triplestore_federated import FederatedTriplestore
 
 __version__ = "0.5.3"
 
@@ -90,6 +92,8 @@ __all__ = (
     "XML",  # XML namespace
     "XSD",  # XML Schema Datatypes
     # Classes
+    "AsyncTriplestore",
+    "FederatedTriplestore",
     "Literal",
     "Namespace",
     "Session",
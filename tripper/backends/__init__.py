@@ -4,6 +4,7 @@ from importlib import import_module
 
 # A dict mapping backend names to a list of dependencies
 backend_dependencies = {
+    "memory": [],
     "rdflib": ["rdflib"],
     "ontopy": ["EMMOntoPy"],
 }
@@ -0,0 +1,233 @@
+"""Native in-memory backend with no dependencies outside the standard
+library.
+
+Triples are stored in three hash indexes (SPO, POS and OSP), such that
+any combination of bound subject, predicate and object can be answered
+with a direct index lookup.
+
+All terms are interned, i.e. each distinct IRI, blank node or literal is
+stored once and assigned an integer id.  The indexes only refer to these
+ids.  Terms are returned as the same tripper `str` and `Literal` objects
+as they were added with, without any conversion.
+
+For developers: The usage of `s`, `p`, and `o` represent the different parts of
+an RDF Triple: subject, predicate, and object.
+"""
+
+import warnings
+from typing import TYPE_CHECKING
+
+from tripper.errors import UnusedArgumentWarning
+from tripper.literal import Literal
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+    from typing import Dict, Generator, Hashable, List, Optional, Set, Union
+
+    from tripper.triplestore import Triple
+    from tripper.utils import OptionalTriple
+
+    Index = Dict[int, Dict[int, Set[int]]]
+
+
+def termkey(term: "Union[str, Literal]") -> "Hashable":
+    """Return a hashable key that uniquely identifies `term`.
+
+    IRIs and blank nodes are identified by their string value, while
+    literals are identified by their value, language tag and datatype.
+    This avoids mixing up an IRI with a literal with the same string
+    value.
+    """
+    if isinstance(term, Literal):
+        return (str(term), term.lang, term.datatype)
+    return str(term)
+
+
+class MemoryStrategy:
+    """Triplestore strategy for a native indexed in-memory store.
+
+    Arguments:
+        base_iri: Unused by the memory backend.  The `base_iri` argument is
+            still used for encapsulating the Triplestore class.
+        database: Unused - the memory backend does not support multiple
+            databases.
+    """
+
+    prefer_sparql = False
+
+    def __init__(
+        self,
+        base_iri: "Optional[str]" = None,  # pylint: disable=unused-argument
+        database: "Optional[str]" = None,
+    ) -> None:
+        if database:
+            warnings.warn("database", UnusedArgumentWarning, stacklevel=3)
+
+        # Interned terms
+        self._ids: "Dict[Hashable, int]" = {}  # term key -> id
+        self._terms: "List[Union[str, Literal]]" = []  # id -> term
+
+        # Indexes mapping term ids in the given order
+        self._spo: "Index" = {}
+        self._pos: "Index" = {}
+        self._osp: "Index" = {}
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def triples(self, triple: "Triple") -> "Generator[Triple, None, None]":
+        """Returns a generator over matching triples."""
+        ids = self._lookup(triple)
+        if ids is None:
+            return iter(())  # type: ignore
+        terms = self._terms
+        return (
+            (terms[s], terms[p], terms[o]) for s, p, o in self._match(*ids)
+        )
+
+    def triples_many(
+        self, patterns: "Iterable[OptionalTriple]"
+    ) -> "List[List[Triple]]":
+        """Returns a list with a list of matching triples for each
+        pattern."""
+        terms = self._terms
+        result = []
+        for pattern in patterns:
+            ids = self._lookup(pattern)
+            result.append(
+                []
+                if ids is None
+                else [
+                    (terms[s], terms[p], terms[o])
+                    for s, p, o in self._match(*ids)
+                ]
+            )
+        return result
+
+    def count(self, triple: "OptionalTriple") -> int:
+        """Returns the number of matching triples."""
+        ids = self._lookup(triple)
+        if ids is None:
+            return 0
+        s, p, o = ids
+        if s is None and p is None and o is None:
+            return self._len
+        if o is None and s is not None and p is not None:
+            return len(self._spo.get(s, {}).get(p, ()))
+        if s is None and p is not None and o is not None:
+            return len(self._pos.get(p, {}).get(o, ()))
+        if p is None and s is not None and o is not None:
+            return len(self._osp.get(o, {}).get(s, ()))
+        return sum(1 for _ in self._match(s, p, o))
+
+    def add_triples(self, triples: "Iterable[Triple]"):
+        """Add a sequence of triples."""
+        intern = self._intern
+        for s, p, o in triples:
+            si, pi, oi = intern(s), intern(p), intern(o)
+            objects = self._spo.setdefault(si, {}).setdefault(pi, set())
+            if oi in objects:
+                continue
+            objects.add(oi)
+            self._pos.setdefault(pi, {}).setdefault(oi, set()).add(si)
+            self._osp.setdefault(oi, {}).setdefault(si, set()).add(pi)
+            self._len += 1
+
+    def remove(self, triple: "Triple"):
+        """Remove all matching triples from the backend."""
+        ids = self._lookup(triple)
+        if ids is None:
+            return
+        for s, p, o in list(self._match(*ids)):
+            _discard(self._spo, s, p, o)
+            _discard(self._pos, p, o, s)
+            _discard(self._osp, o, s, p)
+            self._len -= 1
+
+    # Help methods
+    def _intern(self, term: "Union[str, Literal]") -> int:
+        """Return the id of `term`.  A new id is assigned if `term` is not
+        already interned."""
+        key = termkey(term)
+        i = self._ids.get(key)
+        if i is None:
+            i = len(self._terms)
+            self._ids[key] = i
+            self._terms.append(
+                term if isinstance(term, Literal) else str(term)
+            )
+        return i
+
+    def _lookup(self, triple: "OptionalTriple") -> "Optional[tuple]":
+        """Return a tuple with the ids of the terms in `triple`.  Unbound
+        terms (None) are kept as None.
+
+        Returns None if any of the bound terms are not interned, since
+        there cannot be any matching triples in that case.
+        """
+        ids: "List[Optional[int]]" = []
+        for term in triple:
+            if term is None:
+                ids.append(None)
+            else:
+                i = self._ids.get(termkey(term))
+                if i is None:
+                    return None
+                ids.append(i)
+        return tuple(ids)
+
+    def _match(
+        self, s: "Optional[int]", p: "Optional[int]", o: "Optional[int]"
+    ) -> "Generator[tuple, None, None]":
+        """Returns a generator over ids of all triples matching the given
+        subject, predicate and object ids.
+
+        The innermost collections are copied before iterating over them,
+        such that it is safe to modify the store while iterating.
+        """
+        # pylint: disable=too-many-branches
+        if s is not None:
+            if p is not None:
+                objects = self._spo.get(s, {}).get(p, ())
+                if o is not None:
+                    if o in objects:
+                        yield s, p, o
+                else:
+                    for oi in tuple(objects):
+                        yield s, p, oi
+            elif o is not None:
+                for pi in tuple(self._osp.get(o, {}).get(s, ())):
+                    yield s, pi, o
+            else:
+                for pi, objects in tuple(self._spo.get(s, {}).items()):
+                    for oi in tuple(objects):
+                        yield s, pi, oi
+        elif p is not None:
+            if o is not None:
+                for si in tuple(self._pos.get(p, {}).get(o, ())):
+                    yield si, p, o
+            else:
+                for oi, subjects in tuple(self._pos.get(p, {}).items()):
+                    for si in tuple(subjects):
+                        yield si, p, oi
+        elif o is not None:
+            for si, predicates in tuple(self._osp.get(o, {}).items()):
+                for pi in tuple(predicates):
+                    yield si, pi, o
+        else:
+            for si, po in tuple(self._spo.items()):
+                for pi, objects in tuple(po.items()):
+                    for oi in tuple(objects):
+                        yield si, pi, oi
+
+
+def _discard(index: "Index", a: int, b: int, c: int) -> None:
+    """Remove `c` from `index[a][b]` and prune empty entries."""
+    inner = index[a]
+    values = inner[b]
+    values.discard(c)
+    if not values:
+        del inner[b]
+        if not inner:
+            del index[a]
@@ -11,7 +11,10 @@ for more details.
 """
 
 # pylint: disable=line-too-long
+import os
+import threading
 import warnings
+from pathlib import Path
 from typing import TYPE_CHECKING, Generator
 
 try:
@@ -21,31 +24,76 @@ except ImportError as exc:
         "rdflib is not installed.\nInstall it with:\n\n    pip install rdflib"
     ) from exc
 
-from rdflib import BNode, Graph
+from rdflib import BNode, ConjunctiveGraph, Graph
 from rdflib import Literal as rdflibLiteral
-from rdflib import URIRef
+from rdflib import URIRef, Variable
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from rdflib.plugins.sparql import prepareQuery, prepareUpdate
+from rdflib.plugins.stores.sparqlstore import SPARQLStore
 from rdflib.util import guess_format
 
 from tripper import Literal
-from tripper.errors import UnusedArgumentWarning
+from tripper.errors import ArgumentValueError, UnusedArgumentWarning
+from tripper.ntriples import literal_term, parse_line
+from tripper.ntriples import term as ntriples_term
 from tripper.utils import parse_literal
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Sequence
-    from typing import List, Optional, Tuple, Union
+    from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
     from tripper.triplestore import Triple
 
 
+# The SPARQL parser in rdflib is not thread-safe.  This lock serialises
+# parsing of queries and updates, while evaluation may run concurrently.
+_parser_lock = threading.Lock()
+
+
+# Maximum number of terms kept in each of the term conversion caches
+# used by tordflib() and fromrdflib().  A cache is cleared when it is
+# full.  Set to zero to disable caching.
+TERM_CACHE_SIZE = 100_000
+
+_tordflib_cache: "Dict[Any, Any]" = {}
+_fromrdflib_cache: "Dict[Any, Any]" = {}
+
+
+def _cache_term(cache: dict, key: "Any", term: "Any") -> None:
+    """Help function adding `term` to the bounded term cache `cache`."""
+    if TERM_CACHE_SIZE > 0:
+        if len(cache) >= TERM_CACHE_SIZE:
+            cache.clear()
+        cache[key] = term
+
+
+def clear_term_caches() -> None:
+    """Clear the term conversion caches."""
+    _tordflib_cache.clear()
+    _fromrdflib_cache.clear()
+
+
 def tordflib(value: "Union[None, Literal, str]"):
     """Help function converting a spo-value to proper rdflib type."""
     if value is None:
         return None
     if isinstance(value, Literal):
-        return rdflibLiteral(value, lang=value.lang, datatype=value.datatype)
-    if value.startswith("_:"):
-        return BNode(value[2:])
-    return URIRef(value)
+        # Literals compare equal to strings, so use a tuple as key
+        key: "Any" = (str(value), value.lang, value.datatype)
+    else:
+        key = value
+    term = _tordflib_cache.get(key)
+    if term is None:
+        if isinstance(value, Literal):
+            term = rdflibLiteral(
+                value, lang=value.lang, datatype=value.datatype
+            )
+        elif value.startswith("_:"):
+            term = BNode(value[2:])
+        else:
+            term = URIRef(value)
+        _cache_term(_tordflib_cache, key, term)
+    return term
 
 
 def totriple(triple: "Triple"):
@@ -58,11 +106,18 @@ def fromrdflib(
     value: "Union[URIRef, rdflibLiteral, BNode]",
 ) -> "Union[str, Literal]":
     """Help function converting an rdflib value to corresponding tripper value."""
-    if isinstance(value, rdflibLiteral):
-        return parse_literal(value)
-    if isinstance(value, BNode) and not value.startswith("_:"):
-        return f"_:{value}"
-    return str(value)
+    if type(value) is URIRef:  # pylint: disable=unidiomatic-typecheck
+        return str(value)
+    converted = _fromrdflib_cache.get(value)
+    if converted is None:
+        if isinstance(value, rdflibLiteral):
+            converted = parse_literal(value)
+        elif isinstance(value, BNode) and not value.startswith("_:"):
+            converted = f"_:{value}"
+        else:
+            converted = str(value)
+        _cache_term(_fromrdflib_cache, value, converted)
+    return converted
 
 
 class RdflibStrategy:
@@ -78,6 +133,39 @@ class RdflibStrategy:
         format: Format of storage specified with `base_iri`.
         graph: A rdflib.Graph instance to expose with tripper, instead of
             creating a new empty Graph object.
+        store: Persistent rdflib store to open, written as
+            `"<plugin>:<configuration>"`.  Use `"sqlite:<path>"` for the
+            SQLite store provided by tripper, or the name of any rdflib
+            store plugin, like `"BerkeleyDB:<path>"`.  The store is
+            created if it does not exist.  Changes are committed after
+            each modifying operation, so opening an existing store does
+            not require parsing.  Cannot be combined with `graph` or
+            `triplestore_url`.
+        journal: If true, changes are not written back to `triplestore_url`
+            when closing the triplestore.  Instead, added and removed
+            triples are appended to the journal file
+            `<triplestore_url>.journal` as soon as they are made.  The
+            journal is replayed when the triplestore is opened again and
+            folded into `triplestore_url` by `compact()`.  Requires that
+            `triplestore_url` is a local file, which is created by
+            `compact()` if it does not exist.
+
+    Note:
+        Named graphs are stored as separate contexts in the store of the
+        default graph, which must be context-aware (like the default
+        in-memory store and the SQLite store).  Once a named graph is
+        used, triples(), query() and update() operate on the union of
+        the default graph and all named graphs (like GraphDB), while
+        add_triples() and remove() without `graph` only affect the
+        default graph.  Named graphs are only included by serialize()
+        for formats supporting datasets, like "nquads" and "trig".
+
+        SPARQL updates cannot be recorded in the journal.  Instead,
+        `update()` calls `compact()` when `journal` is true.
+
+        Blank nodes are matched by their labels in the journal.  Since
+        most parsers relabel blank nodes, removal of triples with blank
+        nodes that are loaded from `triplestore_url` may not be replayed.
     """
 
     prefer_sparql = False
@@ -89,44 +177,206 @@ class RdflibStrategy:
         triplestore_url: "Optional[str]" = None,
         format: "Optional[str]" = None,  # pylint: disable=redefined-builtin
         graph: "Optional[Graph]" = None,
+        store: "Optional[str]" = None,
+        journal: bool = False,
     ) -> None:
         # Note that although `base_iri` is unused in this backend, it may
         # still be used by calling Triplestore object.
         if database:
             warnings.warn("database", UnusedArgumentWarning, stacklevel=3)
 
-        self.graph = graph if graph else Graph()
+        self.persistent = bool(store)
+        if store:
+            if graph is not None or triplestore_url is not None:
+                raise ArgumentValueError(
+                    "`store` cannot be combined with `graph` or "
+                    "`triplestore_url`"
+                )
+            self.graph = _open_store(store)
+        else:
+            self.graph = (
+                graph if graph else Graph(identifier=DATASET_DEFAULT_GRAPH_ID)
+            )
         self.triplestore_url = triplestore_url
+        self.journal: "Optional[Journal]" = None
+        if journal and not triplestore_url:
+            raise ArgumentValueError("`journal` requires `triplestore_url`")
         if self.triplestore_url is not None:
             if format is None:
                 format = guess_format(self.triplestore_url)
-            self.parse(location=self.triplestore_url, format=format)
+            if not journal or Path(self.triplestore_url).exists():
+                self.parse(location=self.triplestore_url, format=format)
         self.base_format = format
-
-    def triples(self, triple: "Triple") -> "Generator[Triple, None, None]":
-        """Returns a generator over matching triples."""
-        return _convert_triples_to_tripper(
-            self.graph.triples(totriple(triple))
+        if journal:
+            self.journal = Journal(f"{self.triplestore_url}.journal")
+            self.journal.replay(self.graph)
+
+        # Union of the default graph and all named graphs.  Only created
+        # when named graphs are in use.
+        self._union: "Optional[ConjunctiveGraph]" = None
+        if isinstance(self.graph, ConjunctiveGraph):
+            self._union = self.graph
+        elif self.persistent and any(
+            context.identifier != self.graph.identifier
+            for context in self.graph.store.contexts()
+        ):
+            self._use_named_graphs()
+
+    def _use_named_graphs(self) -> "ConjunctiveGraph":
+        """Help method that enables named graphs and returns the union
+        of the default graph and all named graphs."""
+        if self._union is None:
+            if self.journal:
+                raise ArgumentValueError(
+                    "named graphs are not supported with `journal`"
+                )
+            if not self.graph.store.context_aware:
+                raise ArgumentValueError(
+                    "named graphs require a context-aware rdflib store"
+                )
+            with warnings.catch_warnings():
+                # ConjunctiveGraph is deprecated in favour of Dataset, but
+                # a Dataset cannot use an existing graph as default graph
+                warnings.simplefilter("ignore", DeprecationWarning)
+                self._union = ConjunctiveGraph(
+                    store=self.graph.store,
+                    identifier=self.graph.identifier,
+                )
+        return self._union
+
+    def _named_graph(self, graph: str) -> Graph:
+        """Help method returning the named graph with IRI `graph`."""
+        self._use_named_graphs()
+        return Graph(
+            store=self.graph.store,
+            identifier=URIRef(graph),
+            namespace_manager=self.graph.namespace_manager,
         )
 
-    def add_triples(self, triples: "Sequence[Triple]"):
-        """Add a sequence of triples."""
-        for triple in triples:
-            self.graph.add(totriple(triple))
+    def _reader(self) -> Graph:
+        """Help method returning the graph to read from."""
+        return self.graph if self._union is None else self._union
+
+    def triples(
+        self, triple: "Triple", graph: "Optional[str]" = None
+    ) -> "Generator[Triple, None, None]":
+        """Returns a generator over matching triples, optionally in the
+        named graph `graph`."""
+        source = self._named_graph(graph) if graph else self._reader()
+        return _convert_triples_to_tripper(source.triples(totriple(triple)))
+
+    def project(
+        self, triple: "Triple", positions: "Tuple[int, ...]"
+    ) -> "Generator[Tuple, None, None]":
+        """Returns a generator over tuples with the terms at `positions`
+        of the matching triples.  Only the requested terms are converted
+        to tripper types."""
+        converters = [str if i == 1 else fromrdflib for i in positions]
+        pairs = list(zip(positions, converters))
+        for t in self._reader().triples(totriple(triple)):
+            yield tuple(convert(t[i]) for i, convert in pairs)
+
+    def add_triples(
+        self, triples: "Sequence[Triple]", graph: "Optional[str]" = None
+    ):
+        """Add a sequence of triples, optionally to the named graph
+        `graph`."""
+        if graph:
+            named = self._named_graph(graph)
+            named.addN((s, p, o, named) for s, p, o in map(totriple, triples))
+            self._commit()
+            return
+        rdflib_triples = map(totriple, triples)
+        if self.journal:
+            rdflib_triples = list(rdflib_triples)  # type: ignore
+            self.journal.record("A", rdflib_triples)  # type: ignore
+        if isinstance(self.graph, ConjunctiveGraph):
+            # Let the graph add the triples to its default context
+            for triple in rdflib_triples:
+                self.graph.add(triple)
+        else:
+            self.graph.addN(
+                (s, p, o, self.graph) for s, p, o in rdflib_triples
+            )
+        self._commit()
 
-    def remove(self, triple: "Triple"):
-        """Remove all matching triples from the backend."""
-        self.graph.remove(totriple(triple))
+    def remove(self, triple: "Triple", graph: "Optional[str]" = None):
+        """Remove all matching triples from the backend, or from the named
+        graph `graph` if it is given.
+
+        Without `graph`, the triples are removed from the default graph
+        and all named graphs, since they are all seen by triples().
+        """
+        if graph:
+            self._named_graph(graph).remove(totriple(triple))
+            self._commit()
+            return
+        if self.journal:
+            matches = list(self.graph.triples(totriple(triple)))
+            self.journal.record("D", matches)
+            for match in matches:
+                self.graph.remove(match)
+            return
+        self._reader().remove(totriple(triple))
+        self._commit()
+
+    def remove_triples(self, triples: "Sequence[Triple]"):
+        """Remove a sequence of triples from the default graph and all
+        named graphs."""
+        rdflib_triples = [totriple(triple) for triple in triples]
+        if self.journal:
+            self.journal.record(
+                "D", [t for t in rdflib_triples if t in self.graph]
+            )
+        source = self._reader()
+        for rdflib_triple in rdflib_triples:
+            source.remove(rdflib_triple)
+        self._commit()
+
+    def drop_graph(self, graph: str):
+        """Remove the named graph `graph` and all its triples."""
+        if self._union is None:
+            return  # no named graphs in use
+        named = self._named_graph(graph)
+        store = self.graph.store
+        if store.graph_aware:
+            store.remove_graph(named)
+        else:
+            store.remove((None, None, None), context=named)
+        self._commit()
+
+    def _commit(self):
+        """Commit changes to a persistent store."""
+        if self.persistent:
+            self.graph.commit()
 
     # Optional methods
     def close(self):
         """Close the internal RDFLib graph."""
-        if self.triplestore_url:
+        if self.journal:
+            self.journal.close()
+        elif self.triplestore_url:
             self.serialize(
                 destination=self.triplestore_url, format=self.base_format
             )
+        self._commit()
         self.graph.close()
 
+    def compact(self):
+        """Fold the journal into `triplestore_url`.
+
+        The current content of the triplestore is written to a temporary
+        file, which then replaces `triplestore_url`.  Finally the journal
+        is truncated.  Hence, no changes are lost if the process is
+        interrupted.
+        """
+        if not self.journal:
+            raise ArgumentValueError("compact() requires `journal`")
+        tmpfile = f"{self.triplestore_url}.tmp"
+        self.serialize(destination=tmpfile, format=self.base_format)
+        os.replace(tmpfile, str(self.triplestore_url))
+        self.journal.truncate()
+
     def parse(
         self,
         source=None,
@@ -147,13 +397,23 @@ class RdflibStrategy:
             kwargs: Additional less used keyword arguments.
                 See https://rdflib.readthedocs.io/en/stable/apidocs/rdflib.html#rdflib.Graph.parse
         """
-        self.graph.parse(
+        # With a journal, the source is parsed into a temporary graph,
+        # such that the parsed triples can be recorded
+        graph = Graph() if self.journal else self.graph
+        graph.parse(
             source=source,
             location=location,
             data=data,
             format=format,
             **kwargs,
         )
+        if self.journal:
+            for prefix, namespace in graph.namespaces():
+                self.graph.bind(prefix, namespace, override=False)
+            self.journal.record("A", list(graph))
+            self.graph.addN((s, p, o, self.graph) for s, p, o in graph)
+        else:
+            self._commit()
 
     def serialize(
         self,
@@ -173,7 +433,10 @@ class RdflibStrategy:
         Returns:
             Serialised string if `destination` is None.
         """
-        result = self.graph.serialize(
+        graph = self.graph
+        if self._union is not None and format in _DATASET_FORMATS:
+            graph = self._union
+        result = graph.serialize(
             destination=destination, format=format, **kwargs
         )
         if destination is None:
@@ -200,7 +463,9 @@ class RdflibStrategy:
             For more info, see
             https://rdflib.readthedocs.io/en/stable/apidocs/rdflib.html#rdflib.query.Result
         """
-        result = self.graph.query(query_object=query_object, **kwargs)
+        result = self._reader().query(
+            query_object=self._parse_query(query_object, **kwargs), **kwargs
+        )
 
         # The type of the result object depends not only on the type of query,
         # but also on the version of rdflib...  We try to be general here.
@@ -227,6 +492,84 @@ class RdflibStrategy:
             return _convert_triples_to_tripper(result)
         assert False, "should never be reached"  # nosec
 
+    def query_iter(
+        self, query_object, **kwargs
+    ) -> "Generator[Union[Tuple[str, ...], Triple], None, None]":
+        """SPARQL query returning a generator over the result.
+
+        Parameters:
+            query_object: String with the SPARQL query.
+            kwargs: Keyword arguments passed to rdflib.Graph.query().
+
+        Returns:
+            Generator over tuples of IRIs for each matching row of SELECT
+            queries and over triples for CONSTRUCT and DESCRIBE queries.
+            Rows are converted to tripper types as they are consumed.
+        """
+        result = self._reader().query(
+            query_object=self._parse_query(query_object, **kwargs), **kwargs
+        )
+        resulttype = getattr(result, "type", None)
+        if resulttype == "SELECT":
+            return (
+                tuple(fromrdflib(v) for v in row)  # type: ignore
+                for row in result
+            )
+        if resulttype in ("CONSTRUCT", "DESCRIBE"):
+            return _convert_triples_to_tripper(result)
+        raise ArgumentValueError(
+            f"query_iter() does not support {resulttype} queries"
+        )
+
+    def prepare(
+        self,
+        query_object: str,
+        parameters: "Sequence[str]" = (),
+        **kwargs,
+    ) -> "Callable[..., Any]":
+        """Compile a SPARQL query for repeated evaluation.
+
+        The query is parsed and translated to SPARQL algebra once by
+        rdflib.
+
+        Parameters:
+            query_object: String with the SPARQL query.
+            parameters: Names of the variables in `query_object` that are
+                bound when the prepared query is evaluated.  They are
+                not included in the result of `SELECT *` queries.
+            kwargs: Keyword arguments passed to rdflib's prepareQuery().
+
+        Returns:
+            A function that takes a dict mapping parameter names to
+            tripper IRIs or literals, evaluates the query and returns the
+            result in the same form as query().  Additional keyword
+            arguments are passed to query().
+        """
+        kwargs.setdefault("initNs", dict(self.graph.namespaces()))
+        with _parser_lock:
+            prepared = prepareQuery(query_object, **kwargs)
+
+        # Remove the parameters from the projection
+        if parameters and prepared.algebra.name == "SelectQuery":
+            hidden = {Variable(name) for name in parameters}
+            node = prepared.algebra
+            while node is not None:
+                if "PV" in node:
+                    node["PV"] = [v for v in node["PV"] if v not in hidden]
+                if node.name == "Project":
+                    break
+                node = node.get("p")
+
+        def evaluate(bindings: dict, **kw):
+            """Evaluate the prepared query with the given bindings."""
+            return self.query(
+                prepared,
+                initBindings={k: tordflib(v) for k, v in bindings.items()},
+                **kw,
+            )
+
+        return evaluate
+
     def update(self, update_object, **kwargs) -> None:
         """Update triplestore with SPARQL.
 
@@ -239,7 +582,47 @@ class RdflibStrategy:
             the query() method for SELECT queries.
 
         """
-        return self.graph.update(update_object=update_object, **kwargs)
+        if isinstance(update_object, str) and self._parses_sparql():
+            with _parser_lock:
+                update_object = prepareUpdate(
+                    update_object,
+                    initNs=kwargs.get("initNs", dict(self.graph.namespaces())),
+                    base=kwargs.get("base"),
+                )
+        self._reader().update(update_object=update_object, **kwargs)
+        self._commit()
+        if self.journal:
+            self.compact()
+
+    def _parses_sparql(self) -> bool:
+        """Return whether SPARQL queries and updates are evaluated by
+        rdflib itself.  This is the case for the stores included in
+        rdflib, except the SPARQL stores which send them to an endpoint,
+        and for the SQLite store in tripper.
+        """
+        # pylint: disable=import-outside-toplevel
+        from tripper.backends.sqlitestore import SQLiteStore
+
+        store = self.graph.store
+        if isinstance(store, SQLiteStore):
+            return True
+        return type(store).__module__.startswith("rdflib.") and not (
+            isinstance(store, SPARQLStore)
+        )
+
+    def _parse_query(self, query_object, **kwargs):
+        """Help method that parses `query_object` if it is a string.
+
+        Returns the parsed query or `query_object` if it is not a string.
+        """
+        if not isinstance(query_object, str) or not self._parses_sparql():
+            return query_object
+        with _parser_lock:
+            return prepareQuery(
+                query_object,
+                initNs=kwargs.get("initNs", dict(self.graph.namespaces())),
+                base=kwargs.get("base"),
+            )
 
     def bind(self, prefix: str, namespace: str):
         """Bind prefix to namespace.
@@ -249,6 +632,7 @@ class RdflibStrategy:
         """
         if namespace:
             self.graph.bind(prefix, namespace, replace=True)
+            self._commit()
         else:
             warnings.warn(
                 "rdflib does not support removing namespace prefixes"
@@ -267,6 +651,133 @@ class RdflibStrategy:
         }
 
 
+# Serialisation formats that include named graphs
+_DATASET_FORMATS = ("nquads", "nq", "trig", "trix", "json-ld", "hext")
+
+
+def _ntriples_term(term: "Any") -> str:
+    """Return rdflib term `term` in N-Triples syntax.  The lexical form
+    of literals is kept as is."""
+    if isinstance(term, rdflibLiteral):
+        return literal_term(str(term), term.language, term.datatype)
+    if isinstance(term, BNode):
+        return f"_:{term}"
+    return ntriples_term(str(term))
+
+
+def _rdflib_term(term: "Any") -> "Any":
+    """Return term parsed by `parse_line()` as an rdflib term."""
+    if isinstance(term, rdflibLiteral):
+        return term
+    if term.startswith("_:"):
+        return BNode(term[2:])
+    return URIRef(term)
+
+
+class Journal:
+    """Append-only journal of changes to a file-backed rdflib graph.
+
+    Each line in the journal records an added (A) or deleted (D) triple
+    in N-Triples syntax, like `A <s> <p> "o" .`
+
+    Arguments:
+        path: Path to the journal file.  It is created if it does not
+            exist.
+    """
+
+    # Maximum number of lines to parse at once when replaying
+    chunk_size = 10_000
+
+    def __init__(self, path: "Union[str, Path]") -> None:
+        self.path = Path(path)
+        self._file = open(  # pylint: disable=consider-using-with
+            self.path, "a", encoding="utf-8"
+        )
+
+    def record(self, op: str, triples: "Sequence[Tuple[Any, Any, Any]]"):
+        """Append records for rdflib `triples` with operation `op` ("A"
+        or "D") and flush them to disk."""
+        if not triples:
+            return
+        self._file.write(
+            "".join(
+                f"{op} {_ntriples_term(s)} {_ntriples_term(p)} "
+                f"{_ntriples_term(o)} .\n"
+                for s, p, o in triples
+            )
+        )
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def replay(self, graph: Graph) -> None:
+        """Apply all records in the journal to `graph`.
+
+        An incomplete last line, left by an interrupted write, is
+        removed from the journal.
+        """
+        op: "Optional[str]" = None
+        lines: "List[str]" = []
+        literals: "Dict[str, Any]" = {}
+        size = 0
+
+        def apply():
+            parsed = []
+            for line in lines:
+                terms = parse_line(
+                    line, literals=literals, literal_type=rdflibLiteral
+                )
+                parsed.append(tuple(map(_rdflib_term, terms)))
+            if op == "A":
+                graph.addN((s, p, o, graph) for s, p, o in parsed)
+            else:
+                for triple in parsed:
+                    graph.remove(triple)
+            lines.clear()
+
+        with open(self.path, "rb") as f:
+            for record in f:
+                if not record.endswith(b"\n"):
+                    os.truncate(self.path, size)
+                    break
+                size += len(record)
+                line = record.decode("utf-8")
+                if line[0] != op or len(lines) >= self.chunk_size:
+                    if lines:
+                        apply()
+                    op = line[0]
+                lines.append(line[2:])
+        if lines:
+            apply()
+
+    def truncate(self) -> None:
+        """Remove all records from the journal."""
+        self._file.truncate(0)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._file.close()
+
+
+def _open_store(store: str) -> Graph:
+    """Help function returning a graph backed by the persistent rdflib
+    store `store`, written as `"<plugin>:<configuration>"`."""
+    name, _, configuration = store.partition(":")
+    if name.lower() == "sqlite":
+        # pylint: disable=import-outside-toplevel
+        from tripper.backends.sqlitestore import SQLiteStore
+
+        rdflib_store: "Union[str, SQLiteStore]" = SQLiteStore()
+    else:
+        rdflib_store = name
+    # Use a fixed identifier, such that the same graph is found when
+    # the store is opened again
+    graph = Graph(store=rdflib_store, identifier=DATASET_DEFAULT_GRAPH_ID)
+    graph.open(configuration, create=True)
+    return graph
+
+
 def _convert_triples_to_tripper(triples) -> "Generator[Triple, None, None]":
     """Help function that converts a iterator/generator of rdflib triples
     to tripper triples."""
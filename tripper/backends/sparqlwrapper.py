@@ -1,17 +1,49 @@
 """Backend for SPARQLWrapper"""
 
+# pylint: disable=too-many-lines
+
+import asyncio
+import base64
+import http.client
+import io
+import json
+import os
 import re
+import ssl
+import threading
+import urllib.error
+import urllib.request
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
+from urllib.parse import urlencode, urlsplit
 
 from rdflib import Graph
+from rdflib.util import guess_format
 
-from tripper import Literal
+from tripper import XSD, Literal
 from tripper.backends.rdflib import _convert_triples_to_tripper
-from tripper.errors import TripperError
+from tripper.errors import ArgumentValueError, TripperError
+from tripper.ntriples import parse_line, parse_term
 from tripper.utils import check_service_availability
 
 try:
-    from SPARQLWrapper import GET, JSON, POST, TURTLE, SPARQLWrapper
+    from SPARQLWrapper import (
+        DIGEST,
+        GET,
+        JSON,
+        POST,
+        TSV,
+        TURTLE,
+        SPARQLWrapper,
+    )
+    from SPARQLWrapper.SPARQLExceptions import (
+        EndPointInternalError,
+        EndPointNotFound,
+        QueryBadFormed,
+        Unauthorized,
+        URITooLong,
+    )
 except ImportError as exc:
     raise ImportError(
         "SPARQLWrapper is not installed.\nInstall it with:\n\n"
@@ -20,11 +52,23 @@ except ImportError as exc:
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Sequence
-    from typing import Dict, Generator, List, Optional, Tuple, Union
+    from typing import (
+        Any,
+        Dict,
+        Generator,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Tuple,
+        Union,
+    )
 
     from SPARQLWrapper import QueryResult
     from triplestore import Triple
 
+    from tripper.utils import OptionalTriple
+
 
 class SparqlwrapperStrategy:
     """Triplestore strategy for SPARQLWrapper.
@@ -36,34 +80,103 @@ class SparqlwrapperStrategy:
             Defaults to base_iri.
         check_iri: IRI to use for checking that the triplestore is available.
             Defaults to base_iri.
+        graph_store_iri: URL of a SPARQL 1.1 Graph Store HTTP Protocol
+            endpoint.  If given, `parse()` uploads files and data directly
+            to this endpoint instead of converting them to INSERT DATA
+            requests.
         username: User name.
         password: Password.
+        page_size: If given, `triples()` fetches the matching triples in
+            pages of at most `page_size` triples, using ORDER BY, LIMIT
+            and OFFSET.  By default, all matching triples are fetched
+            with a single request.  Paging limits the size of each
+            response, but OFFSET queries get slower for later pages and
+            triples are skipped or repeated if the triplestore is
+            modified while iterating, e.g. by calling `remove()` within
+            the loop.
+        pool_size: Maximum number of idle keep-alive connections to keep
+            open to the endpoint.  The connections are shared by all
+            triplestores connected to the same host.  If zero, a new
+            connection is opened for each request.
+        select_format: Result format to request for SELECT queries.  Either
+            "json" (SPARQL JSON results) or "tsv" (SPARQL TSV results).
+            TSV results are smaller and much faster to decode, and are
+            decoded row by row as they are received.
+        update_chunk_size: Maximum number of triples to send in a single
+            INSERT DATA or DELETE DATA request.
+        update_chunk_bytes: Maximum size in bytes of a single INSERT DATA
+            or DELETE DATA request.  A request always holds at least one
+            triple.
+        update_workers: Number of threads submitting the INSERT DATA and
+            DELETE DATA requests of a single `add_triples()` or
+            `remove_triples()` call in parallel.  If 1, the requests are
+            submitted one by one.
         kwargs: Additional arguments passed to the SPARQLWrapper constructor.
 
+    Note:
+        The strategy is thread-safe.  Each thread gets its own
+        SPARQLWrapper instance (accessed via the `sparql` attribute),
+        while the HTTP connections are shared between threads.
+
     """
 
+    # pylint: disable=too-many-instance-attributes,too-many-arguments
+
     prefer_sparql = True
 
+    # Maximum number of patterns to send in a single triples_many() query
+    max_patterns_per_query = 500
+
     def __init__(
         self,
         base_iri: str,
         update_iri: "Optional[str]" = None,
         check_iri: "Optional[str]" = None,
+        graph_store_iri: "Optional[str]" = None,
         username: "Optional[str]" = None,
         password: "Optional[str]" = None,
+        page_size: "Optional[int]" = None,
+        pool_size: int = 10,
+        select_format: str = "json",
+        update_chunk_size: int = 10000,
+        update_chunk_bytes: int = 2_000_000,
+        update_workers: int = 1,
         **kwargs,
     ) -> None:
-        self.update_iri = update_iri if update_iri else base_iri
-        self.check_iri = check_iri if check_iri else base_iri
-
         kwargs.pop(
             "database", None
         )  # database is not used in the SPARQLWrapper backend
-        self.sparql = SPARQLWrapper(
-            endpoint=base_iri, updateEndpoint=update_iri, **kwargs
-        )
-        if username and password:
-            self.sparql.setCredentials(username, password)
+        self._sparql_kwargs = {"endpoint": base_iri, **kwargs}
+        self._credentials = (username, password)
+        self._local = threading.local()
+
+        self.update_iri = update_iri if update_iri else base_iri
+        self.check_iri = check_iri if check_iri else base_iri
+        self.graph_store_iri = graph_store_iri
+        self.page_size = page_size
+        self.pool_size = pool_size
+        if select_format not in ("json", "tsv"):
+            raise ArgumentValueError(
+                "`select_format` must be either 'json' or 'tsv'"
+            )
+        self.select_format = select_format
+        self.update_chunk_size = update_chunk_size
+        self.update_chunk_bytes = update_chunk_bytes
+        self.update_workers = update_workers
+
+    @property
+    def sparql(self) -> "PooledSPARQLWrapper":
+        """The SPARQLWrapper instance of the current thread."""
+        sparql = getattr(self._local, "sparql", None)
+        if sparql is None:
+            sparql = PooledSPARQLWrapper(**self._sparql_kwargs)
+            username, password = self._credentials
+            if username and password:
+                sparql.setCredentials(username, password)
+            self._local.sparql = sparql
+        sparql.updateEndpoint = self._update_iri
+        sparql.pool_size = self.pool_size
+        return sparql
 
     @property
     def update_iri(self) -> "Optional[str]":
@@ -74,15 +187,12 @@ class SparqlwrapperStrategy:
     def update_iri(self, new_update_iri: "Optional[str]") -> None:
         """Setter for the update IRI that also updates the SPARQL endpoint."""
         self._update_iri = new_update_iri
-        # Update the SPARQLWrapper's updateEndpoint only if it was initialized.
-        if hasattr(self, "sparql"):
-            self.sparql.updateEndpoint = new_update_iri
 
     def query(
         self,
         query_object: str,
         **kwargs,  # pylint: disable=unused-argument
-    ) -> "Union[List[Tuple[str, ...]], bool, Generator[Triple, None, None]]":
+    ) -> "Union[List[Tuple[str, ...]], bool, Iterator[Triple]]":
         """SPARQL query.
 
         Parameters:
@@ -92,8 +202,8 @@ class SparqlwrapperStrategy:
         Returns:
             The return type depends on type of query:
               - ASK: whether there is a match
-              - CONSTRUCT: generator over triples
-              - DESCRIBE: generator over triples
+              - CONSTRUCT: iterator over triples
+              - DESCRIBE: iterator over triples
               - SELECT: list of tuples of IRIs
         """
         query_type = self._get_sparql_query_type(query_object)
@@ -106,39 +216,46 @@ class SparqlwrapperStrategy:
             value = result["boolean"]
             return value
 
-        if query_type == "CONSTRUCT":
-            self.sparql.setReturnFormat(TURTLE)
-            self.sparql.setMethod(GET)
-            self.sparql.setQuery(query_object)
-            results = self.sparql.queryAndConvert()
-            graph = Graph()
-            graph.parse(data=results.decode("utf-8"), format="turtle")
-            return _convert_triples_to_tripper(graph)
-
-        if query_type == "DESCRIBE":
-            self.sparql.setReturnFormat(TURTLE)
-            self.sparql.setMethod(GET)
-            self.sparql.setQuery(query_object)
-            results = self.sparql.queryAndConvert()
-            graph = Graph()
-            graph.parse(data=results.decode("utf-8"), format="turtle")
-            return _convert_triples_to_tripper(graph)
+        if query_type in ("CONSTRUCT", "DESCRIBE"):
+            return self._construct(query_object)
 
         if query_type == "SELECT":
-            self.sparql.setReturnFormat(JSON)
-            self.sparql.setMethod(GET)
-            self.sparql.setQuery(query_object)
-            ret = self.sparql.queryAndConvert()
-            bindings = ret["results"]["bindings"]
-            return [
-                tuple(convert_json_entrydict(v) for v in row.values())
-                for row in bindings
-            ]
+            _, rows = self._select(query_object)
+            return [tuple(row) for row in rows]
 
         raise NotImplementedError(
             f"Query type '{query_type}' not implemented."
         )
 
+    def query_iter(
+        self,
+        query_object: str,
+        **kwargs,
+    ) -> "Generator[Union[Tuple[str, ...], Triple], None, None]":
+        """SPARQL query returning a generator over the result.
+
+        Parameters:
+            query_object: String with the SPARQL query.
+            kwargs: Keyword arguments passed to query().
+
+        Returns:
+            Generator over tuples of IRIs for each matching row of SELECT
+            queries and over triples for CONSTRUCT and DESCRIBE queries.
+            Rows are converted to tripper types as they are consumed.
+        """
+        query_type = self._get_sparql_query_type(query_object)
+
+        if query_type == "SELECT":
+            _, rows = self._select(query_object)
+            return (tuple(row) for row in rows)
+
+        if query_type in ("CONSTRUCT", "DESCRIBE"):
+            return self.query(query_object, **kwargs)  # type: ignore
+
+        raise ArgumentValueError(
+            f"query_iter() does not support {query_type} queries"
+        )
+
     def _get_sparql_query_type(self, query: str) -> str:
         """
         Returns the SPARQL query type (e.g., SELECT, ASK, CONSTRUCT, DESCRIBE)
@@ -179,10 +296,114 @@ class SparqlwrapperStrategy:
             raise NotImplementedError(
                 f"Update query type '{query_type}' not implemented."
             )
-        self.sparql.setReturnFormat(TURTLE)
-        self.sparql.setMethod(POST)
-        self.sparql.setQuery(update_object)
-        self.sparql.query()
+        self._post_update(update_object)
+
+    def parse(
+        self,
+        source=None,
+        location=None,
+        data=None,
+        format=None,  # pylint: disable=redefined-builtin
+        **kwargs,
+    ) -> None:
+        """Parse source and add the resulting triples to triplestore.
+
+        The source is specified using one of `source`, `location` or `data`.
+
+        The source is uploaded with a single POST request to the Graph
+        Store HTTP Protocol endpoint `graph_store_iri`.  Files are
+        streamed from disk, such that they never are loaded into memory.
+
+        Parameters:
+            source: File-like object or file name.
+            location: String with relative or absolute URL to source.
+            data: String containing the data to be parsed.
+            format: Needed if format can not be inferred from source.
+            kwargs: Not used.
+
+        Raises:
+            NotImplementedError: If `graph_store_iri` is not set, the
+                format of the source is unknown, the source is a URL or
+                `kwargs` are given.  `Triplestore.parse()` then parses
+                the source with its fallback backend instead.
+        """
+        if location and not urlsplit(str(location)).scheme:
+            source, location = location, None
+        filename = source if isinstance(source, (str, os.PathLike)) else None
+        if format is None and filename is not None:
+            format = guess_format(str(filename))
+        mediatype = GRAPH_MEDIATYPES.get(format)  # type: ignore
+
+        # A single-letter scheme is a Windows drive letter
+        if (
+            not self.graph_store_iri
+            or not mediatype
+            or location
+            or kwargs
+            or len(urlsplit(str(filename or "")).scheme) > 1
+        ):
+            raise NotImplementedError(
+                "Only local sources with known format can be uploaded to "
+                "the graph store"
+            )
+        if filename is not None:
+            with open(filename, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                self._upload(f, mediatype, size)
+        elif data is not None:
+            body = data.encode("utf-8") if isinstance(data, str) else data
+            self._upload(body, mediatype, len(body))
+        else:
+            self._upload(_read_chunks(source), mediatype)
+
+    def _upload(
+        self, body: "Any", mediatype: str, size: "Optional[int]" = None
+    ) -> None:
+        """Help method that POSTs `body` to the default graph of the
+        Graph Store HTTP Protocol endpoint.
+
+        Arguments:
+            body: Bytes, binary file object or iterator over bytes.
+            mediatype: Media type of `body`.
+            size: Size of `body` in bytes.  If None, `body` is sent with
+                chunked transfer encoding.
+        """
+        url = str(self.graph_store_iri)
+        url += "&default" if "?" in url else "?default"
+        headers = {"Content-Type": mediatype}
+        if size is None:
+            headers["Transfer-Encoding"] = "chunked"
+        else:
+            headers["Content-Length"] = str(size)
+        username, password = self._credentials
+        if username and password:
+            credentials = f"{username}:{password}".encode("utf-8")
+            headers["Authorization"] = (
+                f"Basic {base64.b64encode(credentials).decode('ascii')}"
+            )
+        request = urllib.request.Request(
+            url, data=body, headers=headers, method="POST"
+        )
+
+        timeout = self.sparql.timeout
+        pool = (
+            get_connection_pool(url, self.pool_size)
+            if self.pool_size > 0
+            else None
+        )
+        try:
+            if pool is None:
+                with urllib.request.urlopen(  # nosec
+                    request, timeout=timeout
+                ) as response:
+                    response.read()
+            else:
+                pool.urlopen(request, timeout=timeout, preload=True)
+        except urllib.error.HTTPError as exc:
+            error = _HTTP_ERRORS.get(exc.code)
+            if error:
+                raise error(exc.read()) from exc
+            raise
 
     def is_available(self, timeout: float = 5, interval: float = 1) -> bool:
         """Checks if the backend is available.
@@ -208,74 +429,277 @@ class SparqlwrapperStrategy:
             self.check_iri, timeout=timeout, interval=interval
         )
 
-    def triples(self, triple: "Triple") -> "Generator[Triple, None, None]":
-        """Returns a generator over matching triples."""
-        variables = [
-            f"?{triple_name}"
-            for triple_name, triple_value in zip("spo", triple)
-            if triple_value is None
-        ]
-        where_spec = " ".join(
-            (
-                f"?{triple_name}"
-                if triple_value is None
-                else (
-                    triple_value
-                    if triple_value.startswith("<")
-                    else f"<{triple_value}>"
-                )
-            )
-            for triple_name, triple_value in zip("spo", triple)
-        )
-        query = "\n".join(
-            [
-                f"SELECT {' '.join(variables)} WHERE {{",
-                f"  {where_spec} .",
-                "}",
-            ]
+    def triples(
+        self, triple: "Triple", graph: "Optional[str]" = None
+    ) -> "Generator[Triple, None, None]":
+        """Returns a generator over matching triples, optionally in the
+        named graph `graph`.
+
+        If `page_size` is given, the matching triples are fetched in
+        pages of `page_size` triples using ORDER BY, LIMIT and OFFSET.
+        The next page is only requested when the previous has been
+        consumed.
+
+        Warning:
+            With paging, modifying the triplestore while iterating is
+            unsafe.  Triples may be skipped or returned twice.
+        """
+        variables = " ".join(
+            f"?{name}" for name, value in zip("spo", triple) if value is None
         )
+        if not variables:  # all terms bound
+            if self.ask(triple, graph=graph):
+                yield triple
+            return
+
+        pattern = _in_graph(f"{_pattern(triple)} .", graph)
+        query = f"SELECT {variables} WHERE {{ {pattern} }}"
+        if self.page_size:
+            query += f" ORDER BY {variables} LIMIT {int(self.page_size)}"
+
+        offset = 0
+        while True:
+            names, rows = self._select(
+                f"{query} OFFSET {offset}" if offset else query
+            )
+            nrows = 0
+            for row in rows:
+                nrows += 1
+                yield _as_triple(triple, names, row)
+            if not self.page_size or nrows < self.page_size:
+                break
+            offset += nrows
+
+    def ask(
+        self, triple: "OptionalTriple", graph: "Optional[str]" = None
+    ) -> bool:
+        """Returns whether there is any triple matching `triple`,
+        optionally in the named graph `graph`."""
+        pattern = _in_graph(f"{_pattern(triple)} .", graph)
         self.sparql.setReturnFormat(JSON)
         self.sparql.setMethod(GET)
-        self.sparql.setQuery(query)
-        ret = self.sparql.queryAndConvert()
-        for binding in ret["results"]["bindings"]:
-            yield tuple(
-                (
-                    convert_json_entrydict(binding[name])
-                    if name in binding
-                    else value
+        self.sparql.setQuery(f"ASK {{ {pattern} }}")
+        ret: "dict" = self.sparql.queryAndConvert()  # type: ignore
+        return ret["boolean"]
+
+    def count(self, triple: "OptionalTriple") -> int:
+        """Returns the number of triples matching `triple`."""
+        _, rows = self._select(
+            f"SELECT (COUNT(*) AS ?n) WHERE {{ {_pattern(triple)} . }}"
+        )
+        ((n,),) = rows
+        return int(n)  # type: ignore
+
+    def first(
+        self, triple: "OptionalTriple", limit: int = 1
+    ) -> "List[Triple]":
+        """Returns a list with at most `limit` triples matching `triple`."""
+        names, rows = self._select(
+            f"SELECT * WHERE {{ {_pattern(triple)} . }} LIMIT {int(limit)}"
+        )
+        return [_as_triple(triple, names, row) for row in rows]
+
+    def triples_many(
+        self, patterns: "Sequence[OptionalTriple]"
+    ) -> "List[List[Triple]]":
+        """Returns a list with a list of matching triples for each pattern.
+
+        All patterns are looked up with a single SELECT query, using a
+        VALUES block with one row per pattern.  Unbound terms are passed
+        as UNDEF.  Very long pattern lists are split into several queries
+        of at most `max_patterns_per_query` patterns.
+        """
+        result: "List[List[Triple]]" = [[] for _ in patterns]
+        n = self.max_patterns_per_query
+        for start in range(0, len(patterns), n):
+            rows = "\n".join(
+                f"    ({i} "
+                + " ".join(
+                    "UNDEF" if value is None else _n3(value)
+                    for value in pattern
                 )
-                for name, value in zip("spo", triple)
+                + ")"
+                for i, pattern in enumerate(
+                    patterns[start : start + n], start=start
+                )
+            )
+            query = "\n".join(
+                [
+                    "SELECT ?i ?s ?p ?o WHERE {",
+                    "  VALUES (?i ?s ?p ?o) {",
+                    rows,
+                    "  }",
+                    "  ?s ?p ?o .",
+                    "}",
+                ]
             )
+            _, rows = self._select(query, method=POST)
+            for i, s, p, o in rows:
+                result[int(i)].append((s, p, o))  # type: ignore
+        return result
 
-    def add_triples(self, triples: "Sequence[Triple]") -> "QueryResult":
-        """Add a sequence of triples."""
+    def _construct(self, query: str) -> "Iterator[Triple]":
+        """Send CONSTRUCT or DESCRIBE `query` to the endpoint.
 
-        self._check_endpoint()
+        N-Triples is requested, such that the triples can be decoded line
+        by line while they are received.  If the endpoint responds with
+        Turtle instead, the response is parsed with rdflib.
 
-        spec = "\n".join(
-            "  "
-            + " ".join(
-                (
-                    value.n3()
-                    if isinstance(value, Literal)
-                    else value if value.startswith("<") else f"<{value}>"
-                )
-                for value in triple
+        Returns:
+            Iterator over resulting triples.
+        """
+        sparql = self.sparql
+        sparql.setReturnFormat(TURTLE)
+        sparql.setMethod(GET)
+        sparql.setQuery(query)
+        sparql.accept = "application/n-triples,text/turtle;q=0.5"
+        try:
+            response = sparql.query().response
+        finally:
+            sparql.accept = None
+
+        mediatype = response.info().get("Content-Type", "")
+        if mediatype.split(";")[0].strip() in NTRIPLES_MEDIATYPES:
+            return decode_ntriples(_response_lines(response))
+        with response:
+            return _parse_turtle(response.read())
+
+    def _select(
+        self, query: str, method: str = GET
+    ) -> "Tuple[List[str], Iterator[list]]":
+        """Send SELECT `query` to the endpoint.
+
+        Arguments:
+            query: SELECT query to send.
+            method: HTTP method to use.
+
+        Returns:
+            A `(names, rows)` tuple, where `names` is a list with the
+            names of the selected variables and `rows` is an iterator over
+            lists of tripper terms (None for unbound variables) in the
+            same order as `names`.
+        """
+        self.sparql.setMethod(method)
+        self.sparql.setQuery(query)
+        if self.select_format == "tsv":
+            self.sparql.setReturnFormat(TSV)
+            return decode_tsv_results(
+                _response_lines(self.sparql.query().response)
             )
-            + " ."
-            for triple in triples
+
+        self.sparql.setReturnFormat(JSON)
+        ret: "dict" = self.sparql.queryAndConvert()  # type: ignore
+        return decode_json_results(ret)
+
+    def add_triples(
+        self, triples: "Iterable[Triple]", graph: "Optional[str]" = None
+    ) -> None:
+        """Add a sequence of triples, optionally to the named graph
+        `graph`.
+
+        The triples are sent with INSERT DATA requests, each holding at
+        most `update_chunk_size` triples or `update_chunk_bytes` bytes.
+        """
+        self._check_endpoint()
+        self._update_data("INSERT", triples, graph=graph)
+
+    def remove_triples(self, triples: "Iterable[Triple]") -> None:
+        """Remove a sequence of triples.
+
+        The triples are removed with DELETE DATA requests, chunked like in
+        `add_triples()`.  Triples that contain None are removed with
+        `remove()`, since they cannot be used in DELETE DATA.
+
+        Blank nodes cannot be referred to in SPARQL updates.  Triples with
+        blank nodes are therefore removed with DELETE/WHERE requests, in
+        which the blank nodes are variables matching any blank node.
+        Triples sharing a blank node are matched together in the same
+        request.
+        """
+        self._check_endpoint()
+        data = []
+        bnode_triples = []
+        for triple in triples:
+            if _bnodes(triple):
+                bnode_triples.append(triple)
+            elif None in triple:
+                self.remove(triple)
+            else:
+                data.append(triple)
+        self._update_data("DELETE", data)
+        for group in _bnode_groups(bnode_triples):
+            self._post_update(_delete_bnodes(group))
+
+    def _update_data(
+        self,
+        operation: str,
+        triples: "Iterable[Triple]",
+        graph: "Optional[str]" = None,
+    ):
+        """Help method sending chunks of `triples` with INSERT DATA or
+        DELETE DATA requests.
+
+        Arguments:
+            operation: Either "INSERT" or "DELETE".
+            triples: Triples to send.
+            graph: If given, the IRI of the named graph to update.
+        """
+        requests = (
+            f"{operation} DATA {{\n{_in_graph(chunk, graph)}}}"
+            for chunk in self._chunks(triples)
         )
-        query = f"INSERT DATA {{\n{spec}\n}}"
+        if self.update_workers > 1:
+            with ThreadPoolExecutor(self.update_workers) as executor:
+                # Consume the results to propagate exceptions
+                for _ in executor.map(self._post_update, requests):
+                    pass
+        else:
+            for request in requests:
+                self._post_update(request)
 
-        self.sparql.setReturnFormat(TURTLE)
-        self.sparql.setMethod(POST)
-        self.sparql.setQuery(query)
-        return self.sparql.query()
+    def _chunks(self, triples: "Iterable[Triple]") -> "Iterator[str]":
+        """Help method that formats `triples` and yields them as chunks
+        within the limits given by `update_chunk_size` and
+        `update_chunk_bytes`."""
+        lines: "List[str]" = []
+        size = 0
+        for triple in triples:
+            line = f"  {' '.join(_n3(value) for value in triple)} .\n"
+            nbytes = len(line.encode("utf-8"))
+            if lines and (
+                len(lines) >= self.update_chunk_size
+                or size + nbytes > self.update_chunk_bytes
+            ):
+                yield "".join(lines)
+                lines, size = [], 0
+            lines.append(line)
+            size += nbytes
+        if lines:
+            yield "".join(lines)
+
+    def _post_update(self, query: str) -> None:
+        """Help method sending update `query` to the update endpoint."""
+        sparql = self.sparql
+        sparql.setReturnFormat(TURTLE)
+        sparql.setMethod(POST)
+        sparql.setQuery(query)
+        sparql.query()
+
+    def remove(
+        self, triple: "Triple", graph: "Optional[str]" = None
+    ) -> "QueryResult":
+        """Remove all matching triples from the backend, or from the named
+        graph `graph` if it is given.
 
-    def remove(self, triple: "Triple") -> "QueryResult":
-        """Remove all matching triples from the backend."""
+        Blank nodes in `triple` match any blank node.
+        """
         self._check_endpoint()
+        if _bnodes(triple):
+            self.sparql.setReturnFormat(TURTLE)
+            self.sparql.setMethod(POST)
+            self.sparql.setQuery(_delete_bnodes([triple], graph))
+            return self.sparql.query()
+
         spec = " ".join(
             (
                 f"?{name}"
@@ -290,7 +714,7 @@ class SparqlwrapperStrategy:
         )
         query = f"""
         DELETE WHERE {{
-          {spec} .
+          {_in_graph(f"{spec} .", graph)}
         }}
         """
 
@@ -299,6 +723,11 @@ class SparqlwrapperStrategy:
         self.sparql.setQuery(query)
         return self.sparql.query()
 
+    def drop_graph(self, graph: str) -> None:
+        """Remove the named graph `graph` and all its triples."""
+        self._check_endpoint()
+        self._post_update(f"DROP SILENT GRAPH {_n3(graph)}")
+
     def _check_endpoint(self):
         """Check if the update endpoint is valid"""
         if not self.sparql.isSparqlUpdateRequest() and self.update_iri is None:
@@ -310,6 +739,985 @@ class SparqlwrapperStrategy:
                 "or update it with ts.backend.update_iri = ..."
             )
 
+    # Asynchronous methods
+    # --------------------
+    # These methods send their requests using asyncio, such that many
+    # requests can be in flight at the same time without a thread per
+    # request.  They are used by `tripper.triplestore_async`.
+
+    async def aclose(self) -> None:
+        """Close the idle keep-alive connections of the asynchronous
+        methods in the running event loop."""
+        close_idle_streams()
+
+    async def aquery(
+        self,
+        query_object: str,
+        **kwargs,  # pylint: disable=unused-argument
+    ) -> "Union[List[Tuple[str, ...]], bool, List[Triple]]":
+        """Asynchronous version of `query()`.
+
+        The result of CONSTRUCT and DESCRIBE queries is returned as a
+        list of triples instead of a generator.
+        """
+        query_type = self._get_sparql_query_type(query_object)
+
+        if query_type == "ASK":
+            _, body = await self._arequest(
+                self._query_url(query_object), accept=JSON_MEDIATYPE
+            )
+            return json.loads(body)["boolean"]
+
+        if query_type in ("CONSTRUCT", "DESCRIBE"):
+            mediatype, body = await self._arequest(
+                self._query_url(query_object),
+                accept="application/n-triples,text/turtle;q=0.5",
+            )
+            if mediatype in NTRIPLES_MEDIATYPES:
+                return list(decode_ntriples(body.splitlines()))
+            return list(_parse_turtle(body))
+
+        if query_type == "SELECT":
+            _, rows = await self._aselect(query_object)
+            return [tuple(row) for row in rows]
+
+        raise NotImplementedError(
+            f"Query type '{query_type}' not implemented."
+        )
+
+    async def aupdate(
+        self,
+        update_object: str,
+        **kwargs,  # pylint: disable=unused-argument
+    ) -> None:
+        """Asynchronous version of `update()`."""
+        query_type = self._get_sparql_query_type(update_object)
+        if query_type not in ("DELETE", "INSERT"):
+            raise NotImplementedError(
+                f"Update query type '{query_type}' not implemented."
+            )
+        await self._apost_update(update_object)
+
+    async def atriples(
+        self, triple: "OptionalTriple", graph: "Optional[str]" = None
+    ) -> "List[Triple]":
+        """Asynchronous version of `triples()`.
+
+        Returns a list with all matching triples.  They are fetched in
+        pages of `page_size` triples like in `triples()`.
+        """
+        variables = " ".join(
+            f"?{name}" for name, value in zip("spo", triple) if value is None
+        )
+        if not variables:  # all terms bound
+            found = await self.aask(triple, graph=graph)
+            return [triple] if found else []  # type: ignore
+
+        pattern = _in_graph(f"{_pattern(triple)} .", graph)
+        query = f"SELECT {variables} WHERE {{ {pattern} }}"
+        if self.page_size:
+            query += f" ORDER BY {variables} LIMIT {int(self.page_size)}"
+
+        result: "List[Triple]" = []
+        while True:
+            offset = len(result)
+            names, rows = await self._aselect(
+                f"{query} OFFSET {offset}" if offset else query
+            )
+            result.extend(_as_triple(triple, names, row) for row in rows)
+            if not self.page_size or len(result) - offset < self.page_size:
+                return result
+
+    async def aask(
+        self, triple: "OptionalTriple", graph: "Optional[str]" = None
+    ) -> bool:
+        """Asynchronous version of `ask()`."""
+        pattern = _in_graph(f"{_pattern(triple)} .", graph)
+        return await self.aquery(f"ASK {{ {pattern} }}")  # type: ignore
+
+    async def aadd_triples(
+        self, triples: "Iterable[Triple]", graph: "Optional[str]" = None
+    ) -> None:
+        """Asynchronous version of `add_triples()`.
+
+        Up to `update_workers` INSERT DATA requests are sent concurrently.
+        """
+        self._check_endpoint()
+        await self._aupdate_data("INSERT", triples, graph=graph)
+
+    async def aremove(
+        self, triple: "OptionalTriple", graph: "Optional[str]" = None
+    ) -> None:
+        """Asynchronous version of `remove()`."""
+        self._check_endpoint()
+        if _bnodes(triple):
+            await self._apost_update(_delete_bnodes([triple], graph))
+        else:
+            pattern = _in_graph(f"{_pattern(triple)} .", graph)
+            await self._apost_update(f"DELETE WHERE {{ {pattern} }}")
+
+    async def _aupdate_data(
+        self,
+        operation: str,
+        triples: "Iterable[Triple]",
+        graph: "Optional[str]" = None,
+    ) -> None:
+        """Asynchronous version of `_update_data()`.
+
+        Up to `update_workers` workers take chunks from the same
+        generator, such that the chunks are only formatted when a worker
+        is ready to send them.
+        """
+        chunks = self._chunks(triples)
+
+        async def worker():
+            for chunk in chunks:
+                await self._apost_update(
+                    f"{operation} DATA {{\n{_in_graph(chunk, graph)}}}"
+                )
+
+        await asyncio.gather(
+            *[worker() for _ in range(max(self.update_workers, 1))]
+        )
+
+    async def _aselect(
+        self, query: str, method: str = GET
+    ) -> "Tuple[List[str], Iterator[list]]":
+        """Asynchronous version of `_select()`."""
+        accept = (
+            TSV_MEDIATYPE if self.select_format == "tsv" else JSON_MEDIATYPE
+        )
+        if method == POST:
+            mediatype, body = await self._arequest(
+                self._sparql_kwargs["endpoint"],
+                data=urlencode({"query": query}).encode("utf-8"),
+                accept=accept,
+            )
+        else:
+            mediatype, body = await self._arequest(
+                self._query_url(query), accept=accept
+            )
+        if mediatype == TSV_MEDIATYPE:
+            return decode_tsv_results(body.splitlines())
+        return decode_json_results(json.loads(body))
+
+    async def _apost_update(self, query: str) -> None:
+        """Asynchronous version of `_post_update()`."""
+        await self._arequest(
+            str(self.update_iri),
+            data=urlencode({"update": query}).encode("utf-8"),
+        )
+
+    def _query_url(self, query: str) -> str:
+        """Return URL for sending `query` with a GET request."""
+        url = self._sparql_kwargs["endpoint"]
+        sep = "&" if "?" in url else "?"
+        return f"{url}{sep}{urlencode({'query': query})}"
+
+    async def _arequest(
+        self,
+        url: str,
+        data: "Optional[bytes]" = None,
+        accept: str = "*/*",
+    ) -> "Tuple[str, bytes]":
+        """Help method that sends a request to the endpoint.
+
+        Arguments:
+            url: URL to send the request to.
+            data: Form-encoded body of a POST request.  If None, a GET
+                request is sent.
+            accept: Value of the Accept header.
+
+        Returns:
+            A `(mediatype, body)` tuple with the media type and body of
+            the response.
+
+        Note:
+            Requests that must go through a proxy or use digest
+            authentication are sent with urllib in an executor thread.
+        """
+        sparql = self.sparql
+        headers = {"Accept": accept, "User-Agent": sparql.agent}
+        if data is not None:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        username, password = self._credentials
+        digest = sparql.http_auth == DIGEST
+        if username and password and not digest:
+            credentials = f"{username}:{password}".encode("utf-8")
+            headers["Authorization"] = (
+                f"Basic {base64.b64encode(credentials).decode('ascii')}"
+            )
+        headers.update(sparql.customHttpHeaders)
+        request = urllib.request.Request(
+            url, data=data, headers=headers, method="POST" if data else "GET"
+        )
+
+        try:
+            if is_direct(url) and not digest:
+                message, body = await async_urlopen(
+                    request, sparql.timeout, pool_size=self.pool_size
+                )
+            else:
+                opener = urllib.request.build_opener()
+                if digest and username and password:
+                    mgr = urllib.request.HTTPPasswordMgrWithDefaultRealm()
+                    mgr.add_password(None, url, username, password)
+                    opener.add_handler(
+                        urllib.request.HTTPDigestAuthHandler(mgr)
+                    )
+
+                def urlopen():
+                    with opener.open(request, timeout=sparql.timeout) as resp:
+                        return resp.info(), resp.read()
+
+                loop = asyncio.get_running_loop()
+                message, body = await loop.run_in_executor(None, urlopen)
+        except urllib.error.HTTPError as exc:
+            error = _HTTP_ERRORS.get(exc.code)
+            if error:
+                raise error(exc.read()) from exc
+            raise
+        return message.get("Content-Type", "").split(";")[0].strip(), body
+
+
+class PooledSPARQLWrapper(SPARQLWrapper):
+    """SPARQLWrapper that sends its requests over keep-alive connections
+    from a connection pool shared by all instances connecting to the same
+    host.
+
+    Requests fall back to the default urllib transport if pooling is
+    disabled (`pool_size` is zero), if the request is sent via a proxy
+    or if digest authentication is used.
+    """
+
+    # Maximum number of idle connections to keep per host
+    pool_size = 10
+
+    # If not None, overrides the Accept header of the next request
+    accept: "Optional[str]" = None
+
+    def _getAcceptHeader(self) -> str:
+        if self.accept:
+            return self.accept
+        return super()._getAcceptHeader()
+
+    def _query(self) -> "Tuple[Any, str]":
+        if self.pool_size <= 0 or self.http_auth == DIGEST:
+            return super()._query()
+
+        request = self._createRequest()
+        pool = get_connection_pool(request.full_url, self.pool_size)
+        if pool is None:
+            return super()._query()
+
+        try:
+            response = pool.urlopen(
+                request,
+                timeout=self.timeout,
+                preload=self.isSparqlUpdateRequest(),
+            )
+        except urllib.error.HTTPError as exc:
+            error = _HTTP_ERRORS.get(exc.code)
+            if error:
+                raise error(exc.read()) from exc
+            raise
+        return response, self.returnFormat
+
+
+# Media types of SPARQL JSON and TSV results
+JSON_MEDIATYPE = "application/sparql-results+json"
+TSV_MEDIATYPE = "text/tab-separated-values"
+
+# Map HTTP error codes to the exceptions raised by SPARQLWrapper
+_HTTP_ERRORS = {
+    400: QueryBadFormed,
+    401: Unauthorized,
+    404: EndPointNotFound,
+    414: URITooLong,
+    500: EndPointInternalError,
+}
+
+# Connection pools shared per (scheme, host) and a lock protecting them
+_connection_pools: "Dict[Tuple[str, str], ConnectionPool]" = {}
+_connection_pools_lock = threading.Lock()
+
+
+def get_connection_pool(
+    url: str, maxsize: int = 10
+) -> "Optional[ConnectionPool]":
+    """Return the shared connection pool for the host of `url`.
+
+    Returns None if requests to `url` should go through a proxy, in
+    which case the default urllib transport should be used.
+    """
+    if not is_direct(url):
+        return None
+    parts = urlsplit(url)
+    scheme, netloc = parts.scheme.lower(), parts.netloc
+    with _connection_pools_lock:
+        pool = _connection_pools.get((scheme, netloc))
+        if pool is None:
+            pool = ConnectionPool(scheme, netloc, maxsize=maxsize)
+            _connection_pools[(scheme, netloc)] = pool
+        pool.maxsize = max(pool.maxsize, maxsize)
+        return pool
+
+
+def is_direct(url: str) -> bool:
+    """Return whether requests to `url` can be sent directly to the host,
+    i.e. whether `url` is a HTTP(S) URL that should not go through a
+    proxy."""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https"):
+        return False
+    return scheme not in urllib.request.getproxies() or bool(
+        urllib.request.proxy_bypass(parts.hostname or "")
+    )
+
+
+class ConnectionPool:
+    """A thread-safe pool of keep-alive HTTP connections to one host.
+
+    Connections are taken from the pool when a request is sent and
+    returned to it when the response has been read.  The number of
+    simultaneous connections is not limited, but at most `maxsize` idle
+    connections are kept open.
+
+    Arguments:
+        scheme: Either "http" or "https".
+        netloc: Host name with optional port number.
+        maxsize: Maximum number of idle connections to keep open.
+    """
+
+    def __init__(self, scheme: str, netloc: str, maxsize: int = 10) -> None:
+        self.scheme = scheme
+        self.netloc = netloc
+        self.maxsize = maxsize
+        self._idle: "List[http.client.HTTPConnection]" = []
+        self._lock = threading.Lock()
+        self._context = ssl.create_default_context()
+
+    def urlopen(
+        self,
+        request: "urllib.request.Request",
+        timeout: "Optional[float]" = None,
+        preload: bool = False,
+    ) -> "PooledResponse":
+        """Send `request` and return the response.
+
+        Arguments:
+            request: The request to send.
+            timeout: Socket timeout in seconds.
+            preload: Whether to read the response body immediately and
+                return the connection to the pool.
+
+        Returns:
+            A file-like response object.
+
+        Raises:
+            urllib.error.HTTPError: If the server responds with an error.
+        """
+        headers = dict(request.header_items())
+        body: "Any" = request.data
+
+        # A request can only be retried if its body can be sent again
+        start = (
+            body.tell()
+            if hasattr(body, "seekable") and body.seekable()
+            else None
+        )
+        rewindable = (
+            body is None or isinstance(body, bytes) or start is not None
+        )
+
+        conn = self._get()
+        reused = conn is not None
+        while True:
+            if conn is None:
+                conn = self._connect(timeout)
+            else:
+                conn.timeout = timeout
+                if conn.sock:
+                    conn.sock.settimeout(timeout)
+            try:
+                conn.request(
+                    request.get_method(),
+                    request.selector,
+                    body=body,
+                    headers=headers,
+                    encode_chunked="Transfer-encoding" in headers,
+                )
+                response = conn.getresponse()
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                if (
+                    reused
+                    and rewindable
+                    and isinstance(
+                        exc, (ConnectionError, http.client.BadStatusLine)
+                    )
+                ):
+                    # The server closed the idle connection, retry once
+                    # with a new connection
+                    if start is not None:
+                        body.seek(start)
+                    conn, reused = None, False
+                    continue
+                raise urllib.error.URLError(exc) from exc
+            break
+
+        if response.status >= 400:
+            body = response.read()
+            self.release(conn, response)
+            raise urllib.error.HTTPError(
+                request.full_url,
+                response.status,
+                response.reason,
+                response.headers,
+                io.BytesIO(body),
+            )
+        return PooledResponse(
+            response, conn, self, request.full_url, preload=preload
+        )
+
+    def clear(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def release(
+        self,
+        conn: "http.client.HTTPConnection",
+        response: "http.client.HTTPResponse",
+    ) -> None:
+        """Return `conn` to the pool after `response` has been read."""
+        if not response.will_close:
+            with self._lock:
+                if len(self._idle) < self.maxsize:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+
+    def _connect(
+        self, timeout: "Optional[float]"
+    ) -> "http.client.HTTPConnection":
+        """Return a new connection."""
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(
+                self.netloc, timeout=timeout, context=self._context
+            )
+        return http.client.HTTPConnection(self.netloc, timeout=timeout)
+
+    def _get(self) -> "Optional[http.client.HTTPConnection]":
+        """Return an idle connection or None if there are none."""
+        with self._lock:
+            return self._idle.pop() if self._idle else None
+
+
+class PooledResponse:
+    """File-like response returned by `ConnectionPool.urlopen()`.
+
+    The connection is returned to the pool when the body has been read
+    to the end.  Closing the response before that closes the connection.
+    """
+
+    def __init__(
+        self,
+        response: "http.client.HTTPResponse",
+        conn: "http.client.HTTPConnection",
+        pool: "ConnectionPool",
+        url: str,
+        preload: bool = False,
+    ) -> None:
+        self.response = response
+        self.url = url
+        self._conn: "Optional[http.client.HTTPConnection]" = conn
+        self._pool = pool
+        self._fp: "Any" = response
+        if preload:
+            self._fp = io.BytesIO(response.read())
+            self._done()
+
+    def read(self, amt: "Optional[int]" = None) -> bytes:
+        """Read and return up to `amt` bytes, or all if `amt` is None."""
+        data = self._fp.read(amt)
+        self._done()
+        return data
+
+    def readline(self, limit: int = -1) -> bytes:
+        """Read and return one line."""
+        line = self._fp.readline(limit)
+        self._done()
+        return line
+
+    def __iter__(self):
+        return iter(self.readline, b"")
+
+    def info(self) -> "http.client.HTTPMessage":
+        """Return the response headers."""
+        return self.response.headers
+
+    def geturl(self) -> str:
+        """Return the URL of the request."""
+        return self.url
+
+    def getcode(self) -> int:
+        """Return the HTTP status code."""
+        return self.response.status
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self) -> None:
+        """Close the response."""
+        # `_conn` is unset if __init__() failed before __del__() is called
+        conn = getattr(self, "_conn", None)
+        if conn is not None:
+            conn.close()
+            self._conn = None
+            self._fp.close()
+
+    def _done(self) -> None:
+        """Return the connection to the pool if the response is read."""
+        if self._conn is not None and self.response.isclosed():
+            self._pool.release(self._conn, self.response)
+            self._conn = None
+
+
+# Idle keep-alive connections of `async_urlopen()`.  Streams are bound to
+# the event loop that created them, so this maps event loops to dicts
+# mapping `(scheme, netloc)` to lists of idle `(reader, writer)` tuples.
+_idle_streams: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+async def async_urlopen(
+    request: "urllib.request.Request",
+    timeout: "Optional[float]" = None,
+    pool_size: int = 0,
+) -> "Tuple[http.client.HTTPMessage, bytes]":
+    """Send `request` using asyncio streams and return the response.
+
+    If `pool_size` is zero, the request is sent over a new connection,
+    which is closed when the response has been read.  Otherwise the
+    connection is kept alive and reused by later requests to the same
+    host from the same event loop.  Proxies are not supported, see
+    `is_direct()`.
+
+    Arguments:
+        request: The request to send.  Its body must be bytes or None.
+        timeout: Timeout in seconds for the whole request.
+        pool_size: Maximum number of idle keep-alive connections to keep
+            per host.  See `close_idle_streams()`.
+
+    Returns:
+        A `(headers, body)` tuple with the response headers and body.
+
+    Raises:
+        urllib.error.HTTPError: If the server responds with an error.
+    """
+    parts = urlsplit(request.full_url)
+    https = parts.scheme.lower() == "https"
+    idle: "List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]" = (
+        _idle_streams.setdefault(asyncio.get_running_loop(), {}).setdefault(
+            (parts.scheme.lower(), parts.netloc), []
+        )
+        if pool_size > 0
+        else []
+    )
+    while True:
+        reused = bool(idle)
+        if reused:
+            reader, writer = idle.pop()
+        else:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    parts.hostname,
+                    parts.port or (443 if https else 80),
+                    ssl=ssl.create_default_context() if https else None,
+                ),
+                timeout,
+            )
+        try:
+            status, reason, headers, body, keep_alive = await asyncio.wait_for(
+                _exchange(
+                    reader, writer, request, parts.netloc, pool_size > 0
+                ),
+                timeout,
+            )
+        except (ConnectionError, asyncio.IncompleteReadError):
+            writer.close()
+            if reused:  # the server has closed the idle connection
+                continue
+            raise
+        except BaseException:
+            writer.close()
+            raise
+        break
+
+    if keep_alive and len(idle) < pool_size:
+        idle.append((reader, writer))
+    else:
+        writer.close()
+
+    if status >= 400:
+        raise urllib.error.HTTPError(
+            request.full_url, status, reason, headers, io.BytesIO(body)
+        )
+    return headers, body
+
+
+def close_idle_streams() -> None:
+    """Close the idle keep-alive connections of `async_urlopen()` in the
+    running event loop."""
+    hosts = _idle_streams.pop(asyncio.get_running_loop(), {})
+    for streams in hosts.values():
+        for _, writer in streams:
+            writer.close()
+
+
+async def _exchange(
+    reader: "asyncio.StreamReader",
+    writer: "asyncio.StreamWriter",
+    request: "urllib.request.Request",
+    host: str,
+    keep_alive: bool = False,
+) -> "Tuple[int, str, http.client.HTTPMessage, bytes, bool]":
+    """Help function for `async_urlopen()` that writes `request` and
+    returns a `(status, reason, headers, body, keep_alive)` tuple.
+
+    The returned `keep_alive` is true if `keep_alive` is true and the
+    connection can be reused for another request.
+    """
+    data: "Optional[bytes]" = request.data  # type: ignore
+    headers = {
+        "Host": host,
+        "Connection": "keep-alive" if keep_alive else "close",
+    }
+    headers.update(request.header_items())
+    if data is not None:
+        headers["Content-Length"] = str(len(data))
+    lines = [f"{request.get_method()} {request.selector} HTTP/1.1"]
+    lines.extend(f"{key}: {value}" for key, value in headers.items())
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+    if data:
+        writer.write(data)
+    await writer.drain()
+
+    statusline = await reader.readline()
+    if not statusline:
+        raise ConnectionResetError("Connection closed by the server")
+    version, status, reason = (
+        statusline.decode("latin-1").rstrip("\r\n") + " "
+    ).split(" ", 2)
+    raw = []
+    while True:
+        line = await reader.readline()
+        raw.append(line)
+        if line in (b"\r\n", b"\n", b""):
+            break
+    message = http.client.parse_headers(io.BytesIO(b"".join(raw)))
+
+    if message.get("Transfer-Encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if not size:
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        body = b"".join(chunks)
+    elif "Content-Length" in message:
+        body = await reader.readexactly(int(message["Content-Length"]))
+    elif int(status) in (204, 304):
+        body = b""
+    else:
+        body = await reader.read()
+        keep_alive = False
+    keep_alive = (
+        keep_alive
+        and version == "HTTP/1.1"
+        and message.get("Connection", "").lower() != "close"
+    )
+    return int(status), reason.strip(), message, body, keep_alive
+
+
+# Map rdflib format names to media types accepted by the Graph Store
+# HTTP Protocol
+GRAPH_MEDIATYPES = {
+    "turtle": "text/turtle",
+    "ttl": "text/turtle",
+    "nt": "application/n-triples",
+    "ntriples": "application/n-triples",
+    "nt11": "application/n-triples",
+    "n3": "text/n3",
+    "xml": "application/rdf+xml",
+    "application/rdf+xml": "application/rdf+xml",
+    "json-ld": "application/ld+json",
+    "jsonld": "application/ld+json",
+}
+
+
+def _read_chunks(
+    fileobj: "Any", chunk_size: int = 1 << 16
+) -> "Iterator[bytes]":
+    """Yield the content of file-like object `fileobj` as chunks of
+    bytes."""
+    for chunk in iter(lambda: fileobj.read(chunk_size), ""):
+        if not chunk:
+            break
+        yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+def _n3(value: str) -> str:
+    """Return `value` formatted as a SPARQL term."""
+    if isinstance(value, Literal):
+        return value.n3()
+    return value if value.startswith("<") else f"<{value}>"
+
+
+def _pattern(triple: "OptionalTriple") -> str:
+    """Return `triple` formatted as a SPARQL triple pattern, with
+    variables ?s, ?p and ?o for unbound terms."""
+    return " ".join(
+        f"?{name}" if value is None else _n3(value)
+        for name, value in zip("spo", triple)
+    )
+
+
+def _is_bnode(value: "Optional[str]") -> bool:
+    """Return whether `value` is a blank node."""
+    return (
+        value is not None
+        and not isinstance(value, Literal)
+        and value.startswith("_:")
+    )
+
+
+def _bnodes(triple: "OptionalTriple") -> "List[str]":
+    """Return a list with the blank nodes in `triple`."""
+    return [
+        value for value in triple if value is not None and _is_bnode(value)
+    ]
+
+
+def _bnode_groups(
+    triples: "Iterable[OptionalTriple]",
+) -> "List[List[OptionalTriple]]":
+    """Return `triples` grouped such that triples sharing a blank node
+    are in the same group."""
+    # Union-find over blank node labels
+    parent: "Dict[str, str]" = {}
+
+    def find(label: str) -> str:
+        while parent.setdefault(label, label) != label:
+            label = parent[label]
+        return label
+
+    triples = list(triples)
+    for triple in triples:
+        roots = [find(label) for label in _bnodes(triple)]
+        for root in roots[1:]:
+            parent[root] = roots[0]
+
+    groups: "Dict[str, List[OptionalTriple]]" = {}
+    for triple in triples:
+        groups.setdefault(find(_bnodes(triple)[0]), []).append(triple)
+    return list(groups.values())
+
+
+def _delete_bnodes(
+    triples: "Iterable[OptionalTriple]", graph: "Optional[str]" = None
+) -> str:
+    """Return a DELETE/WHERE request removing `triples`, optionally from
+    the named graph `graph`.
+
+    Blank nodes are rendered as variables that only match blank nodes and
+    unbound terms as variables that match anything.
+    """
+    variables: "Dict[str, str]" = {}
+    lines = []
+    nunbound = 0
+    for triple in triples:
+        terms = []
+        for value in triple:
+            if value is None:
+                terms.append(f"?u{nunbound}")
+                nunbound += 1
+            elif _is_bnode(value):
+                terms.append(
+                    variables.setdefault(value, f"?b{len(variables)}")
+                )
+            else:
+                terms.append(_n3(value))
+        lines.append(f"  {' '.join(terms)} .\n")
+    template = "".join(lines)
+    condition = " && ".join(f"isBlank({var})" for var in variables.values())
+    pattern = f"{template}  FILTER({condition})\n"
+    return (
+        f"DELETE {{\n{_in_graph(template, graph)}}}\n"
+        f"WHERE {{\n{_in_graph(pattern, graph)}}}"
+    )
+
+
+def _in_graph(pattern: str, graph: "Optional[str]") -> str:
+    """Return `pattern` wrapped in a GRAPH block if `graph` is given."""
+    if graph is None:
+        return pattern
+    return f"GRAPH {_n3(graph)} {{\n{pattern}}}\n"
+
+
+def _as_triple(triple: "OptionalTriple", names: "List[str]", row: list):
+    """Return `triple` with unbound terms replaced with the values in
+    `row` for the variables ?s, ?p and ?o."""
+    values = dict(zip(names, row))
+    return tuple(
+        values[name] if value is None else value
+        for name, value in zip("spo", triple)
+    )
+
+
+# Media types of N-Triples.  "text/plain" is an old media type that
+# still is used by some triplestores.
+NTRIPLES_MEDIATYPES = ("application/n-triples", "text/plain")
+
+
+def decode_tsv_term(
+    cell: str, literals: "Optional[dict]" = None
+) -> "Optional[Union[str, Literal]]":
+    """Convert a cell in SPARQL TSV results to a tripper type.
+
+    Cells are RDF terms in Turtle syntax.  Empty cells (unbound variables)
+    are converted to None.  IRIs, blank nodes and quoted literals are
+    parsed with `tripper.ntriples.parse_term()`, which reuses the literals
+    in the optional dict `literals`.
+
+    Examples:
+
+    >>> decode_tsv_term("<http://example.com#a>")
+    'http://example.com#a'
+    >>> decode_tsv_term('"Hello"@en')
+    Literal('Hello', lang='en')
+    >>> decode_tsv_term("42")
+    Literal('42', datatype='http://www.w3.org/2001/XMLSchema#integer')
+
+    """
+    if not cell:
+        return None
+    if cell[0] in '<"_':
+        return parse_term(cell, literals=literals)
+    # Turtle abbreviations of booleans and numbers
+    if cell in ("true", "false"):
+        return Literal(cell, datatype=XSD.boolean)
+    if "e" in cell or "E" in cell:
+        return Literal(float(cell))  # xsd:double in canonical form
+    if "." in cell:
+        return Literal(cell, datatype=XSD.decimal)
+    return Literal(int(cell))  # xsd:integer in canonical form
+
+
+def decode_tsv_row(line: bytes, literals: "Optional[dict]" = None) -> list:
+    """Convert a line in SPARQL TSV results to a list of tripper types."""
+    return [
+        decode_tsv_term(cell, literals)
+        for cell in line.decode("utf-8").rstrip("\r\n").split("\t")
+    ]
+
+
+def decode_tsv_results(
+    lines: "Iterable[bytes]",
+) -> "Tuple[List[str], Iterator[list]]":
+    """Decode SELECT results in SPARQL TSV format.
+
+    Arguments:
+        lines: Iterable over the lines of the results.
+
+    Returns:
+        A `(names, rows)` tuple, where `names` is a list with the names
+        of the selected variables and `rows` is an iterator over lists of
+        tripper terms.  The rows are decoded as they are consumed.
+    """
+    lines = iter(lines)
+    header = next(lines, b"").decode("utf-8").rstrip("\r\n")
+    names = [name.lstrip("?$") for name in header.split("\t")]
+    literals: "dict" = {}
+    return names, (decode_tsv_row(line, literals) for line in lines)
+
+
+def decode_json_results(ret: dict) -> "Tuple[List[str], Iterator[list]]":
+    """Decode SELECT results in SPARQL JSON format.
+
+    Arguments:
+        ret: Dict with the parsed JSON results.
+
+    Returns:
+        Same as `decode_tsv_results()`.
+    """
+    names = ret["head"]["vars"]
+    return names, (
+        [
+            (
+                convert_json_entrydict(binding[name])
+                if name in binding
+                else None
+            )
+            for name in names
+        ]
+        for binding in ret["results"]["bindings"]
+    )
+
+
+def decode_ntriples(
+    lines: "Iterable[bytes]",
+) -> "Generator[Triple, None, None]":
+    """Return a generator over the triples in N-Triples `lines`.
+
+    The lines are parsed with `tripper.ntriples.parse_line()`.  Empty
+    lines and comments are skipped.
+
+    Examples:
+
+    >>> list(decode_ntriples([
+    ...     b'<http://ex.com#a> <http://ex.com#b> "x y"@en .'
+    ... ]))
+    [('http://ex.com#a', 'http://ex.com#b', Literal('x y', lang='en'))]
+
+    """
+    literals: "dict" = {}
+    for line in lines:
+        triple = parse_line(line.decode("utf-8"), literals=literals)
+        if triple is not None:
+            yield triple  # type: ignore
+
+
+def _response_lines(response: "Any") -> "Generator[bytes, None, None]":
+    """Returns a generator over the lines of HTTP `response`.
+
+    The response is closed when the generator is exhausted, closed or
+    garbage collected, such that its connection is never leaked if the
+    consumer stops early.
+    """
+    try:
+        yield from response
+    finally:
+        response.close()
+
+
+def _parse_turtle(data: bytes) -> "Iterator[Triple]":
+    """Parse Turtle `data` with rdflib and return an iterator over the
+    triples."""
+    graph = Graph()
+    graph.parse(data=data.decode("utf-8"), format="turtle")
+    return _convert_triples_to_tripper(graph)
+
 
 def convert_json_entrydict(entrydict: dict) -> str:
     """Convert SPARQLWrapper json entry dict (representing a single IRI or
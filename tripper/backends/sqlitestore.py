@@ -0,0 +1,345 @@
+"""A persistent rdflib store saving the triples in an SQLite database.
+
+The store is used by the rdflib backend when it is created with
+`store="sqlite:<path>"`.  Since the triples are kept on disk, opening an
+existing database takes constant time and changes are written
+incrementally, instead of parsing and serialising the whole graph.
+
+Example:
+
+```python
+>>> import tempfile
+>>> from pathlib import Path
+>>> from tripper import RDFS, Triplestore
+
+>>> with tempfile.TemporaryDirectory() as tmpdir:
+...     path = Path(tmpdir) / "kb.sqlite"
+...     ts = Triplestore("rdflib", store=f"sqlite:{path}")
+...     EX = ts.bind("ex", "http://example.com#")
+...     ts.add((EX.Cat, RDFS.subClassOf, EX.Animal))
+...     ts.close()
+...
+...     ts = Triplestore("rdflib", store=f"sqlite:{path}")
+...     print(ts.value(EX.Cat, RDFS.subClassOf))
+...     ts.close()
+http://example.com#Animal
+
+```
+
+The store is context-aware, i.e. it supports rdflib `Dataset` and
+`ConjunctiveGraph` objects.  Only a single process should write to the
+database at a time.
+
+"""
+
+import sqlite3
+import threading
+from typing import TYPE_CHECKING
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.store import NO_STORE, VALID_STORE, Store
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Generator, Iterable, Optional, Tuple
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS triples (
+    s TEXT NOT NULL,
+    p TEXT NOT NULL,
+    o TEXT NOT NULL,
+    g TEXT NOT NULL,
+    PRIMARY KEY (s, p, o, g)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS triples_pos ON triples (p, o, s);
+CREATE INDEX IF NOT EXISTS triples_osp ON triples (o, s, p);
+CREATE INDEX IF NOT EXISTS triples_g ON triples (g);
+CREATE TABLE IF NOT EXISTS graphs (g TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS namespaces (
+    prefix TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL UNIQUE
+);
+"""
+
+# Version of the database layout, stored as the SQLite `user_version`.
+# Version 1 records all graphs with triples in the `graphs` table.
+_SCHEMA_VERSION = 1
+
+
+def encode(term: "Any") -> str:
+    """Encode an rdflib term as a string.
+
+    IRIs are prefixed with "<", blank nodes with "_:" and literals are
+    written as '"lexical"', '"lexical"@lang' or '"lexical"^^datatype'.
+    """
+    if isinstance(term, Graph):
+        term = term.identifier
+    if isinstance(term, URIRef):
+        return f"<{term}"
+    if isinstance(term, BNode):
+        return f"_:{term}"
+    if isinstance(term, Literal):
+        if term.language:
+            return f'"{term}"@{term.language}'
+        if term.datatype:
+            return f'"{term}"^^{term.datatype}'
+        return f'"{term}"'
+    raise TypeError(f"unsupported term type: {type(term)}")
+
+
+def decode(text: str) -> "Any":
+    """Decode a string returned by encode() to an rdflib term."""
+    if text[0] == "<":
+        return URIRef(text[1:])
+    if text[0] == "_":
+        return BNode(text[2:])
+    # Language tags and IRIs cannot contain '"', so the last '"' ends
+    # the lexical form
+    lexical, _, suffix = text[1:].rpartition('"')
+    if suffix.startswith("@"):
+        return Literal(lexical, lang=suffix[1:])
+    if suffix.startswith("^^"):
+        return Literal(lexical, datatype=suffix[2:])
+    return Literal(lexical)
+
+
+class SQLiteStore(Store):
+    """An rdflib store keeping the triples in an SQLite database.
+
+    The configuration passed to `open()` is the path to the database
+    file.  Changes are written to the database when `commit()` is called.
+    """
+
+    context_aware = True
+    graph_aware = True
+    transaction_aware = True
+    formula_aware = False
+
+    def __init__(self, configuration=None, identifier=None):
+        self._conn: "Optional[sqlite3.Connection]" = None
+        self._lock = threading.RLock()
+        super().__init__(configuration=configuration, identifier=identifier)
+
+    def open(self, configuration, create=False):
+        """Open the database file `configuration`.
+
+        Returns `VALID_STORE` or, if `create` is false and the database
+        has not been created, `NO_STORE`.
+        """
+        if not create:
+            try:
+                conn = sqlite3.connect(
+                    f"file:{configuration}?mode=rw",
+                    uri=True,
+                    check_same_thread=False,
+                )
+            except sqlite3.OperationalError:
+                return NO_STORE
+        else:
+            conn = sqlite3.connect(configuration, check_same_thread=False)
+        conn.executescript(_SCHEMA)
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version < _SCHEMA_VERSION:
+            # Databases written by older versions may have triples in
+            # graphs that are not recorded in the `graphs` table
+            conn.execute(
+                "INSERT OR IGNORE INTO graphs SELECT DISTINCT g FROM triples"
+            )
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        conn.commit()
+        self._conn = conn
+        return VALID_STORE
+
+    def close(self, commit_pending_transaction=False):
+        """Close the database.  Uncommitted changes are rolled back
+        unless `commit_pending_transaction` is true."""
+        if self._conn is not None:
+            if commit_pending_transaction:
+                self._conn.commit()
+            self._conn.close()
+            self._conn = None
+
+    def commit(self):
+        """Commit pending changes to the database."""
+        with self._lock:
+            self._db.commit()
+
+    def rollback(self):
+        """Discard pending changes."""
+        with self._lock:
+            self._db.rollback()
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """The database connection."""
+        if self._conn is None:
+            raise ValueError("the SQLite store is not open")
+        return self._conn
+
+    def add(self, triple, context, quoted=False):
+        """Add `triple` to `context`."""
+        self.addN([(*triple, context)])
+
+    def addN(self, quads):  # pylint: disable=invalid-name
+        """Add an iterable of `(s, p, o, context)` quads.
+
+        The graphs of the quads are recorded in the `graphs` table, such
+        that contexts() doesn't have to scan all triples.
+        """
+        graphs = set()
+
+        def rows():
+            for s, p, o, c in quads:
+                g = encode(c)
+                graphs.add(g)
+                yield encode(s), encode(p), encode(o), g
+
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO triples VALUES (?, ?, ?, ?)", rows()
+            )
+            self._db.executemany(
+                "INSERT OR IGNORE INTO graphs VALUES (?)",
+                [(g,) for g in graphs],
+            )
+
+    def remove(self, triple, context=None):
+        """Remove all triples matching the pattern `triple` from `context`
+        or from all contexts if `context` is None."""
+        where, args = _where(triple, context)
+        with self._lock:
+            self._db.execute(f"DELETE FROM triples{where}", args)  # nosec
+
+    def triples(self, triple_pattern, context=None):
+        """Returns a generator over `(triple, contexts)` pairs for the
+        triples matching `triple_pattern` in `context`, or in any
+        context if `context` is None."""
+        where, args = _where(triple_pattern, context)
+        if context is None:
+            sql = f"SELECT DISTINCT s, p, o FROM triples{where}"  # nosec
+        else:
+            sql = f"SELECT s, p, o FROM triples{where}"  # nosec
+        with self._lock:
+            rows = self._db.execute(sql, args)
+            batch = rows.fetchmany(1000)
+        while batch:
+            for s, p, o in batch:
+                triple = (decode(s), decode(p), decode(o))
+                yield triple, self._contexts(triple, context)
+            with self._lock:
+                batch = rows.fetchmany(1000)
+
+    def _contexts(self, triple, context) -> "Generator[Graph, None, None]":
+        """Returns a generator over the contexts of `triple`."""
+        if context is not None:
+            yield context
+        else:
+            yield from self.contexts(triple)
+
+    def __len__(self, context=None):
+        where, args = _where((None, None, None), context)
+        if context is None:
+            sql = "SELECT COUNT(*) FROM (SELECT DISTINCT s, p, o FROM triples)"
+        else:
+            sql = f"SELECT COUNT(*) FROM triples{where}"  # nosec
+        with self._lock:
+            return self._db.execute(sql, args).fetchone()[0]
+
+    def contexts(self, triple=None):
+        """Returns a generator over all contexts (graphs) containing
+        `triple`, or all contexts if `triple` is None."""
+        if triple is None or triple == (None, None, None):
+            sql = "SELECT g FROM graphs"
+            args: "Tuple" = ()
+        else:
+            where, args = _where(triple, None)
+            sql = f"SELECT DISTINCT g FROM triples{where}"  # nosec
+        with self._lock:
+            identifiers = [decode(g) for (g,) in self._db.execute(sql, args)]
+        for identifier in identifiers:
+            yield Graph(store=self, identifier=identifier)
+
+    def add_graph(self, graph):
+        """Add an empty named graph."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR IGNORE INTO graphs VALUES (?)", (encode(graph),)
+            )
+
+    def remove_graph(self, graph):
+        """Remove a named graph and all its triples."""
+        self.remove((None, None, None), graph)
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM graphs WHERE g = ?", (encode(graph),)
+            )
+
+    def bind(self, prefix, namespace, override=True):
+        """Bind `prefix` to `namespace`."""
+        with self._lock:
+            db = self._db
+            if override:
+                db.execute(
+                    "DELETE FROM namespaces WHERE prefix = ? OR namespace = ?",
+                    (prefix, str(namespace)),
+                )
+            db.execute(
+                "INSERT OR IGNORE INTO namespaces VALUES (?, ?)",
+                (prefix, str(namespace)),
+            )
+
+    def namespace(self, prefix):
+        """Returns the namespace bound to `prefix` or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT namespace FROM namespaces WHERE prefix = ?", (prefix,)
+            ).fetchone()
+        return URIRef(row[0]) if row else None
+
+    def prefix(self, namespace):
+        """Returns the prefix bound to `namespace` or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT prefix FROM namespaces WHERE namespace = ?",
+                (str(namespace),),
+            ).fetchone()
+        return row[0] if row else None
+
+    def namespaces(self):
+        """Returns a generator over all `(prefix, namespace)` pairs."""
+        with self._lock:
+            rows = self._db.execute("SELECT * FROM namespaces").fetchall()
+        for prefix, namespace in rows:
+            yield prefix, URIRef(namespace)
+
+    def query(self, query, initNs, initBindings, queryGraph, **kwargs):
+        """Not implemented.  rdflib evaluates SPARQL queries against the
+        triples of the store when this method raises NotImplementedError.
+        """
+        # pylint: disable=invalid-name
+        raise NotImplementedError("SQLiteStore cannot evaluate SPARQL")
+
+    def update(self, update, initNs, initBindings, queryGraph, **kwargs):
+        """Not implemented.  rdflib evaluates SPARQL updates against the
+        triples of the store when this method raises NotImplementedError.
+        """
+        # pylint: disable=invalid-name
+        raise NotImplementedError("SQLiteStore cannot evaluate SPARQL")
+
+
+def _where(
+    triple: "Iterable[Any]", context: "Any"
+) -> "Tuple[str, Tuple[str, ...]]":
+    """Help function returning a WHERE clause and its arguments for
+    matching the pattern `triple` in `context`."""
+    columns, args = [], []
+    for column, term in zip("spo", triple):
+        if term is not None:
+            columns.append(f"{column} = ?")
+            args.append(encode(term))
+    if context is not None:
+        columns.append("g = ?")
+        args.append(encode(context))
+    if not columns:
+        return "", ()
+    return " WHERE " + " AND ".join(columns), tuple(args)
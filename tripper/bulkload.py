@@ -0,0 +1,200 @@
+"""Parallel loading of large N-Triples and N-Quads files.
+
+N-Triples and N-Quads are line-oriented formats, so a file can be split
+into byte ranges on line boundaries and each range parsed independently.
+The `bulkload()` function parses the ranges in a pool of worker processes
+and adds the resulting triples to a triplestore in bulk, in file order.
+
+Example:
+
+```python
+>>> import tempfile
+>>> from pathlib import Path
+>>> from tripper import Triplestore
+>>> from tripper.bulkload import bulkload
+
+>>> with tempfile.TemporaryDirectory() as tmpdir:
+...     path = Path(tmpdir) / "kb.nt"
+...     _ = path.write_text(
+...         "<http://ex#Cat> <http://ex#subClassOf> <http://ex#Animal> .\\n"
+...     )
+...     ts = Triplestore("rdflib")
+...     bulkload(ts, path, workers=2)
+1
+
+```
+
+The chunks are parsed with `tripper.ntriples`.  Blank node labels are
+shared between the chunks of a file, but not between different loads.
+
+"""
+
+import os
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tripper.errors import ArgumentTypeError, ArgumentValueError
+from tripper.ntriples import FORMATS, parse
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Deque, List, Optional, Tuple, Union
+
+    from tripper.triplestore import Triplestore
+
+
+# Default size of the byte ranges parsed by the workers
+CHUNK_SIZE = 16 * 2**20
+
+# Formats inferred from file name suffixes
+SUFFIXES = {
+    ".nt": "ntriples",
+    ".ntriples": "ntriples",
+    ".nq": "nquads",
+    ".nquads": "nquads",
+}
+
+
+def line_ranges(
+    path: "Union[str, Path]", chunk_size: int = CHUNK_SIZE
+) -> "List[Tuple[int, int]]":
+    """Split the file `path` into byte ranges on line boundaries.
+
+    Arguments:
+        path: Path to the file to split.
+        chunk_size: Approximate size of each range in bytes.  A range
+            is extended to the end of the line it would otherwise end in.
+
+    Returns:
+        List of `(start, end)` byte offsets covering the whole file.
+    """
+    if chunk_size < 1:
+        raise ArgumentValueError("`chunk_size` must be positive")
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+    with open(path, "rb") as f:
+        while start < size:
+            end = start + chunk_size
+            if end < size:
+                # Read from the byte before `end`, such that `end` is
+                # kept if it already is at the start of a line
+                f.seek(end - 1)
+                f.readline()
+                end = f.tell()
+            else:
+                end = size
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def parse_range(
+    path: "Union[str, Path]",
+    start: int,
+    end: int,
+    format: str = "ntriples",  # pylint: disable=redefined-builtin
+    bnode_prefix: str = "",
+) -> "List[Tuple[Any, ...]]":
+    """Parse the byte range `start` to `end` of the file `path`.
+
+    Arguments:
+        path: Path to an N-Triples or N-Quads file.
+        start: Byte offset of the first line to parse.
+        end: Byte offset after the last line to parse.
+        format: Either "ntriples" or "nquads".
+        bnode_prefix: String inserted after "_:" in all blank node labels.
+
+    Returns:
+        List of `(s, p, o)` triples for N-Triples or `(s, p, o, graph)`
+        quads for N-Quads, with tripper terms.  `graph` is None for
+        triples in the default graph.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return list(parse(data=data, format=format, bnode_prefix=bnode_prefix))
+
+
+def bulkload(
+    ts: "Triplestore",
+    source: "Union[str, Path]",
+    format: "Optional[str]" = None,  # pylint: disable=redefined-builtin
+    workers: "Optional[int]" = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """Parse an N-Triples or N-Quads file in parallel and add the triples
+    to a triplestore.
+
+    The file is split into byte ranges on line boundaries, which are
+    parsed in a pool of worker processes.  The parsed triples are added
+    to `ts` with `add_triples()` in file order.  Quads in named graphs
+    are added to the corresponding graph, which requires a backend with
+    named-graph support.
+
+    Arguments:
+        ts: Triplestore to add the triples to.
+        source: Path to the file to load.
+        format: Either "ntriples" (or "nt") or "nquads" (or "nq").  By
+            default it is inferred from the file name suffix.
+        workers: Number of worker processes.  Defaults to the number of
+            CPUs.  If one or less, the file is parsed in the current
+            process.
+        chunk_size: Approximate size of the byte ranges in bytes.
+
+    Returns:
+        Number of parsed triples.
+    """
+    if not isinstance(source, (str, Path)):
+        raise ArgumentTypeError(
+            "`source` must be a file name when loading in parallel, "
+            f"got {type(source)}"
+        )
+    if format is None:
+        format = SUFFIXES.get(Path(source).suffix.lower())
+    if format not in FORMATS:
+        raise ArgumentValueError(
+            "can only load N-Triples or N-Quads in parallel, got format: "
+            f"{format}"
+        )
+    format = FORMATS[format]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    ranges = line_ranges(source, chunk_size)
+    prefix = f"{uuid.uuid4().hex[:8]}-"
+    ntriples = 0
+
+    def load(statements: "List[Tuple[Any, ...]]") -> None:
+        nonlocal ntriples
+        ntriples += len(statements)
+        if format == "ntriples":
+            ts.add_triples(statements)
+            return
+        graphs: "dict" = {}
+        for s, p, o, g in statements:
+            graphs.setdefault(g, []).append((s, p, o))
+        for graph, triples in graphs.items():
+            ts.add_triples(triples, graph=graph)
+
+    if workers <= 1 or len(ranges) <= 1:
+        for start, end in ranges:
+            load(parse_range(source, start, end, format, prefix))
+        return ntriples
+
+    # Only keep a limited number of parsed chunks in memory
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: "Deque" = deque()
+        for start, end in ranges:
+            pending.append(
+                executor.submit(
+                    parse_range, source, start, end, format, prefix
+                )
+            )
+            if len(pending) >= 2 * workers:
+                load(pending.popleft().result())
+        while pending:
+            load(pending.popleft().result())
+    return ntriples
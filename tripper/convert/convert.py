@@ -33,10 +33,11 @@ from typing import TYPE_CHECKING, Mapping, Sequence
 from uuid import uuid4
 
 from tripper import DCAT, DCTERMS, EMMO, MAP, OTEIO, OWL, RDF, RDFS, Literal
+from tripper.errors import UniquenessError
 from tripper.utils import parse_literal
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any, Dict, Optional, Union
+    from typing import Any, Dict, Optional, Tuple, Union
 
     from tripper import Triplestore
 
@@ -280,12 +281,17 @@ def load_container(
 
     if OTEIO.Dictionary in parents:
         container = {}
-        for pred, obj in ts.predicate_objects(iri):
+        items = list(ts.predicate_objects(iri))
+
+        keyvalues = _load_keyvalues(
+            ts,
+            iri,
+            [obj for pred, obj in items if pred == OTEIO.hasKeyValuePair],
+        )
+
+        for pred, obj in items:
             if pred == OTEIO.hasKeyValuePair:
-                key_iri = ts.value(obj, OTEIO.hasDictionaryKey)
-                key = ts.value(key_iri, EMMO.hasStringValue)
-                value_iri = ts.value(obj, OTEIO.hasDictionaryValue)
-                value = ts.value(value_iri, EMMO.hasDataValue)
+                key, value = keyvalues[obj]
                 container[str(key)] = get_obj(value)
             elif pred in recognised_iris:
                 container[recognised_iris[pred]] = get_obj(obj)
@@ -327,6 +333,49 @@ def load_container(
     return container
 
 
+def _load_keyvalues(
+    ts: "Triplestore", iri: str, pairs: "Sequence[str]"
+) -> "Dict[str, Tuple[Any, Any]]":
+    """Return a dict mapping each key-value pair in `pairs` of the dict
+    `iri` to a `(key, value)` tuple.
+
+    The keys and values of all pairs are looked up with two bulk
+    requests, instead of four requests per pair.
+    """
+    patterns = []
+    for pair, triples in zip(
+        pairs, ts.triples_many((pair, None, None) for pair in pairs)
+    ):
+        dct: "Dict[str, Any]" = {}
+        for _, p, o in triples:
+            if p in dct and p in (
+                OTEIO.hasDictionaryKey,
+                OTEIO.hasDictionaryValue,
+            ):
+                raise UniquenessError(
+                    f"More than one match: {(pair, p, None)}"
+                )
+            dct[p] = o
+        if OTEIO.hasDictionaryKey not in dct:
+            raise ValueError(f"Missing key of pair '{pair}' in dict: {iri}")
+        if OTEIO.hasDictionaryValue not in dct:
+            raise ValueError(f"Missing value of pair '{pair}' in dict: {iri}")
+        patterns.append(
+            (dct[OTEIO.hasDictionaryKey], EMMO.hasStringValue, None)
+        )
+        patterns.append(
+            (dct[OTEIO.hasDictionaryValue], EMMO.hasDataValue, None)
+        )
+
+    values = []
+    for (s, p, _), triples in zip(patterns, ts.triples_many(patterns)):
+        if len(triples) > 1:
+            raise UniquenessError(f"More than one match: {(s, p, None)}")
+        values.append(triples[0][2] if triples else None)
+    objects = iter(values)
+    return {pair: (next(objects), next(objects)) for pair in pairs}
+
+
 # === Deprecated functions ===
 
 
@@ -559,6 +559,7 @@ class Context:
         doc: "Union[dict, list]",
         force: "bool" = False,
         baseiri: "Optional[str]" = None,
+        graph: "Optional[str]" = None,
     ) -> "Triplestore":
         """Store JSON-LD document `doc` to triplestore `ts`.
 
@@ -570,6 +571,8 @@ class Context:
                 "http://falseiri/", unless baseiri is given.
             baseiri: If given, it will be used as a base iri to
                 resolve relative IRIs. (I.e. Not valid URLs).
+            graph: If given, the IRI of the named graph in `ts` to store
+                the document in.
 
         Returns:
             The Triplestore object created from the document.
@@ -610,7 +613,7 @@ class Context:
                     else:
                         raise NamespaceError(msg)
 
-        ts.parse(data=ts2.serialize(format="ntriples"), format="ntriples")
+        ts.add_triples(ts2.triples(), graph=graph)
 
         if isinstance(doc, dict) and "@context" in doc:
             ctx = self.copy()
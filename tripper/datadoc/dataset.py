@@ -403,8 +403,9 @@ def store(  # pylint: disable=too-many-arguments
     restrictions: "Optional[dict]" = None,
     baseiri: "Optional[str]" = None,
     unknown_key: str = "raise",
+    named_graph: bool = False,
 ) -> dict:
-    # pylint: disable=line-too-long,too-many-branches
+    # pylint: disable=line-too-long,too-many-branches,too-many-locals
     """Store documentation of a resource to a triplestore.
 
     Arguments:
@@ -442,6 +443,13 @@ def store(  # pylint: disable=too-many-arguments
             to call `infer_restriction_types()`.
         baseiri: If given, it will be used as a base iri to
             resolve relative IRIs. (I.e. Not valid URLs).
+        named_graph: If true, store each documented resource in a named
+            graph with the same IRI as the resource.  Overwriting the
+            documentation of the resource is then done by dropping the
+            named graph, which is much faster than deleting its triples
+            one by one.  Use `delete_iri()` with `named_graph=True` to
+            delete it.  Requires a backend with support for named graphs
+            (see `Triplestore.drop_graph()`).
 
     Returns:
         A copy of `source` updated to valid JSON-LD.
@@ -484,7 +492,11 @@ def store(  # pylint: disable=too-many-arguments
         iri = d["@id"]
         if ts.has(iri):
             if method == "overwrite":
-                delete_iri(ts, iri)
+                graph = ts.expand_iri(iri)
+                if named_graph and ts.has(iri, graph=graph):
+                    ts.drop_graph(graph)
+                else:
+                    delete_iri(ts, iri)
             elif method == "raise":
                 raise IRIExistsError(f"Cannot overwrite existing IRI: {iri}")
             elif method == "merge":
@@ -506,10 +518,16 @@ def store(  # pylint: disable=too-many-arguments
     # Validate the final JSON-LD before writing it to the triplestore.
     validate(doc, type=type, keywords=keywords, context=context)
 
-    context.to_triplestore(ts, doc, baseiri=baseiri)
+    if named_graph:
+        for d in docs:
+            graph = ts.expand_iri(d["@id"])
+            context.to_triplestore(ts, d, baseiri=baseiri, graph=graph)
+            save_extra_content(ts, d, graph=graph)
+    else:
+        context.to_triplestore(ts, doc, baseiri=baseiri)
 
-    # Add statements and data models to triplestore
-    save_extra_content(ts, doc)  # FIXME: SLOW!!
+        # Add statements and data models to triplestore
+        save_extra_content(ts, doc)  # FIXME: SLOW!!
 
     return doc
 
@@ -878,7 +896,9 @@ def update_restrictions(
     return source
 
 
-def save_extra_content(ts: Triplestore, source: dict) -> None:
+def save_extra_content(
+    ts: Triplestore, source: dict, graph: "Optional[str]" = None
+) -> None:
     """Save extra content in `source` to the triplestore.
 
     Currently, this includes:
@@ -887,6 +907,7 @@ def save_extra_content(ts: Triplestore, source: dict) -> None:
     Arguments:
         ts: Triplestore to load data from.
         source: Dict in multi-resource format.
+        graph: If given, the IRI of the named graph to save to.
 
     """
 
@@ -894,7 +915,7 @@ def save_extra_content(ts: Triplestore, source: dict) -> None:
     statements = get_values(source, "statements")
     statements.extend(get_values(source, "mappings"))
     if statements:
-        ts.add_triples(statements)
+        ts.add_triples(statements, graph=graph)
 
 
 def acquire(
@@ -1562,8 +1583,19 @@ def get_partial_pipeline(
     return pipeline
 
 
-def delete_iri(ts: Triplestore, iri: str) -> None:
-    """Delete `iri` from triplestore using SPARQL."""
+def delete_iri(ts: Triplestore, iri: str, named_graph: bool = False) -> None:
+    """Delete `iri` from triplestore using SPARQL.
+
+    Arguments:
+        ts: Triplestore to delete from.
+        iri: IRI of the resource to delete.
+        named_graph: If true, also drop the named graph `iri`, i.e. the
+            graph created by `store()` with `named_graph=True`.  Use it
+            for resources stored that way.  All triples in the graph are
+            removed, so the graph should only be used by `store()`.
+    """
+    if named_graph and not iri.startswith("_:"):
+        ts.drop_graph(ts.expand_iri(iri))
     subj = iri if iri.startswith("_:") else f"<{ts.expand_iri(iri)}>"
     query = f"""
     # Some backends requires the prefix to be defined...
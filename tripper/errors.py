@@ -34,6 +34,10 @@ class IRIExistsError(NamespaceError):
     """IRI already exists."""
 
 
+class ParseError(TripperError, ValueError):
+    """Invalid syntax in a serialised RDF document."""
+
+
 # === Warnings ===
 class TripperWarning(Warning):
     """Base class for tripper warnings."""
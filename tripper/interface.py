@@ -47,6 +47,11 @@ class ITriplestore(Protocol):
             format: Needed if format can not be inferred from source.
             kwargs: Additional backend-specific parameters controlling
                 the parsing.
+
+        Raises:
+            NotImplementedError: If the backend cannot parse this source
+                itself.  Triplestore.parse() then parses it with its
+                fallback backend.
         """
 
     def serialize(
@@ -163,6 +168,76 @@ class ITriplestore(Protocol):
             triplestore without connecting to it.
         """
 
+    def ask(self, triple: Triple) -> bool:
+        """Returns whether there is any triple matching `triple`."""
+
+    def count(self, triple: Triple) -> int:
+        """Returns the number of triples matching `triple`."""
+
+    def first(self, triple: Triple, limit: int = 1) -> List[Triple]:
+        """Returns a list with at most `limit` triples matching `triple`.
+
+        The three methods above allow to check for existence and to look
+        up single values without transferring all matching triples.
+        """
+
+    def triples_many(self, patterns: Sequence[Triple]) -> List[List[Triple]]:
+        """Returns a list with a list of matching triples for each of the
+        `(s, p, o)` tuples in `patterns`.
+
+        Backends should implement this if they can look up several
+        patterns more efficiently than calling triples() repeatedly.
+        """
+
+    def project(
+        self, triple: Triple, positions: Tuple[int, ...]
+    ) -> Generator[Tuple, None, None]:
+        """Returns a generator over tuples with the terms at the given
+        `positions` (0: subject, 1: predicate, 2: object) of each triple
+        matching `triple`.
+
+        Used by `subjects()`, `objects()`, `subject_objects()`, etc.
+        Backends should implement this if they can avoid converting or
+        transferring the terms that are not requested.
+        """
+
+    def remove_triples(self, triples: Sequence[Triple]):
+        """Remove a sequence of `(s, p, o)` triples.
+
+        Backends should implement this if they can remove several
+        triples more efficiently than calling remove() repeatedly.
+        """
+
+    def drop_graph(self, graph: str):
+        """Remove the named graph `graph` and all its triples.
+
+        Backends implementing this method must also accept a `graph`
+        keyword argument to triples(), add_triples() and remove(),
+        restricting the operation to the given named graph.
+        """
+
+    async def aquery(self, query_object: str, **kwargs):
+        """Asynchronous version of query().  CONSTRUCT and DESCRIBE
+        queries return a list of triples."""
+
+    async def aupdate(self, update_object: str, **kwargs):
+        """Asynchronous version of update()."""
+
+    async def atriples(self, triple: Triple) -> List[Triple]:
+        """Asynchronous version of triples() returning a list."""
+
+    async def aadd_triples(self, triples: Sequence[Triple]):
+        """Asynchronous version of add_triples()."""
+
+    async def aremove(self, triple: Triple):
+        """Asynchronous version of remove().
+
+        The five methods above are used by `AsyncTriplestore`.  Backends
+        should implement them if they can serve requests without
+        blocking the event loop.  Otherwise the synchronous methods are
+        called in an executor.
+        """
+
     ```
     '''
 
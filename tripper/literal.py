@@ -31,6 +31,18 @@ SIQuantityDatatype = (
     "https://w3id.org/emmo#EMMO_799c067b_083f_4365_9452_1f1433b03676"
 )
 
+# Datatypes used in the consistency checks in Literal.__new__().  They
+# are looked up once, since attribute access on namespaces is
+# comparatively slow.
+_NON_POSITIVE_INTEGER = XSD.nonPositiveInteger
+_NON_NEGATIVE_INTEGER = XSD.nonNegativeInteger
+_UNSIGNED_INTEGERS = (
+    XSD.unsignedInt,
+    XSD.unsignedShort,
+    XSD.unsignedLong,
+    XSD.unsignedByte,
+)
+
 
 class Literal(str):
     """A literal RDF value.
@@ -272,23 +284,17 @@ class Literal(str):
 
         # Some consistency checking
         if (
-            string.datatype == XSD.nonPositiveInteger
+            string.datatype == _NON_POSITIVE_INTEGER
             and int(value) > 0  # type: ignore[arg-type]
         ):
             raise TypeError(f"not a xsd:nonPositiveInteger: '{string}'")
         if (
-            string.datatype == XSD.nonNegativeInteger
+            string.datatype == _NON_NEGATIVE_INTEGER
             and int(value) < 0  # type: ignore[arg-type]
         ):
             raise TypeError(f"not a xsd:nonNegativeInteger: '{string}'")
         if (
-            string.datatype
-            in (
-                XSD.unsignedInt,
-                XSD.unsignedShort,
-                XSD.unsignedLong,
-                XSD.unsignedByte,
-            )
+            string.datatype in _UNSIGNED_INTEGERS
             and int(value) < 0  # type: ignore[arg-type]
         ):
             raise TypeError(f"not an unsigned integer: '{string}'")
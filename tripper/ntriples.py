@@ -0,0 +1,432 @@
+"""A streaming reader and writer for N-Triples and N-Quads.
+
+N-Triples and N-Quads are simple line-based formats.  This module parses
+and writes them directly to and from tripper terms, i.e. IRIs as strings,
+blank nodes as strings prefixed with "_:" and literals as `Literal`
+instances.  It has no dependencies beyond the standard library.
+
+Example:
+
+```python
+>>> from tripper import Literal
+>>> from tripper.ntriples import parse, serialize
+
+>>> triples = [
+...     ("http://ex#Cat", "http://ex#isA", "http://ex#Animal"),
+...     ("http://ex#Cat", "http://ex#label", Literal('A "cat"', lang="en")),
+... ]
+>>> data = serialize(triples)
+>>> print(data, end="")
+<http://ex#Cat> <http://ex#isA> <http://ex#Animal> .
+<http://ex#Cat> <http://ex#label> "A \\"cat\\""@en .
+
+>>> list(parse(data=data)) == triples
+True
+
+```
+
+"""
+
+import io
+import mmap
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tripper.errors import ArgumentTypeError, ArgumentValueError, ParseError
+from tripper.literal import Literal
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import (
+        IO,
+        Any,
+        Callable,
+        Dict,
+        Generator,
+        Iterable,
+        Iterator,
+        Optional,
+        Tuple,
+        Union,
+    )
+
+    from tripper.utils import Triple
+
+    Term = Union[str, Literal]
+
+
+# Supported formats and their canonical names
+FORMATS = {
+    "ntriples": "ntriples",
+    "nt": "ntriples",
+    "nt11": "ntriples",
+    "nquads": "nquads",
+    "nq": "nquads",
+}
+
+# Maximum number of parsed literals to keep for reuse
+LITERAL_CACHE_SIZE = 100_000
+
+_BNODE_LABEL = re.compile(r"[^\s<\"]*[^\s<\".]")
+_LANG_TAG = re.compile(r"[a-zA-Z]+(-[a-zA-Z0-9]+)*")
+_ESCAPE = re.compile(r"\\(?:u([0-9a-fA-F]{4})|U([0-9a-fA-F]{8})|(.))")
+_ECHARS = {
+    "t": "\t",
+    "b": "\b",
+    "n": "\n",
+    "r": "\r",
+    "f": "\f",
+    '"': '"',
+    "'": "'",
+    "\\": "\\",
+}
+_LITERAL_ESCAPES = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"}
+)
+_IRI_ESCAPES = str.maketrans(
+    {c: f"\\u{ord(c):04X}" for c in '<>"{}|^`\\ \n\r\t'}
+)
+
+
+def parse(
+    source: "Optional[Union[str, Path, IO]]" = None,
+    data: "Optional[Union[str, bytes]]" = None,
+    format: str = "ntriples",  # pylint: disable=redefined-builtin
+    use_mmap: bool = False,
+    bnode_prefix: str = "",
+) -> "Generator[Tuple[Optional[Term], ...], None, None]":
+    """Parse N-Triples or N-Quads and return a generator over the parsed
+    triples or quads.
+
+    Arguments:
+        source: File name or file-like object to parse.
+        data: String or bytes to parse.  Only used if `source` is None.
+        format: Either "ntriples" (or "nt") or "nquads" (or "nq").
+        use_mmap: Whether to memory-map the file `source` instead of
+            reading it through a buffer.
+        bnode_prefix: String inserted after "_:" in all blank node
+            labels.  Use it to avoid clashes with blank nodes from other
+            documents.
+
+    Returns:
+        Generator over `(s, p, o)` triples for N-Triples and over
+        `(s, p, o, graph)` quads for N-Quads, where `graph` is None for
+        the default graph.
+    """
+    if format not in FORMATS:
+        raise ArgumentValueError(f"unsupported format: {format}")
+    if FORMATS[format] == "ntriples":
+        yield from parse_triples(source, data, use_mmap, bnode_prefix)
+        return
+    for _, terms in _statements(source, data, use_mmap, bnode_prefix):
+        yield terms if len(terms) == 4 else (*terms, None)
+
+
+def parse_triples(
+    source: "Optional[Union[str, Path, IO]]" = None,
+    data: "Optional[Union[str, bytes]]" = None,
+    use_mmap: bool = False,
+    bnode_prefix: str = "",
+) -> "Generator[Triple, None, None]":
+    """Parse N-Triples and return a generator over the parsed triples.
+
+    Arguments are the same as for `parse()`.
+
+    Returns:
+        Generator over `(s, p, o)` triples.
+    """
+    for lineno, terms in _statements(source, data, use_mmap, bnode_prefix):
+        if len(terms) != 3:
+            raise ParseError(f"line {lineno}: graph label in N-Triples")
+        s, p, o = terms
+        yield s, p, o
+
+
+def _statements(
+    source: "Optional[Union[str, Path, IO]]",
+    data: "Optional[Union[str, bytes]]",
+    use_mmap: bool,
+    bnode_prefix: str,
+) -> "Iterator[Tuple[int, Tuple[Term, ...]]]":
+    """Help function for parse() and parse_triples() that returns an
+    iterator over `(lineno, terms)` pairs for all statements."""
+    literals: "Dict[str, Literal]" = {}
+    for lineno, line in enumerate(_lines(source, data, use_mmap), start=1):
+        try:
+            terms = parse_line(line, bnode_prefix, literals)
+        except ParseError as exc:
+            raise ParseError(f"line {lineno}: {exc}") from exc
+        if terms is not None:
+            yield lineno, terms
+
+
+def parse_line(
+    line: str,
+    bnode_prefix: str = "",
+    literals: "Optional[Dict[str, Any]]" = None,
+    literal_type: "Callable[..., Any]" = Literal,
+) -> "Optional[Tuple[Term, ...]]":
+    """Parse a single line of N-Triples or N-Quads.
+
+    Arguments:
+        line: The line to parse.
+        bnode_prefix: String inserted after "_:" in all blank node labels.
+        literals: Optional dict used for reusing parsed literals.
+        literal_type: Callable creating literals.  It is called with the
+            lexical form and the `lang` and `datatype` keyword arguments.
+
+    Returns:
+        A tuple with three or four terms or None if the line is empty or
+        a comment.
+    """
+    terms: "list" = []
+    pos, end = 0, len(line)
+    while True:
+        while pos < end and line[pos] in " \t\r\n":
+            pos += 1
+        if pos == end:
+            if terms:
+                raise ParseError("missing '.' at end of statement")
+            return None
+        char = line[pos]
+        if char == "." and len(terms) in (3, 4):
+            rest = line[pos + 1 :].strip()
+            if rest and rest[0] != "#":
+                raise ParseError(f"unexpected content after '.': {rest!r}")
+            return tuple(terms)
+        if char == "#" and not terms:
+            return None
+        pos = _parse_term(
+            line, pos, terms, bnode_prefix, literals, literal_type
+        )
+        if len(terms) > 4:
+            raise ParseError("too many terms in statement")
+
+
+def parse_term(
+    text: str,
+    bnode_prefix: str = "",
+    literals: "Optional[Dict[str, Any]]" = None,
+    literal_type: "Callable[..., Any]" = Literal,
+) -> "Term":
+    """Parse a single IRI, blank node or literal in N-Triples syntax.
+
+    Arguments are the same as for `parse_line()`.
+
+    Returns:
+        The parsed term.
+    """
+    terms: "list" = []
+    pos = _parse_term(text, 0, terms, bnode_prefix, literals, literal_type)
+    if text[pos:].strip():
+        raise ParseError(f"unexpected content after term: {text[pos:]!r}")
+    return terms[0]
+
+
+def _parse_term(
+    line: str,
+    pos: int,
+    terms: list,
+    bnode_prefix: str,
+    literals: "Optional[Dict[str, Any]]",
+    literal_type: "Callable[..., Any]",
+) -> int:
+    """Help function for parse_line() and parse_term() that parses the
+    term starting at `pos`, appends it to `terms` and returns the position
+    after it."""
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    char = line[pos]
+    if char == "<":
+        stop = line.find(">", pos)
+        if stop < 0:
+            raise ParseError("unterminated IRI")
+        iri = line[pos + 1 : stop]
+        terms.append(_unescape(iri) if "\\" in iri else iri)
+        return stop + 1
+    if char == '"':
+        return _parse_literal(line, pos, terms, literals, literal_type)
+    if line.startswith("_:", pos):
+        match = _BNODE_LABEL.match(line, pos + 2)
+        if not match:
+            raise ParseError("invalid blank node label")
+        terms.append(f"_:{bnode_prefix}{match.group()}")
+        return match.end()
+    raise ParseError(f"unexpected character {char!r}")
+
+
+def _parse_literal(
+    line: str,
+    pos: int,
+    terms: list,
+    literals: "Optional[Dict[str, Any]]",
+    literal_type: "Callable[..., Any]",
+) -> int:
+    """Help function for _parse_term() that parses the literal starting at
+    `pos`, appends it to `terms` and returns the position after it."""
+    stop = line.find('"', pos + 1)
+    while stop > 0 and _escaped(line, stop):
+        stop = line.find('"', stop + 1)
+    if stop < 0:
+        raise ParseError("unterminated literal")
+    start, lexical_end = pos, stop
+    pos = stop + 1
+    lang = datatype = None
+    if line.startswith("@", pos):
+        match = _LANG_TAG.match(line, pos + 1)
+        if not match:
+            raise ParseError("invalid language tag")
+        lang = match.group()
+        pos = match.end()
+    elif line.startswith("^^<", pos):
+        stop = line.find(">", pos)
+        if stop < 0:
+            raise ParseError("unterminated datatype IRI")
+        datatype = line[pos + 3 : stop]
+        pos = stop + 1
+
+    key = line[start:pos]
+    literal = literals.get(key) if literals is not None else None
+    if literal is None:
+        lexical = line[start + 1 : lexical_end]
+        if "\\" in lexical:
+            lexical = _unescape(lexical)
+        literal = literal_type(lexical, lang=lang, datatype=datatype)
+        if literals is not None:
+            if len(literals) >= LITERAL_CACHE_SIZE:
+                literals.clear()
+            literals[key] = literal
+    terms.append(literal)
+    return pos
+
+
+def _escaped(line: str, pos: int) -> bool:
+    """Returns true if the character at `pos` is escaped by an odd number
+    of preceding backslashes."""
+    count = 0
+    pos -= 1
+    while line[pos] == "\\":
+        count += 1
+        pos -= 1
+    return count % 2 == 1
+
+
+def _unescape(text: str) -> str:
+    """Resolve string and numeric escape sequences in `text`."""
+
+    def replace(match):
+        code = match.group(1) or match.group(2)
+        if code:
+            return chr(int(code, 16))
+        char = match.group(3)
+        if char not in _ECHARS:
+            raise ParseError(f"invalid escape sequence: \\{char}")
+        return _ECHARS[char]
+
+    return _ESCAPE.sub(replace, text)
+
+
+def _lines(
+    source: "Optional[Union[str, Path, IO]]",
+    data: "Optional[Union[str, bytes]]",
+    use_mmap: bool,
+) -> "Iterator[str]":
+    """Returns an iterator over the lines of `source` or `data`."""
+    if source is None:
+        if data is None:
+            raise ArgumentValueError("either `source` or `data` must be given")
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode("utf-8")
+        yield from io.StringIO(data)
+    elif isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            if use_mmap and Path(source).stat().st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for line in iter(mm.readline, b""):
+                        yield line.decode("utf-8")
+            else:
+                for line in f:
+                    yield line.decode("utf-8")
+    elif hasattr(source, "read"):
+        for line in source:
+            yield line.decode("utf-8") if isinstance(line, bytes) else line
+    else:
+        raise ArgumentTypeError(f"cannot parse source of type {type(source)}")
+
+
+def term(value: "Any") -> str:
+    """Returns tripper term `value` in N-Triples syntax."""
+    if isinstance(value, Literal):
+        return literal_term(str.__str__(value), value.lang, value.datatype)
+    if value.startswith("_:"):
+        return value
+    return f"<{value.translate(_IRI_ESCAPES)}>"
+
+
+def literal_term(
+    lexical: str,
+    lang: "Optional[str]" = None,
+    datatype: "Optional[str]" = None,
+) -> str:
+    """Returns a literal with the given lexical form and language tag or
+    datatype in N-Triples syntax."""
+    lexical = lexical.translate(_LITERAL_ESCAPES)
+    if lang:
+        return f'"{lexical}"@{lang}'
+    if datatype:
+        return f'"{lexical}"^^<{datatype}>'
+    return f'"{lexical}"'
+
+
+def serialize(
+    statements: "Iterable[Tuple[Any, ...]]",
+    destination: "Optional[Union[str, Path, IO]]" = None,
+    format: str = "ntriples",  # pylint: disable=redefined-builtin
+    encoding: str = "utf-8",
+) -> "Optional[str]":
+    """Serialise triples or quads as N-Triples or N-Quads.
+
+    Arguments:
+        statements: Iterable over `(s, p, o)` triples.  For N-Quads,
+            `(s, p, o, graph)` quads may also be given, where `graph` is
+            None for the default graph.
+        destination: File name or text file-like object to write to.  If
+            None, the serialisation is returned as a string.
+        format: Either "ntriples" (or "nt") or "nquads" (or "nq").
+        encoding: Encoding used when `destination` is a file name.
+
+    Returns:
+        The serialisation if `destination` is None.
+    """
+    if format not in FORMATS:
+        raise ArgumentValueError(f"unsupported format: {format}")
+    quads = FORMATS[format] == "nquads"
+    if destination is None:
+        buf = io.StringIO()
+        _write(buf, statements, quads)
+        return buf.getvalue()
+    if isinstance(destination, (str, Path)):
+        with open(destination, "w", encoding=encoding, newline="\n") as f:
+            _write(f, statements, quads)
+    else:
+        _write(destination, statements, quads)
+    return None
+
+
+def _write(
+    f: "IO[str]", statements: "Iterable[Tuple[Any, ...]]", quads: bool
+) -> None:
+    """Help function for serialize() that writes `statements` to `f`."""
+    lines = []
+    for statement in statements:
+        if len(statement) == 4 and statement[3] is not None:
+            if not quads:
+                raise ArgumentValueError("cannot write quads as N-Triples")
+            s, p, o, g = statement
+            lines.append(f"{term(s)} {term(p)} {term(o)} {term(g)} .\n")
+        else:
+            s, p, o = statement[:3]
+            lines.append(f"{term(s)} {term(p)} {term(o)} .\n")
+        if len(lines) >= 10_000:
+            f.write("".join(lines))
+            lines.clear()
+    f.write("".join(lines))
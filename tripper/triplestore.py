@@ -16,12 +16,19 @@ parts of an RDF Triple: subject, predicate, and object.
 # pylint: disable=invalid-name,too-many-public-methods,too-many-lines
 from __future__ import annotations  # Support Python 3.7 (PEP 585)
 
+import functools
 import importlib
 import inspect
+import itertools
+import string
 import subprocess  # nosec
 import sys
+import threading
+import uuid
 import warnings
+from collections import OrderedDict
 from collections.abc import Sequence
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, overload
 
 from tripper.errors import (
@@ -45,6 +52,9 @@ from tripper.namespace import (
     XSD,
     Namespace,
 )
+from tripper.ntriples import FORMATS as NTRIPLES_FORMATS
+from tripper.ntriples import parse_triples as parse_ntriples
+from tripper.ntriples import serialize as serialize_ntriples
 from tripper.utils import (
     bnode_iri,
     check_service_availability,
@@ -54,6 +64,7 @@ from tripper.utils import (
     get_entry_points,
     infer_iri,
     prefix_iri,
+    query_substitutions,
     split_iri,
     substitute_query,
 )
@@ -64,6 +75,7 @@ if TYPE_CHECKING:  # pragma: no cover
         Callable,
         Dict,
         Generator,
+        Hashable,
         Iterable,
         List,
         Mapping,
@@ -107,11 +119,310 @@ hasCost = DM.hasCost
 # _MATCH_PREFIXED_IRI = re.compile(r"^([a-z][a-z0-9]*)?:([^/]{1}.*)$")
 
 
+def _materialise(result: "Any") -> "Tuple[str, Any]":
+    """Return a `(kind, value)` tuple with a materialised version of the
+    result of a backend query() or triples() call, that can be shared.
+
+    Lists and generators are converted to tuples, while ASK results are
+    kept as bool.
+    """
+    if isinstance(result, list):
+        return "list", tuple(result)
+    if isinstance(result, bool):
+        return "bool", result
+    return "iter", tuple(result)
+
+
+def _dematerialise(kind: str, value: "Any") -> "Any":
+    """Return a new result from the `(kind, value)` tuple returned by
+    `_materialise()`."""
+    if kind == "list":
+        return list(value)
+    if kind == "iter":
+        return (triple for triple in value)
+    return value
+
+
+class _Flight:
+    """A backend call in flight, whose result is shared by all callers
+    waiting for it.  Used by `Triplestore._single_flight()`."""
+
+    # A plain state holder, accessed directly by _single_flight()
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: "Any" = None
+        self.error: "Optional[BaseException]" = None
+
+
+class _BatchState(threading.local):
+    """Write operations buffered by `Triplestore.batch()`.
+
+    The state is thread-local, such that a batch started in one thread
+    is neither seen nor flushed by reads in other threads.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Buffered operations.  Is None when no batch is active.
+        self.operations: "Optional[List[Tuple[str, Any]]]" = None
+        self.count = 0
+        self.max = 0
+
+
+class Cursor:
+    """A lazy cursor over query results.
+
+    Should not be instantiated directly, use `Triplestore.query_iter()`
+    instead.
+
+    Rows are fetched from the backend and converted to tripper types on
+    demand.  The cursor may be closed before all rows are consumed, which
+    releases any resources held by the backend.
+
+    Arguments:
+        rows: Iterator over result rows provided by the backend.
+
+    Attributes:
+        rowcount: Number of rows fetched so far.
+        closed: Whether the cursor is closed.
+    """
+
+    def __init__(self, rows: "Iterable[Any]"):
+        self._rows = iter(rows)
+        self.rowcount = 0
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.closed:
+            raise StopIteration
+        row = next(self._rows)
+        self.rowcount += 1
+        return row
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def fetchone(self) -> "Any":
+        """Return next row or None if there are no more rows."""
+        return next(self, None)
+
+    def fetchmany(self, size: int = 1000) -> "List[Any]":
+        """Return a list with up to `size` next rows."""
+        return list(itertools.islice(self, size))
+
+    def fetchall(self) -> "List[Any]":
+        """Return a list with all remaining rows."""
+        return list(self)
+
+    def close(self) -> None:
+        """Close the cursor.  Remaining rows are discarded."""
+        if not self.closed and hasattr(self._rows, "close"):
+            self._rows.close()
+        self.closed = True
+
+
+class PreparedQuery:
+    """A SPARQL query prepared for repeated evaluation.
+
+    Should not be instantiated directly, use `Triplestore.prepare()`
+    instead.
+
+    The IRI and literal variables in the query are parsed once when the
+    query is prepared.  If the backend implements the optional
+    `prepare()` method, the query is also compiled by the backend and
+    the variables are passed to it as bindings on each call.  They are
+    renamed to private SPARQL variables (prefixed with
+    `PreparedQuery.prefix`), such that they cannot collide with query
+    variables, and are not included in `SELECT *` results.
+    Otherwise, the variables are substituted into the pre-parsed query
+    and the resulting query string is sent to the backend `query()`
+    method.
+
+    In both cases the query cache and single-flight are used like for
+    `Triplestore.query()`, if they are enabled.
+
+    Arguments:
+        triplestore: The triplestore to query.
+        query: String with the SPARQL query.
+        kwargs: Keyword arguments passed to the backend prepare() method.
+
+    Attributes:
+        triplestore: The triplestore to query.
+        query: String with the SPARQL query.
+        variables: Set with names of the IRI and literal variables in
+            the query.
+    """
+
+    # Prefix of the private variables passed to the backend
+    prefix = "__tripper_"
+
+    def __init__(self, triplestore: "Triplestore", query: str, **kwargs):
+        self.triplestore = triplestore
+        self.query = query
+
+        # Split the query into a list of strings and `(name, text)` tuples
+        # for the variables, following the string.Template syntax.
+        self._parts: "List[Union[str, Tuple[str, str]]]" = []
+        pos = 0
+        for match in string.Template.pattern.finditer(query):
+            self._parts.append(query[pos : match.start()])
+            name = match.group("named") or match.group("braced")
+            if name:
+                self._parts.append((name, match.group()))
+            elif match.group("escaped") is not None:
+                self._parts.append("$")
+            else:
+                self._parts.append(match.group())
+            pos = match.end()
+        self._parts.append(query[pos:])
+        self.variables = {p[0] for p in self._parts if isinstance(p, tuple)}
+
+        # Variables are passed to the backend as private query variables
+        self._compiled = (
+            triplestore.backend.prepare(
+                "".join(
+                    (
+                        part
+                        if isinstance(part, str)
+                        else f"?{self.prefix}{part[0]}"
+                    )
+                    for part in self._parts
+                ),
+                parameters=[f"{self.prefix}{v}" for v in self.variables],
+                **kwargs,
+            )
+            if "prepare" in triplestore.capabilities
+            else None
+        )
+
+    def __repr__(self):
+        return f"PreparedQuery({self.query!r})"
+
+    def __call__(
+        self,
+        iris: "Optional[dict]" = None,
+        literals: "Optional[dict]" = None,
+        **kwargs,
+    ) -> "Any":
+        """Evaluate the prepared query.
+
+        Arguments:
+            iris: Dict mapping IRI variables to IRIs.
+            literals: Dict mapping literal variables to literals.
+            kwargs: Keyword arguments passed to the backend query()
+                method.
+
+        Returns:
+            Same as `Triplestore.query()`.
+        """
+        # pylint: disable=protected-access
+        ts = self.triplestore
+        ts.flush()
+        if self._compiled is None:
+            return ts._query(self.substitute(iris, literals), **kwargs)
+
+        bindings: "Dict[str, Union[str, Literal]]" = {}
+        if iris:
+            bindings.update(
+                query_substitutions(
+                    iris=iris, prefixes=ts.namespaces, iriquote=""
+                )
+            )
+        if literals:
+            bindings.update((k, Literal(v)) for k, v in literals.items())
+        bindings = {f"{self.prefix}{k}": v for k, v in bindings.items()}
+        evaluate = functools.partial(self._compiled, bindings, **kwargs)
+        if ts.query_cache_size <= 0 and not ts.single_flight:
+            return evaluate()
+
+        # Identify the result by the query and the bindings.  Literals
+        # compare equal to plain strings, so also include their language
+        # tag and datatype.
+        key = (
+            self.query,
+            tuple(
+                sorted(
+                    (
+                        (k, (v, v.lang, v.datatype))
+                        if isinstance(v, Literal)
+                        else (k, v)
+                    )
+                    for k, v in bindings.items()
+                )
+            ),
+        )
+        return ts._query(key, evaluate, **kwargs)
+
+    def substitute(
+        self,
+        iris: "Optional[dict]" = None,
+        literals: "Optional[dict]" = None,
+    ) -> str:
+        """Return the query string with the IRI and literal variables
+        substituted.
+
+        This is equivalent to `tripper.utils.substitute_query()`, but
+        avoids re-parsing the query.
+        """
+        mapping = query_substitutions(
+            iris=iris, literals=literals, prefixes=self.triplestore.namespaces
+        )
+        return "".join(
+            part if isinstance(part, str) else mapping.get(*part)
+            for part in self._parts
+        )
+
+
 class Triplestore:
     """Provides a common frontend to a range of triplestore backends."""
 
     # pylint: disable=too-many-instance-attributes
 
+    # Optional methods that a backend may implement.  The methods that are
+    # implemented by the current backend are listed in the `capabilities`
+    # attribute.
+    optional_backend_methods = (
+        "aadd_triples",
+        "aclose",
+        "aquery",
+        "aremove",
+        "ask",
+        "atriples",
+        "aupdate",
+        "bind",
+        "close",
+        "count",
+        "create_database",
+        "drop_graph",
+        "first",
+        "is_available",
+        "list_databases",
+        "namespaces",
+        "parse",
+        "prepare",
+        "project",
+        "query",
+        "query_iter",
+        "remove_database",
+        "remove_triples",
+        "serialize",
+        "triples_many",
+        "update",
+    )
+
+    # Cache mapping `(backend, package)` to backend class
+    _backend_classes: "Dict[Tuple[str, Optional[str]], type]" = {}
+
     default_namespaces = {
         "xml": XML,
         "rdf": RDF,
@@ -135,6 +446,8 @@ class Triplestore:
         database: "Optional[str]" = None,
         package: "Optional[str]" = None,
         check_url: "Optional[str]" = None,  # Deprecated
+        query_cache_size: int = 0,
+        single_flight: bool = False,
         **kwargs,
     ) -> None:
         """Initialise triplestore using the backend with the given name.
@@ -163,17 +476,35 @@ class Triplestore:
             check_url: Deprecated. A URL for checking whether the backend
                 is available. Use the optional keyword argument `check_iri`
                 instead. Defaults to `base_iri`.
+            query_cache_size: Maximum number of query results to keep in
+                a least-recently-used cache.  Cached results are
+                invalidated by any write operation via this triplestore.
+                The default is zero, which disables the cache.
+            single_flight: Whether identical `query()` and `triples()`
+                calls made concurrently from several threads should share
+                a single backend call.  The first caller queries the
+                backend, while the others wait for and receive the same
+                result.
             kwargs: Keyword arguments passed to the backend's __init__()
                 method.
 
         Attributes:
             backend_name: Name of backend.
+            backend_class: The class implementing the backend.
             base_iri: Assigned to the `base_iri` argument.
+            capabilities: Frozen set with the names of the optional backend
+                methods (see `optional_backend_methods`) that are
+                implemented by the backend.  It is resolved once when the
+                triplestore is created.
             closed: Whether the triplestore is closed.
+            generation: Write generation counter.  Incremented by any
+                operation that modifies the triplestore.
             kwargs: Dict with additional keyword arguments.
             namespaces: Dict mapping namespace prefixes to IRIs.
             package: Name of Python package if the backend is implemented as
                 a relative module. Assigned to the `package` argument.
+            query_cache_size: Assigned to the `query_cache_size` argument.
+            single_flight: Assigned to the `single_flight` argument.
 
         Notes:
             If the backend establishes a connection that should be closed
@@ -186,6 +517,15 @@ class Triplestore:
 
             This ensures that the connection is automatically closed when the
             context manager exits.
+
+            The query cache only tracks modifications made via this
+            triplestore instance.  Don't enable it if the backend may be
+            modified by other clients, or call `clear_query_cache()` when
+            needed.
+
+            With `single_flight` enabled, `triples()` fetches all matching
+            triples before returning.  Only calls started before any write
+            operation via this triplestore share results.
         """
         if check_url:
             warnings.warn(
@@ -197,8 +537,7 @@ class Triplestore:
             )
 
         backend_name = backend.rsplit(".", 1)[-1]
-        module = self._load_backend(backend, package)
-        cls = getattr(module, f"{backend_name.title()}Strategy")
+        cls = self._get_backend(backend, package)
         self.base_iri = base_iri
         self.namespaces: "Dict[str, Namespace]" = {}
         self.closed = False
@@ -207,11 +546,33 @@ class Triplestore:
         self.package = package
         self.check_url = check_url if check_url else base_iri  # Deprecated
         self.kwargs = kwargs.copy()
+        self.backend_class = cls
         self.backend = cls(base_iri=base_iri, database=database, **kwargs)
+        self.capabilities = frozenset(
+            name
+            for name in self.optional_backend_methods
+            if hasattr(self.backend, name)
+        )
 
         # Cache functions in the triplestore for fast access
         self.function_repo: "Dict[str, Union[float, Callable, None]]" = {}
 
+        # Per-thread buffer for write operations within a batch() context
+        self._batch = _BatchState()
+
+        # LRU cache mapping (query, kwargs) to (generation, kind, result)
+        self.query_cache_size = query_cache_size
+        self.generation = 0
+        self._query_cache: "OrderedDict[Any, Tuple[int, str, Any]]" = (
+            OrderedDict()
+        )
+        self._query_cache_lock = threading.Lock()
+
+        # Backend calls in flight, used when `single_flight` is true
+        self.single_flight = single_flight
+        self._flights: "Dict[Any, _Flight]" = {}
+        self._flights_lock = threading.Lock()
+
         for prefix, namespace in self.default_namespaces.items():
             self.bind(prefix, namespace)
 
@@ -265,6 +626,7 @@ class Triplestore:
         predicate: "Optional[str]" = None,
         object: "Optional[Union[str, Literal]]" = None,
         triple: "Optional[Triple]" = None,
+        graph: "Optional[str]" = None,
     ) -> "Generator[Triple, None, None]":
         """Returns a generator over matching triples.
 
@@ -275,6 +637,10 @@ class Triplestore:
             triple: Deprecated. A `(s, p, o)` tuple where `s`, `p` and `o`
                 should either be None (matching anything) or an exact IRI
                 to match.
+            graph: IRI of a named graph to match triples in.  By default,
+                triples are matched in the default graph.  Whether the
+                default graph includes the named graphs depends on the
+                backend.  See `drop_graph()`.
 
         Returns:
             Generator over all matching triples.
@@ -292,16 +658,82 @@ class Triplestore:
         elif triple:
             subject, predicate, object = triple
 
-        return self.backend.triples((subject, predicate, object))
+        self.flush()
+        spo = (subject, predicate, object)
+        if graph is not None:
+            self._check_method("drop_graph")
+            kwargs = {"graph": graph}
+        else:
+            kwargs = {}
+        if self.single_flight:
+            return self._single_flight(
+                ("triples", spo, graph), self.backend.triples, spo, **kwargs
+            )
+        return self.backend.triples(spo, **kwargs)
+
+    def triples_many(
+        self, patterns: "Iterable[OptionalTriple]"
+    ) -> "List[List[Triple]]":
+        """Look up several triple patterns at once.
 
-    def add_triples(self, triples: "Iterable[Triple]") -> None:
+        This is more efficient than calling `triples()` for each pattern,
+        since backends supporting it may answer all patterns with a
+        single request.
+
+        Arguments:
+            patterns: A sequence of `(s, p, o)` tuples, where `s`, `p` and
+                `o` should either be None (matching anything) or an exact
+                IRI or literal to match.
+
+        Returns:
+            A list with a list of matching triples for each pattern, in
+            the same order as `patterns`.
+
+        Examples:
+
+        >>> from tripper import RDF, RDFS, Triplestore
+        >>> ts = Triplestore("memory")
+        >>> ts.add_triples([
+        ...     (":Dog", RDFS.subClassOf, ":Animal"),
+        ...     (":fido", RDF.type, ":Dog"),
+        ...     (":pluto", RDF.type, ":Dog"),
+        ... ])
+        >>> patterns = [(":Dog", None, None), (None, None, ":Dog")]
+        >>> dog, dogs = ts.triples_many(patterns)
+        >>> [o for _, _, o in dog]
+        [':Animal']
+        >>> sorted(s for s, _, _ in dogs)
+        [':fido', ':pluto']
+
+        """
+        patterns = [tuple(pattern) for pattern in patterns]
+        if not patterns:
+            return []
+        self.flush()
+        if "triples_many" in self.capabilities:
+            return [list(t) for t in self.backend.triples_many(patterns)]
+        return [list(self.backend.triples(pattern)) for pattern in patterns]
+
+    def add_triples(
+        self, triples: "Iterable[Triple]", graph: "Optional[str]" = None
+    ) -> None:
         """Add a sequence of triples.
 
         Arguments:
             triples: A sequence of `(s, p, o)` tuples to add to the
                 triplestore.
+            graph: IRI of a named graph to add the triples to.  By
+                default, the triples are added to the default graph.
         """
-        self.backend.add_triples(triples)
+        self.generation += 1
+        if graph is not None:
+            self._check_method("drop_graph")
+            self.flush()
+            self.backend.add_triples(triples, graph=graph)
+        elif self._batch.operations is not None:
+            self._buffer("add", triples)
+        else:
+            self.backend.add_triples(triples)
 
     def remove(  # pylint: disable=redefined-builtin
         self,
@@ -309,6 +741,7 @@ class Triplestore:
         predicate: "Optional[str]" = None,
         object: "Optional[Union[str, Literal]]" = None,
         triple: "Optional[Triple]" = None,
+        graph: "Optional[str]" = None,
     ) -> None:
         """Remove all matching triples from the backend.
 
@@ -321,6 +754,8 @@ class Triplestore:
             triple: Deprecated. A `(s, p, o)` tuple where `s`, `p` and `o`
                 should either be None (matching anything) or an exact IRI
                 to match.
+            graph: IRI of a named graph to remove the triples from.  By
+                default, the triples are removed from the default graph.
         """
         # __TODO__: Remove these lines when deprecated
         if triple or (subject and not isinstance(subject, str)):
@@ -335,8 +770,157 @@ class Triplestore:
         elif triple:
             subject, predicate, object = triple
 
+        self.generation += 1
+        if graph is not None:
+            self._check_method("drop_graph")
+            self.flush()
+            return self.backend.remove(
+                (subject, predicate, object), graph=graph
+            )
+        if self._batch.operations is not None:
+            self._buffer("remove", (subject, predicate, object))
+            return None
         return self.backend.remove((subject, predicate, object))
 
+    def drop_graph(self, graph: str) -> None:
+        """Remove the named graph `graph` and all its triples.
+
+        Named graphs allow to replace a set of triples, like a document
+        stored with `tripper.datadoc.store()`, without having to look
+        them up first.
+
+        The `graph` argument of `add_triples()`, `triples()`, `remove()`,
+        etc. is only supported by backends implementing this method.
+
+        Arguments:
+            graph: IRI of the named graph to remove.  It is not an error
+                if the graph does not exist.
+        """
+        self._check_method("drop_graph")
+        self.flush()
+        self.generation += 1
+        self.backend.drop_graph(graph)
+
+    def remove_triples(self, triples: "Iterable[Triple]") -> None:
+        """Remove a sequence of triples.
+
+        This is more efficient than calling `remove()` for each triple
+        on backends that can remove several triples in one operation.
+
+        Arguments:
+            triples: A sequence of `(s, p, o)` tuples to remove from the
+                triplestore.  None matches anything, like in `remove()`.
+        """
+        self.generation += 1
+        if self._batch.operations is not None:
+            self._buffer("remove_triples", triples)
+        else:
+            self._remove_triples(triples)
+
+    def _remove_triples(self, triples: "Iterable[Triple]") -> None:
+        """Help method removing `triples` from the backend."""
+        if "remove_triples" in self.capabilities:
+            self.backend.remove_triples(triples)
+        else:
+            for triple in triples:
+                self.backend.remove(triple)
+
+    @contextmanager
+    def batch(self, max_triples: int = 10000):
+        """Context manager that buffers write operations.
+
+        Within the context, calls to `add()`, `add_triples()`, `remove()`
+        and `set()` are buffered and sent to the backend as a few bulk
+        operations when the context exits or the buffer holds more than
+        `max_triples` triples.  Consecutive additions are collected into a
+        single call to the backend `add_triples()` method.  Likewise,
+        consecutive removals of fully specified triples are collected
+        into a single call to `remove_triples()`.
+
+        The buffer is flushed before any read operation (like `triples()`
+        or `query()`), such that reads always see the buffered writes.
+
+        The buffer is thread-local.  Write operations in other threads
+        are not buffered, and reads in other threads neither flush nor
+        see the buffered writes until the batch is flushed.
+
+        Batches may be nested.  The buffer is then flushed when the
+        outermost context exits.
+
+        Arguments:
+            max_triples: Maximum number of buffered triples and remove
+                patterns before the buffer is flushed.
+
+        Examples:
+            >>> from tripper import RDFS, Triplestore
+            >>> ts = Triplestore(backend="rdflib")
+            >>> EX = ts.bind("ex", "http://example.com#")
+            >>> with ts.batch():
+            ...     ts.add((EX.Cat, RDFS.subClassOf, EX.Animal))
+            ...     ts.add((EX.Dog, RDFS.subClassOf, EX.Animal))
+            >>> sorted(ts.subjects(RDFS.subClassOf, EX.Animal))
+            ['http://example.com#Cat', 'http://example.com#Dog']
+
+        """
+        if self._batch.operations is not None:
+            yield self
+            return
+
+        self._batch.operations = []
+        self._batch.count = 0
+        self._batch.max = max_triples
+        try:
+            yield self
+        finally:
+            try:
+                self.flush()
+            finally:
+                self._batch.operations = None
+
+    def flush(self) -> None:
+        """Send write operations buffered by `batch()` in the current
+        thread to the backend.
+
+        This method has no effect if no write operations are buffered.
+        """
+        if not self._batch.operations:
+            return
+        operations, self._batch.operations = self._batch.operations, []
+        self._batch.count = 0
+        for operation, arg in operations:
+            if operation == "add":
+                self.backend.add_triples(arg)
+            elif operation == "remove_triples":
+                self._remove_triples(arg)
+            else:
+                self.backend.remove(arg)
+
+    def _buffer(self, operation: str, arg: "Any") -> None:
+        """Help method that buffers a write operation within a batch.
+
+        Arguments:
+            operation: Either "add", "remove_triples" or "remove".
+            arg: A sequence of triples to add or remove or a triple
+                pattern to remove.
+        """
+        state = self._batch
+        assert state.operations is not None  # nosec
+        if operation == "remove" and None not in arg:
+            operation, arg = "remove_triples", [arg]
+        if operation in ("add", "remove_triples"):
+            triples = list(arg)
+            state.count += len(triples)
+            if state.operations and state.operations[-1][0] == operation:
+                state.operations[-1][1].extend(triples)
+            else:
+                state.operations.append((operation, triples))
+        else:
+            state.count += 1
+            state.operations.append((operation, arg))
+
+        if state.count >= state.max:
+            self.flush()
+
     # Methods optionally implemented by backend
     # -----------------------------------------
     def close(self) -> None:
@@ -345,7 +929,8 @@ class Triplestore:
         """
         # It should be ok to call close() regardless of whether the backend
         # implements this method or not.  Hence, don't call _check_method().
-        if not self.closed and hasattr(self.backend, "close"):
+        self.flush()
+        if not self.closed and "close" in self.capabilities:
             self.backend.close()
         self.closed = True
 
@@ -355,6 +940,7 @@ class Triplestore:
         format=None,
         fallback_backend="rdflib",
         fallback_backend_kwargs=None,
+        workers=None,
         **kwargs,  # pylint: disable=redefined-builtin
     ) -> None:
         """Parse source and add the resulting triples to triplestore.
@@ -363,17 +949,73 @@ class Triplestore:
             source: File-like object. File name or URL.
             format: Needed if format can not be inferred from source.
             fallback_backend: If the current backend doesn't implement
-                parse, use the `fallback_backend` instead.
+                parse, or raises NotImplementedError for `source`, use
+                the `fallback_backend` instead.
             fallback_backend_kwargs: Dict with additional keyword arguments
                 for initialising `fallback_backend`.
+            workers: If given, parse the N-Triples or N-Quads file
+                `source` in parallel with this number of worker processes.
+                See `tripper.bulkload.bulkload()`.
             kwargs: Keyword arguments passed to the backend.
                 The rdflib backend supports e.g. `location` (absolute
                 or relative URL) and `data` (string containing the
                 data to be parsed) arguments.
+                With `workers`, `chunk_size` may be given.
         """
-        if hasattr(self.backend, "parse"):
-            self._check_method("parse")
+        if workers is not None:
+            # pylint: disable=import-outside-toplevel
+            from tripper.bulkload import bulkload
+
+            bulkload(self, source, format=format, workers=workers, **kwargs)
+            return
+
+        self.flush()
+        self.generation += 1
+        try:
+            if "parse" not in self.capabilities:
+                raise NotImplementedError("backend does not implement parse")
             self.backend.parse(source=source, format=format, **kwargs)
+        except NotImplementedError:
+            # The backend cannot parse this source itself
+            self._parse_with_fallback(
+                source,
+                format,
+                fallback_backend,
+                fallback_backend_kwargs,
+                **kwargs,
+            )
+
+        if "namespaces" in self.capabilities:
+            for prefix, namespace in self.backend.namespaces().items():
+                if prefix and prefix not in self.namespaces:
+                    self.namespaces[prefix] = Namespace(namespace)
+
+    def _parse_with_fallback(
+        self,
+        source,
+        format,  # pylint: disable=redefined-builtin
+        fallback_backend,
+        fallback_backend_kwargs,
+        **kwargs,
+    ) -> None:
+        """Help method for parse() that parses `source` with
+        `fallback_backend` and adds the resulting triples."""
+        if (
+            fallback_backend == "rdflib"
+            and NTRIPLES_FORMATS.get(format) == "ntriples"
+            and set(kwargs).issubset({"data"})
+            and not (isinstance(source, str) and "://" in source)
+        ):
+            # Fast path, parse N-Triples without a temporary triplestore.
+            # Blank nodes from separate documents are kept apart with a
+            # unique label prefix.
+            self.add_triples(
+                parse_ntriples(
+                    source,
+                    data=kwargs.get("data"),
+                    bnode_prefix=f"{uuid.uuid4().hex[:8]}-",
+                )
+            )
         else:
             if fallback_backend_kwargs is None:
                 fallback_backend_kwargs = {}
@@ -383,11 +1025,6 @@ class Triplestore:
             ts.parse(source=source, format=format, **kwargs)
             self.add_triples(ts.triples())
 
-        if hasattr(self.backend, "namespaces"):
-            for prefix, namespace in self.backend.namespaces().items():
-                if prefix and prefix not in self.namespaces:
-                    self.namespaces[prefix] = Namespace(namespace)
-
     def serialize(
         self,
         destination=None,
@@ -412,12 +1049,22 @@ class Triplestore:
         Returns:
             Serialized string if `destination` is None.
         """
-        if hasattr(self.backend, "parse"):
-            self._check_method("serialize")
+        self.flush()
+        if "serialize" in self.capabilities:
             return self.backend.serialize(
                 destination=destination, format=format, **kwargs
             )
 
+        if (
+            fallback_backend == "rdflib"
+            and format in NTRIPLES_FORMATS
+            and set(kwargs).issubset({"encoding"})
+        ):
+            # Fast path, serialise without a temporary triplestore
+            return serialize_ntriples(
+                self.triples(), destination, format=format, **kwargs
+            )
+
         if fallback_backend_kwargs is None:
             fallback_backend_kwargs = {}
         ts = Triplestore(backend=fallback_backend, **fallback_backend_kwargs)
@@ -467,6 +1114,10 @@ class Triplestore:
 
             Not all backends may support all types of queries.
 
+            If the triplestore is created with a positive
+            `query_cache_size`, results are cached and reused for
+            identical queries until the triplestore is modified.
+
         Examples:
             Query for everyone with the name "John Dow":
 
@@ -488,10 +1139,229 @@ class Triplestore:
 
         """
         self._check_method("query")
+        self.flush()
+        new_query = substitute_query(
+            query, iris=iris, literals=literals, prefixes=self.namespaces
+        )
+        return self._query(new_query, **kwargs)
+
+    def query_iter(
+        self,
+        query: str,
+        iris: "Optional[dict]" = None,
+        literals: "Optional[dict]" = None,
+        **kwargs,
+    ) -> "Cursor":
+        """SPARQL query returning a lazy cursor over the result.
+
+        This is like `query()`, but instead of materialising the full
+        result, the returned cursor fetches and converts rows on demand.
+        It is intended for SELECT queries with large results and for
+        consumers that may stop before all rows are read.
+
+        Arguments:
+            query: String with the SPARQL query.
+            iris: Dict used for query substitutions that maps IRI variables
+                to IRIs.  See `query()`.
+            literals: Dict used for query substitutions that maps literal
+                variables to literals.  See `query()`.
+            kwargs: Keyword arguments passed to the backend query_iter()
+                or query() method.
+
+        Returns:
+            A cursor iterating over tuples of IRIs and literals for each
+            matching row of a SELECT query or over triples for CONSTRUCT
+            and DESCRIBE queries.
+
+        Note:
+            Backends that don't implement the optional `query_iter()`
+            method fall back to `query()`.  The result is then fully
+            materialised by the backend, but the cursor interface is the
+            same.  The query cache is not used.
+
+        Examples:
+            >>> from tripper import RDFS, Triplestore
+            >>> ts = Triplestore(backend="rdflib")
+            >>> EX = ts.bind("ex", "http://example.com#")
+            >>> ts.add_triples([
+            ...     (EX[f"C{i}"], RDFS.subClassOf, EX.Base) for i in range(5)
+            ... ])
+            >>> with ts.query_iter(
+            ...     "SELECT ?s WHERE { ?s rdfs:subClassOf $base }",
+            ...     iris={"base": "ex:Base"},
+            ... ) as cursor:
+            ...     rows = cursor.fetchmany(2)
+            >>> len(rows)
+            2
+
+        """
+        self._check_method("query")
+        self.flush()
         new_query = substitute_query(
             query, iris=iris, literals=literals, prefixes=self.namespaces
         )
-        return self.backend.query(new_query, **kwargs)
+        if "query_iter" in self.capabilities:
+            return Cursor(self.backend.query_iter(new_query, **kwargs))
+
+        result = self.backend.query(new_query, **kwargs)
+        if isinstance(result, bool):
+            raise ArgumentValueError(
+                "query_iter() does not support ASK queries, use query()"
+            )
+        return Cursor(result)
+
+    def prepare(self, query: str, **kwargs) -> "PreparedQuery":
+        """Prepare a SPARQL query for repeated evaluation.
+
+        The IRI and literal variables (prefixed with `$`) in `query` are
+        parsed once.  If the backend supports it, the query is also
+        compiled once by the backend.
+
+        Arguments:
+            query: String with the SPARQL query.  See `query()` for how
+                to use IRI and literal variables.
+            kwargs: Keyword arguments passed to the backend prepare()
+                method.
+
+        Returns:
+            A prepared query.  Call it with the same `iris`, `literals`
+            and backend keyword arguments as `query()` to evaluate it.
+
+        Examples:
+            >>> from tripper import FOAF, Literal, Triplestore
+            >>> ts = Triplestore(backend="rdflib")
+            >>> ts.bind("foaf", FOAF)
+            Namespace('http://xmlns.com/foaf/0.1/')
+
+            >>> ts.add_triples([
+            ...     (":john", FOAF.name, Literal("John Dow")),
+            ...     (":jack", FOAF.name, Literal("Jack Hudson")),
+            ... ])
+            >>> q = ts.prepare("SELECT ?s WHERE { ?s foaf:name $name .}")
+            >>> q(literals={"name": "John Dow"})
+            [(':john',)]
+            >>> q(literals={"name": "Jack Hudson"})
+            [(':jack',)]
+
+        """
+        self._check_method("query")
+        return PreparedQuery(self, query, **kwargs)
+
+    def _query(
+        self,
+        query: "Hashable",
+        evaluate: "Optional[Callable[[], Any]]" = None,
+        **kwargs,
+    ) -> "Any":
+        """Help function that sends an already substituted query to the
+        backend, using the query cache if it is enabled.
+
+        If `evaluate` is given, it is called without arguments instead of
+        the backend query() method.  `query` and `kwargs` are then only
+        used for identifying the result, and `query` may be any hashable
+        key.
+        """
+        if self.query_cache_size > 0:
+            return self._cached_query(query, evaluate, **kwargs)
+        return self._backend_query(query, evaluate, **kwargs)
+
+    def _backend_query(
+        self,
+        query: "Hashable",
+        evaluate: "Optional[Callable[[], Any]]" = None,
+        **kwargs,
+    ) -> "Any":
+        """Help function that sends `query` to the backend, sharing the
+        call with identical concurrent queries if `single_flight` is
+        enabled."""
+        if evaluate is None:
+            evaluate = functools.partial(self.backend.query, query, **kwargs)
+        if not self.single_flight:
+            return evaluate()
+        try:
+            key = ("query", query, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:  # unhashable kwargs
+            return evaluate()
+        return self._single_flight(key, evaluate)
+
+    def _single_flight(self, key: "Any", func: "Callable", *args, **kwargs):
+        """Call `func` with the given arguments, unless an identical call
+        identified by `key` already is in flight in another thread.  In
+        that case, wait for it and return its result.
+
+        The result is materialised, such that each caller gets its own
+        list or generator.  Exceptions are raised in all callers.
+        """
+        key = (key, self.generation)
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        assert flight is not None  # nosec
+
+        if leader:
+            try:
+                flight.result = _materialise(func(*args, **kwargs))
+            except BaseException as exc:
+                flight.error = exc
+                raise
+            finally:
+                with self._flights_lock:
+                    del self._flights[key]
+                flight.done.set()
+        else:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+        return _dematerialise(*flight.result)
+
+    def _cached_query(
+        self,
+        query: "Hashable",
+        evaluate: "Optional[Callable[[], Any]]" = None,
+        **kwargs,
+    ) -> "Any":
+        """Help function for query() that looks up the result in the
+        query cache before querying the backend.
+
+        Results returned as generators are materialised before they are
+        cached.  Each call returns a new list or generator, such that the
+        cached result cannot be modified by the caller.
+        """
+        key = (query, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:  # unhashable kwargs
+            return self._backend_query(query, evaluate, **kwargs)
+
+        # The lock is only held while accessing the cache, not while
+        # querying the backend
+        result: "Any"
+        generation = self.generation
+        with self._query_cache_lock:
+            entry = self._query_cache.get(key)
+            if entry and entry[0] == generation:
+                self._query_cache.move_to_end(key)
+                _, kind, result = entry
+                return _dematerialise(kind, result)
+
+        kind, result = _materialise(
+            self._backend_query(query, evaluate, **kwargs)
+        )
+        with self._query_cache_lock:
+            self._query_cache[key] = (generation, kind, result)
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+
+        return _dematerialise(kind, result)
+
+    def clear_query_cache(self) -> None:
+        """Remove all results from the query cache."""
+        with self._query_cache_lock:
+            self._query_cache.clear()
 
     def update(
         self,
@@ -520,6 +1390,8 @@ class Triplestore:
 
         """
         self._check_method("update")
+        self.flush()
+        self.generation += 1
         new_query = substitute_query(
             query, iris=iris, literals=literals, prefixes=self.namespaces
         )
@@ -576,13 +1448,13 @@ class Triplestore:
             ns = Namespace(namespace._iri, **kwargs)
         elif namespace is None:
             del self.namespaces[prefix]
-            if hasattr(self.backend, "bind"):
+            if "bind" in self.capabilities:
                 self.backend.bind(prefix, None)
             return None
         else:
             raise TypeError(f"invalid `namespace` type: {type(namespace)}")
 
-        if hasattr(self.backend, "bind"):
+        if "bind" in self.capabilities:
             self.backend.bind(
                 prefix, ns._iri  # pylint: disable=protected-access
             )
@@ -601,7 +1473,7 @@ class Triplestore:
         Returns:
             Returns true if the backend is available.
         """
-        if hasattr(self.backend, "is_available"):
+        if "is_available" in self.capabilities:
             return self.backend.is_available(
                 timeout=timeout, interval=interval
             )
@@ -699,17 +1571,36 @@ class Triplestore:
 
     @classmethod
     def _get_backend(cls, backend: str, package: "Optional[str]" = None):
-        """Returns the class implementing the given backend."""
-        module = cls._load_backend(backend, package=package)
-        return getattr(module, f"{backend.title()}Strategy")
+        """Returns the class implementing the given backend.
+
+        The backend class is cached, such that the entry points and
+        backend packages only are searched the first time a backend is
+        requested.
+        """
+        key = (backend, package)
+        if key not in cls._backend_classes:
+            module = cls._load_backend(backend, package=package)
+            name = backend.rsplit(".", 1)[-1]
+            cls._backend_classes[key] = getattr(
+                module, f"{name.title()}Strategy"
+            )
+        return cls._backend_classes[key]
 
     def _check_method(self, name):
-        """Check that backend implements the given method."""
-        self._check_backend_method(self.backend_name, name)
+        """Check that backend implements the given method.
 
-    def add(self, triple: "Triple"):
-        """Add `triple` to triplestore."""
-        self.add_triples([triple])
+        Raises NotImplementedError if it hasn't.
+        """
+        if name not in self.capabilities:
+            raise NotImplementedError(
+                f"Triplestore backend {self.backend_name!r} do not "
+                f'implement a "{name}()" method.'
+            )
+
+    def add(self, triple: "Triple", graph: "Optional[str]" = None):
+        """Add `triple` to triplestore, optionally to the named graph
+        `graph`."""
+        self.add_triples([triple], graph=graph)
 
     def value(  # pylint: disable=redefined-builtin
         self,
@@ -752,7 +1643,13 @@ class Triplestore:
         # Index of subject-predicate-object argument that is None
         (idx,) = [i for i, v in enumerate(spo) if v is None]
 
-        triples = self.triples(subject, predicate, object)
+        if "first" in self.capabilities and any is not None and not lang:
+            # Only fetch the number of matches needed to return a value
+            # or detect that it is not unique
+            self.flush()
+            triples = iter(self.backend.first(spo, 1 if any else 2))
+        else:
+            triples = self.triples(subject, predicate, object)
 
         if lang:
             triples = (
@@ -783,50 +1680,67 @@ class Triplestore:
 
     def objects(self, subject=None, predicate=None):
         """Returns a generator of objects for given subject and predicate."""
-        for _, _, o in self.triples(subject=subject, predicate=predicate):
+        for (o,) in self._project((subject, predicate, None), (2,)):
             yield o
 
     def predicates(
         self, subject=None, object=None  # pylint: disable=redefined-builtin
     ):
         """Returns a generator of predicates for given subject and object."""
-        for _, p, _ in self.triples(subject=subject, object=object):
+        for (p,) in self._project((subject, None, object), (1,)):
             yield p
 
     def subjects(
         self, predicate=None, object=None  # pylint: disable=redefined-builtin
     ):
         """Returns a generator of subjects for given predicate and object."""
-        for s, _, _ in self.triples(predicate=predicate, object=object):
+        for (s,) in self._project((None, predicate, object), (0,)):
             yield s
 
     def predicate_objects(self, subject=None):
         """Returns a generator of (predicate, object) tuples for given
         subject."""
-        for _, p, o in self.triples(subject=subject):
-            yield p, o
+        return self._project((subject, None, None), (1, 2))
 
     def subject_objects(self, predicate=None):
         """Returns a generator of (subject, object) tuples for given
         predicate."""
-        for s, _, o in self.triples(predicate=predicate):
-            yield s, o
+        return self._project((None, predicate, None), (0, 2))
 
     def subject_predicates(
         self, object=None
     ):  # pylint: disable=redefined-builtin
         """Returns a generator of (subject, predicate) tuples for given
         object."""
-        for s, p, _ in self.triples(object=object):
-            yield s, p
+        return self._project((None, None, object), (0, 1))
+
+    def _project(
+        self, spo: "OptionalTriple", positions: "Tuple[int, ...]"
+    ) -> "Generator[Tuple, None, None]":
+        """Help method returning a generator over tuples with the terms at
+        `positions` of the triples matching `spo`.
+
+        Backends implementing `project()` only have to convert the
+        requested terms.
+        """
+        if "project" in self.capabilities and not self.single_flight:
+            self.flush()
+            yield from self.backend.project(spo, positions)
+        else:
+            for triple in self.triples(*spo):
+                yield tuple(triple[i] for i in positions)
 
     def has(
-        self, subject=None, predicate=None, object=None
+        self, subject=None, predicate=None, object=None, graph=None
     ):  # pylint: disable=redefined-builtin
         """Returns true if the triplestore has any triple matching
-        the give subject, predicate and/or object."""
+        the give subject, predicate and/or object.  If `graph` is
+        given, only the named graph `graph` is searched."""
+        if "ask" in self.capabilities and graph is None:
+            self.flush()
+            return bool(self.backend.ask((subject, predicate, object)))
         triple = self.triples(
-            subject=subject, predicate=predicate, object=object
+            subject=subject, predicate=predicate, object=object, graph=graph
         )
         try:
             next(triple)
@@ -834,6 +1748,31 @@ class Triplestore:
             return False
         return True
 
+    def count(  # pylint: disable=redefined-builtin
+        self,
+        subject: "Optional[str]" = None,
+        predicate: "Optional[str]" = None,
+        object: "Optional[Union[str, Literal]]" = None,
+    ) -> int:
+        """Return the number of triples matching the given subject,
+        predicate and/or object.
+
+        Backends implementing the optional `count()` method compute the
+        number without transferring the matching triples.
+
+        Arguments:
+            subject: If given, match triples with this subject.
+            predicate: If given, match triples with this predicate.
+            object: If given, match triples with this object.
+
+        Returns:
+            Number of matching triples.
+        """
+        if "count" in self.capabilities:
+            self.flush()
+            return int(self.backend.count((subject, predicate, object)))
+        return sum(1 for _ in self.triples(subject, predicate, object))
+
     def set(self, triple):
         """Convenience method to update the value of object.
 
@@ -1071,7 +2010,15 @@ class Triplestore:
         - cardinality: (int) Restriction cardinality (optional).
         - value: (str|Literal) IRI or literal value of the restriction target.
         """
-        dct = dict(self.predicate_objects(iri))
+        triples, cls_triples = self.triples_many(
+            [(iri, None, None), (None, RDFS.subClassOf, iri)]
+        )
+        dct = {p: o for _, p, o in triples}
+        if len(cls_triples) > 1:
+            raise UniquenessError(
+                f"More than one match: {(None, RDFS.subClassOf, iri)}"
+            )
+        cls = cls_triples[0][0] if cls_triples else None
         if OWL.onClass in dct:
             ((t, p, c),) = [
                 (t, p, c)
@@ -1086,7 +2033,7 @@ class Triplestore:
             ]
         return {
             "iri": iri,
-            "cls": self.value(predicate=RDFS.subClassOf, object=iri),
+            "cls": cls,
             "property": dct[OWL.onProperty],
             "type": t,
             "cardinality": int(dct[c]) if c else None,
@@ -1352,22 +2299,23 @@ class Triplestore:
         if isinstance(returns, str):
             returns = [returns]
 
-        method = getattr(self, f"_add_function_{standard}")
-        func_iri = method(func, expects, returns, base_iri)
-        self.function_repo[func_iri] = func if callable(func) else None
-        if cost is not None:
-            self._add_cost(cost, func_iri)
-
-        # Add standard-independent documentation of how to access the
-        # mapping function
-        self._add_function_doc(
-            func=func if callable(func) else None,
-            func_iri=func_iri,
-            func_name=func_name,
-            module_name=module_name,
-            package_name=package_name,
-            pypi_package_name=pypi_package_name,
-        )
+        with self.batch():
+            method = getattr(self, f"_add_function_{standard}")
+            func_iri = method(func, expects, returns, base_iri)
+            self.function_repo[func_iri] = func if callable(func) else None
+            if cost is not None:
+                self._add_cost(cost, func_iri)
+
+            # Add standard-independent documentation of how to access the
+            # mapping function
+            self._add_function_doc(
+                func=func if callable(func) else None,
+                func_iri=func_iri,
+                func_name=func_name,
+                module_name=module_name,
+                package_name=package_name,
+                pypi_package_name=pypi_package_name,
+            )
 
         return func_iri
 
@@ -0,0 +1,274 @@
+"""An asyncio frontend to the triplestore.
+
+The `AsyncTriplestore` class wraps a `Triplestore` and provides coroutine
+versions of its main methods, such that applications built on asyncio
+(like web services) can issue many requests concurrently without
+blocking the event loop.
+
+Backends that implement the optional asynchronous methods (`aquery()`,
+`aupdate()`, `atriples()`, `aadd_triples()` and `aremove()`) are called
+directly from the event loop.  This is the case for the `sparqlwrapper`
+backend, which sends its requests with a non-blocking HTTP client that
+keeps connections alive between requests.  For other backends, like
+`rdflib`, the synchronous methods are called in an executor.
+
+Example:
+
+```python
+>>> import asyncio
+>>> from tripper import RDFS, AsyncTriplestore
+
+>>> async def main():
+...     async with AsyncTriplestore("rdflib") as ats:
+...         EX = ats.bind("ex", "http://example.com#")
+...         await ats.add_triples([
+...             (EX.Cat, RDFS.subClassOf, EX.Animal),
+...             (EX.Dog, RDFS.subClassOf, EX.Animal),
+...         ])
+...         return await asyncio.gather(
+...             ats.triples(subject=EX.Cat),
+...             ats.query("SELECT ?s WHERE { ?s rdfs:subClassOf ex:Animal }"),
+...         )
+>>> cats, animals = asyncio.run(main())
+>>> [s for s, _, _ in cats]
+['http://example.com#Cat']
+>>> sorted(animals)
+[('http://example.com#Cat',), ('http://example.com#Dog',)]
+
+```
+
+"""
+
+# pylint: disable=redefined-builtin
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from tripper.triplestore import Triplestore
+from tripper.utils import substitute_query
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
+    from typing import Any, Callable, Iterable, List, Optional, Union
+
+    from tripper.literal import Literal
+    from tripper.namespace import Namespace
+    from tripper.utils import Triple
+
+
+class AsyncTriplestore:
+    """Asyncio frontend to a triplestore.
+
+    Arguments:
+        backend: Either a `Triplestore` instance to wrap or the name of
+            the backend to create a new triplestore for.
+        executor: Executor in which to call synchronous backend methods.
+            The default is an executor with a single thread, which is
+            safe for backends that are not thread-safe.
+        kwargs: Keyword arguments passed to `Triplestore()` when `backend`
+            is a backend name.
+
+    Attributes:
+        triplestore: The wrapped triplestore.
+        executor: Executor used for calling synchronous backend methods.
+
+    Notes:
+        The query cache of the wrapped triplestore is not used by
+        backends with asynchronous methods.
+    """
+
+    def __init__(
+        self,
+        backend: "Union[str, Triplestore]",
+        executor: "Optional[Executor]" = None,
+        **kwargs,
+    ) -> None:
+        if isinstance(backend, Triplestore):
+            self.triplestore = backend
+        else:
+            self.triplestore = Triplestore(backend, **kwargs)
+        self._own_executor = executor is None
+        self.executor = (
+            ThreadPoolExecutor(max_workers=1) if executor is None else executor
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    @property
+    def namespaces(self) -> "dict":
+        """Dict mapping namespace prefixes to IRIs."""
+        return self.triplestore.namespaces
+
+    def bind(self, prefix: str, namespace="", **kwargs) -> "Namespace":
+        """Bind prefix to namespace.  Same as `Triplestore.bind()`."""
+        return self.triplestore.bind(prefix, namespace, **kwargs)
+
+    async def query(
+        self,
+        query: str,
+        iris: "Optional[dict]" = None,
+        literals: "Optional[dict]" = None,
+        **kwargs,
+    ) -> "Any":
+        """SPARQL query.
+
+        Arguments are the same as for `Triplestore.query()`.
+
+        Returns:
+            The return type depends on type of query:
+              - SELECT: list of tuples of IRIs for each matching row
+              - ASK: bool
+              - CONSTRUCT, DESCRIBE: list of triples
+        """
+        ts = self.triplestore
+        if self._native("aquery"):
+            new_query = substitute_query(
+                query, iris=iris, literals=literals, prefixes=ts.namespaces
+            )
+            return await ts.backend.aquery(new_query, **kwargs)
+
+        def query_():
+            result = ts.query(query, iris=iris, literals=literals, **kwargs)
+            return result if isinstance(result, (bool, list)) else list(result)
+
+        return await self._run(query_)
+
+    async def update(
+        self,
+        query: str,
+        iris: "Optional[dict]" = None,
+        literals: "Optional[dict]" = None,
+        **kwargs,
+    ) -> None:
+        """Update triplestore with SPARQL.
+
+        Arguments are the same as for `Triplestore.update()`.
+        """
+        ts = self.triplestore
+        if self._native("aupdate"):
+            ts.generation += 1
+            new_query = substitute_query(
+                query, iris=iris, literals=literals, prefixes=ts.namespaces
+            )
+            await ts.backend.aupdate(new_query, **kwargs)
+        else:
+            await self._run(
+                ts.update, query, iris=iris, literals=literals, **kwargs
+            )
+
+    async def triples(
+        self,
+        subject: "Optional[str]" = None,
+        predicate: "Optional[str]" = None,
+        object: "Optional[Union[str, Literal]]" = None,
+        graph: "Optional[str]" = None,
+    ) -> "List[Triple]":
+        """Returns a list of matching triples.
+
+        Arguments:
+            subject: If given, match triples with this subject.
+            predicate: If given, match triples with this predicate.
+            object: If given, match triples with this object.
+            graph: IRI of a named graph to match triples in.  See
+                `Triplestore.triples()`.
+        """
+        ts = self.triplestore
+        if self._native("atriples"):
+            return await ts.backend.atriples(
+                (subject, predicate, object), **_graph_kwargs(graph)
+            )
+        return await self._run(
+            lambda: list(ts.triples(subject, predicate, object, graph=graph))
+        )
+
+    async def add_triples(
+        self, triples: "Iterable[Triple]", graph: "Optional[str]" = None
+    ) -> None:
+        """Add a sequence of triples.
+
+        Arguments:
+            triples: A sequence of `(s, p, o)` tuples to add to the
+                triplestore.
+            graph: IRI of a named graph to add the triples to.  By
+                default, the triples are added to the default graph.
+        """
+        ts = self.triplestore
+        triples = list(triples)
+        if self._native("aadd_triples"):
+            ts.generation += 1
+            await ts.backend.aadd_triples(triples, **_graph_kwargs(graph))
+        else:
+            await self._run(ts.add_triples, triples, graph=graph)
+
+    async def add(
+        self, triple: "Triple", graph: "Optional[str]" = None
+    ) -> None:
+        """Add `triple` to triplestore, optionally to the named graph
+        `graph`."""
+        await self.add_triples([triple], graph=graph)
+
+    async def remove(
+        self,
+        subject: "Optional[str]" = None,
+        predicate: "Optional[str]" = None,
+        object: "Optional[Union[str, Literal]]" = None,
+        graph: "Optional[str]" = None,
+    ) -> None:
+        """Remove all matching triples.
+
+        Arguments:
+            subject: If given, match triples with this subject.
+            predicate: If given, match triples with this predicate.
+            object: If given, match triples with this object.
+            graph: IRI of a named graph to remove the triples from.  By
+                default, the triples are removed from the default graph.
+        """
+        ts = self.triplestore
+        if self._native("aremove"):
+            ts.generation += 1
+            await ts.backend.aremove(
+                (subject, predicate, object), **_graph_kwargs(graph)
+            )
+        else:
+            await self._run(ts.remove, subject, predicate, object, graph=graph)
+
+    async def close(self) -> None:
+        """Close the triplestore and the executor created by this
+        instance."""
+        if "aclose" in self.triplestore.capabilities:
+            await self.triplestore.backend.aclose()
+        await self._run(self.triplestore.close)
+        if self._own_executor:
+            self.executor.shutdown(wait=False)
+
+    def _native(self, name: str) -> bool:
+        """Return whether the backend implements asynchronous method
+        `name`.
+
+        Since the asynchronous backend methods bypass the write buffer
+        of `Triplestore.batch()`, they are not used while write
+        operations are buffered.
+        """
+        ts = self.triplestore
+        # pylint: disable=protected-access
+        return name in ts.capabilities and not ts._batch.operations
+
+    async def _run(self, func: "Callable", *args, **kwargs) -> "Any":
+        """Call `func` with the given arguments in the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
+
+
+def _graph_kwargs(graph: "Optional[str]") -> dict:
+    """Return keyword arguments for passing `graph` to an asynchronous
+    backend method.  The argument is left out if `graph` is None, such
+    that backends without named graphs are called as before."""
+    return {} if graph is None else {"graph": graph}
@@ -81,43 +81,48 @@ class Tripper(Triplestore):
             # pylint complains about uuid being unused if we make this an
             # f-string
             iri = "_bnode_" + str(uuid.uuid4())
-        data_source = "_data_source_" + random_string(8)
-        self.add((data_source, RDF.type, DataSource))
-
-        if isinstance(func, Literal):
-            self.add((data_source, hasDataValue, func))
-            if cost is not None:
-                self._add_cost(cost, data_source)
-            if isinstance(iri, str):
-                self.map(data_source, iri)
-            else:
-                raise TypeError("literal data can only have a single `iri`")
-
-        elif callable(func):
-
-            def fn():
-                return func(iri, configurations, self)
+        with self.batch():
+            data_source = "_data_source_" + random_string(8)
+            self.add((data_source, RDF.type, DataSource))
+
+            if isinstance(func, Literal):
+                self.add((data_source, hasDataValue, func))
+                if cost is not None:
+                    self._add_cost(cost, data_source)
+                if isinstance(iri, str):
+                    self.map(data_source, iri)
+                else:
+                    raise TypeError(
+                        "literal data can only have a single `iri`"
+                    )
 
-            # Include data source IRI in documentation to ensure that the
-            # function_id of `fn()` will differ for different data sources...
-            fn.__doc__ = (
-                f"Function for data source: {data_source}.\n\n{func.__doc__}"
-            )
-            fn.__name__ = func.__name__
-
-            func_iri = self.add_function(
-                fn,
-                expects=(),
-                returns=iri,
-                base_iri=base_iri,
-                standard=standard,
-                cost=cost,
-            )
-            self.add((data_source, hasAccessFunction, func_iri))
-        else:
-            raise TypeError(
-                f"`func` must be a callable or literal, got {type(func)}"
-            )
+            elif callable(func):
+
+                def fn():
+                    return func(iri, configurations, self)
+
+                # Include data source IRI in documentation to ensure that
+                # the function_id of `fn()` will differ for different data
+                # sources...
+                fn.__doc__ = (
+                    f"Function for data source: {data_source}.\n\n"
+                    f"{func.__doc__}"
+                )
+                fn.__name__ = func.__name__
+
+                func_iri = self.add_function(
+                    fn,
+                    expects=(),
+                    returns=iri,
+                    base_iri=base_iri,
+                    standard=standard,
+                    cost=cost,
+                )
+                self.add((data_source, hasAccessFunction, func_iri))
+            else:
+                raise TypeError(
+                    f"`func` must be a callable or literal, got {type(func)}"
+                )
 
         return data_source
 
@@ -0,0 +1,345 @@
+"""Query several triplestores as one.
+
+The `FederatedTriplestore` class wraps a set of `Triplestore` instances,
+for example the ones configured in a `Session`.  Read operations are sent
+to all members concurrently using a thread pool, and the results are
+merged as they arrive.  Hence, the total latency is determined by the
+slowest member instead of by the sum over all members.
+
+Since a federated triplestore provides the `namespaces`, `expand_iri()`
+and `query()` attributes, it can be passed to `tripper.datadoc.search()`
+to search all members at once.
+
+Example:
+
+```python
+>>> from tripper import RDFS, FederatedTriplestore, Triplestore
+
+>>> ts1 = Triplestore("memory")
+>>> ts2 = Triplestore("memory")
+>>> EX = ts1.bind("ex", "http://example.com#")
+>>> ts1.add((EX.Cat, RDFS.subClassOf, EX.Animal))
+>>> ts2.add((EX.Dog, RDFS.subClassOf, EX.Animal))
+>>> ts2.add((EX.Cat, RDFS.subClassOf, EX.Animal))
+
+>>> with FederatedTriplestore([ts1, ts2]) as fts:
+...     sorted(fts.subjects(RDFS.subClassOf, EX.Animal))
+['http://example.com#Cat', 'http://example.com#Dog']
+
+```
+
+"""
+
+# pylint: disable=redefined-builtin
+
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple
+
+from tripper.utils import expand_iri, prefix_iri
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import (
+        Any,
+        Callable,
+        Dict,
+        Generator,
+        Iterable,
+        List,
+        Optional,
+        Sequence,
+        Union,
+    )
+
+    from tripper.literal import Literal
+    from tripper.namespace import Namespace
+    from tripper.session import Session
+    from tripper.triplestore import Triplestore
+    from tripper.utils import Triple
+
+
+# Marks that a member has no more results
+_DONE = object()
+
+# Matches the query form, ignoring IRIs and comments in the prologue
+_QUERY_FORM = re.compile(
+    r"<[^<>\s]*>|#[^\n]*|"
+    r"\b(SELECT\s+(?:DISTINCT|REDUCED)|SELECT|CONSTRUCT|DESCRIBE|ASK)\b",
+    re.IGNORECASE,
+)
+
+
+class _Error(NamedTuple):
+    """Wraps an exception raised by a member."""
+
+    exc: BaseException
+
+
+class FederatedTriplestore:
+    """A read-only frontend querying several triplestores concurrently.
+
+    Arguments:
+        triplestores: Sequence of member triplestores.
+        max_workers: Maximum number of threads used for querying the
+            members.  Defaults to the number of members.
+        queue_size: Maximum number of results received from the members
+            that are buffered until they are consumed.  When the buffer
+            is full, the members wait.
+
+    Attributes:
+        triplestores: List of member triplestores.
+        namespaces: Dict mapping namespace prefixes to IRIs.  It is
+            initialised from the namespaces of all members.  If a prefix
+            is bound in several members, the first member wins.
+
+    Note:
+        Triples and the results of CONSTRUCT, DESCRIBE and SELECT DISTINCT
+        queries are de-duplicated by keeping all results returned so far
+        in a set.  Other SELECT queries keep bag semantics, i.e. a row is
+        returned once for each time it is returned by a member.  The order
+        of the results depends on the order in which they are received
+        from the members.
+    """
+
+    def __init__(
+        self,
+        triplestores: "Sequence[Triplestore]",
+        max_workers: "Optional[int]" = None,
+        queue_size: int = 1000,
+    ) -> None:
+        self.triplestores = list(triplestores)
+        self.queue_size = queue_size
+        self.namespaces: "Dict[str, Namespace]" = {}
+        for ts in reversed(self.triplestores):
+            self.namespaces.update(ts.namespaces)
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or max(len(self.triplestores), 1)
+        )
+        # Members created by the federation itself and closed by close()
+        self._owned: "List[Triplestore]" = []
+
+    @classmethod
+    def from_session(
+        cls,
+        session: "Session",
+        names: "Optional[Iterable[str]]" = None,
+        **kwargs,
+    ) -> "FederatedTriplestore":
+        """Create a federated triplestore from the triplestores configured
+        in a session.
+
+        Arguments:
+            session: The session.
+            names: Names of the triplestores to include.  Defaults to all
+                triplestores configured in the session.
+            kwargs: Additional keyword arguments passed to the constructor.
+        """
+        if names is None:
+            names = session.get_names()
+        triplestores = [session.get_triplestore(name) for name in names]
+        federation = cls(triplestores, **kwargs)
+        federation._owned.extend(triplestores)
+        return federation
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        """Close the thread pool and the member triplestores created by
+        `from_session()`.
+
+        Triplestores passed to the constructor are owned by the caller and
+        are left open.
+        """
+        self.executor.shutdown(wait=True)
+        for ts in self._owned:
+            ts.close()
+        self._owned.clear()
+
+    def bind(
+        self, prefix: str, namespace: "Union[str, Namespace]", **kwargs
+    ) -> "Namespace":
+        """Bind prefix to namespace in all members and return the new
+        Namespace object."""
+        ns = None
+        for ts in self.triplestores:
+            ns = ts.bind(prefix, namespace, **kwargs)
+        if ns is None:
+            raise ValueError("cannot bind prefix without any members")
+        self.namespaces[prefix] = ns
+        return ns
+
+    def expand_iri(self, iri: str, strict: bool = False) -> str:
+        """Return the full IRI if `iri` is prefixed.
+        Otherwise `iri` is returned."""
+        return expand_iri(iri, self.namespaces, strict=strict)
+
+    def prefix_iri(self, iri: str, require_prefixed: bool = False) -> str:
+        """Return prefixed IRI.  This is the reverse of expand_iri()."""
+        return prefix_iri(iri, self.namespaces, require_prefixed)
+
+    def triples(
+        self,
+        subject: "Optional[str]" = None,
+        predicate: "Optional[str]" = None,
+        object: "Optional[Union[str, Literal]]" = None,
+    ) -> "Generator[Triple, None, None]":
+        """Returns a generator over unique matching triples in all members.
+
+        Arguments:
+            subject: If given, match triples with this subject.
+            predicate: If given, match triples with this predicate.
+            object: If given, match triples with this object.
+        """
+        return self._fan_out(lambda ts: ts.triples(subject, predicate, object))
+
+    def query(
+        self,
+        query: str,
+        iris: "Optional[dict]" = None,
+        literals: "Optional[dict]" = None,
+        **kwargs,
+    ) -> "Any":
+        """SPARQL query sent to all members.
+
+        Arguments are the same as for `Triplestore.query()`.
+
+        Returns:
+            The return type depends on type of query:
+              - SELECT: list of rows from all members.  Rows are only
+                de-duplicated for SELECT DISTINCT and SELECT REDUCED.
+              - ASK: whether any member has a match
+              - CONSTRUCT, DESCRIBE: list of unique triples
+        """
+
+        def query_(ts):
+            result = ts.query(query, iris=iris, literals=literals, **kwargs)
+            return [result] if isinstance(result, bool) else result
+
+        results = list(self._fan_out(query_, unique=_is_unique(query)))
+        if any(isinstance(result, bool) for result in results):
+            return True in results
+        return results
+
+    def query_iter(
+        self,
+        query: str,
+        iris: "Optional[dict]" = None,
+        literals: "Optional[dict]" = None,
+        **kwargs,
+    ) -> "Generator[Any, None, None]":
+        """Like `query()`, but returns a generator over rows or triples
+        as they are received from the members.
+
+        ASK queries are not supported.
+        """
+        return self._fan_out(
+            lambda ts: ts.query_iter(
+                query, iris=iris, literals=literals, **kwargs
+            ),
+            unique=_is_unique(query),
+        )
+
+    def has(
+        self,
+        subject: "Optional[str]" = None,
+        predicate: "Optional[str]" = None,
+        object: "Optional[Union[str, Literal]]" = None,
+    ) -> bool:
+        """Returns true if any member has a triple matching the given
+        subject, predicate and/or object."""
+        results = self._fan_out(
+            lambda ts: [ts.has(subject, predicate, object)]
+        )
+        return any(results)
+
+    def objects(self, subject=None, predicate=None):
+        """Returns a generator of objects for given subject and predicate."""
+        for _, _, o in self.triples(subject=subject, predicate=predicate):
+            yield o
+
+    def predicates(self, subject=None, object=None):
+        """Returns a generator of predicates for given subject and object."""
+        for _, p, _ in self.triples(subject=subject, object=object):
+            yield p
+
+    def subjects(self, predicate=None, object=None):
+        """Returns a generator of subjects for given predicate and object."""
+        for s, _, _ in self.triples(predicate=predicate, object=object):
+            yield s
+
+    def _fan_out(
+        self,
+        func: "Callable[[Triplestore], Iterable[Any]]",
+        unique: bool = True,
+    ) -> "Generator[Any, None, None]":
+        """Call `func` for each member in the thread pool and return a
+        generator over the items in the returned iterables.
+
+        If `unique` is true, only the first occurrence of each item is
+        yielded.
+
+        Items are yielded as soon as they are received from any member.
+        At most `queue_size` items are buffered.  Exceptions raised by a
+        member are re-raised by the generator.  If the generator is closed
+        before it is exhausted, the members stop iterating after their
+        current item.
+        """
+        items: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+
+        def put(item):
+            # Wait for free space, unless the generator has been closed
+            while not stop.is_set():
+                try:
+                    items.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def produce(ts):
+            try:
+                for item in func(ts):
+                    if stop.is_set():
+                        break
+                    put(item)
+            except BaseException as exc:  # pylint: disable=broad-except
+                put(_Error(exc))
+            finally:
+                put(_DONE)
+
+        def merge():
+            seen = set()
+            remaining = len(self.triplestores)
+            try:
+                while remaining:
+                    item = items.get()
+                    if item is _DONE:
+                        remaining -= 1
+                    elif isinstance(item, _Error):
+                        raise item.exc
+                    elif not unique:
+                        yield item
+                    elif item not in seen:
+                        seen.add(item)
+                        yield item
+            finally:
+                stop.set()
+
+        for ts in self.triplestores:
+            self.executor.submit(produce, ts)
+        return merge()
+
+
+def _is_unique(query: str) -> bool:
+    """Returns true if the results of `query` are sets, i.e. for CONSTRUCT,
+    DESCRIBE, SELECT DISTINCT and SELECT REDUCED queries."""
+    for match in _QUERY_FORM.finditer(query):
+        if match.group(1):
+            return match.group(1).upper() != "SELECT"
+    return False
@@ -5,6 +5,7 @@ Pint is used for programatic unit conversions.
 
 # pylint: disable=too-few-public-methods,too-many-lines
 
+import functools
 import math
 import pickle  # nosec
 import re
@@ -26,7 +27,12 @@ from tripper import (
     Namespace,
     Triplestore,
 )
-from tripper.errors import IRIExistsError, PermissionWarning, TripperError
+from tripper.errors import (
+    IRIExistsError,
+    PermissionWarning,
+    TripperError,
+    UniquenessError,
+)
 from tripper.namespace import get_cachedir
 from tripper.utils import AttrDict, bnode_iri
 
@@ -323,6 +329,20 @@ def save_emmo_quantity(
     ts.add_triples(triples)
 
 
+def _prefetched_value(
+    props: "Mapping[str, list]", iri: str, predicate: str, any=False
+) -> "Any":
+    """Like Triplestore.value(), but for the prefetched properties `props`
+    of `iri`."""
+    # pylint: disable=redefined-builtin
+    values = props.get(predicate, [])
+    if any is None:
+        return values
+    if len(values) > 1 and not any:
+        raise UniquenessError(f"More than one match: {(iri, predicate, None)}")
+    return values[0] if values else None
+
+
 class Units:
     """A class representing all units in an ontology."""
 
@@ -617,12 +637,22 @@ class Units:
             See the get_unit() method for details.
 
         """
+        # pylint: disable=too-many-locals
+
+        # Fetch the direct properties of all units with a single request
+        iris = self._emmo_unit_iris(include_prefixed=include_prefixed)
+        properties = self.ts.triples_many((iri, None, None) for iri in iris)
+
         d = {}
-        for iri in self._emmo_unit_iris(include_prefixed=include_prefixed):
-            name = str(self.ts.value(iri, SKOS.prefLabel))
-            description = self.ts.value(iri, EMMO.elucidation)
+        for iri, triples in zip(iris, properties):
+            props: "dict[str, list]" = {}
+            for _, p, o in triples:
+                props.setdefault(p, []).append(o)
+            value = functools.partial(_prefetched_value, props, iri)
+            name = str(value(SKOS.prefLabel))
+            description = value(EMMO.elucidation)
             if not description:
-                description = self.ts.value(iri, EMMO.definition)
+                description = value(EMMO.definition)
             dimstr = str(self._get_unit_dimension_string(iri))
             dimension = self._parse_dimension_string(dimstr)
             mult = list(
@@ -633,28 +663,24 @@ class Units:
             offset = list(
                 self.ts.restrictions(iri, property=EMMO.hasSIConversionOffset)
             )
-            qudtIRI = self.ts.value(iri, EMMO.qudtReference, any=True)
-            omIRI = self.ts.value(iri, EMMO.omReference, any=True)
+            qudtIRI = value(EMMO.qudtReference, any=True)
+            omIRI = value(EMMO.omReference, any=True)
 
             for unitCodeIRI in (SCHEMA.unitCode, EMMO.uneceCommonCode):
-                unitCode = self.ts.value(iri, unitCodeIRI)
+                unitCode = value(unitCodeIRI)
                 if unitCode:
                     break
 
             d[name] = AttrDict(
                 name=name,
                 description=description,
-                aliases=[
-                    str(s) for s in self.ts.value(iri, SKOS.altLabel, any=None)
-                ],
+                aliases=[str(s) for s in value(SKOS.altLabel, any=None)],
                 symbols=self._get_unit_symbols(iri),
                 dimension=dimension,
                 emmoIRI=iri,
                 qudtIRI=str(qudtIRI) if qudtIRI else None,
                 omIRI=str(omIRI) if omIRI else None,
-                ucumCodes=[
-                    str(s) for s in self.ts.value(iri, EMMO.ucumCode, any=None)
-                ],
+                ucumCodes=[str(s) for s in value(EMMO.ucumCode, any=None)],
                 unitCode=str(unitCode) if unitCode else None,
                 multiplier=float(mult[0]["value"]) if mult else None,
                 offset=float(offset[0]["value"]) if offset else None,
@@ -1,6 +1,6 @@
 """Utility functions."""
 
-# pylint: disable=invalid-name,redefined-builtin
+# pylint: disable=invalid-name,redefined-builtin,too-many-lines
 import datetime
 import hashlib
 import inspect
@@ -30,6 +30,7 @@ except ImportError:
 if TYPE_CHECKING:  # pragma: no cover
     from typing import (
         Callable,
+        Dict,
         Generator,
         Iterable,
         Iterator,
@@ -70,6 +71,7 @@ __all__ = (
     "expand_iri",
     "prefix_iri",
     "substitute_query",
+    "query_substitutions",
     "get_entry_points",
     "check_service_availability",
 )
@@ -873,6 +875,34 @@ def substitute_query(
         in the query as a single token.  This may prevent sparql injection
         attacks.
     """
+    mapping = query_substitutions(
+        iris=iris, literals=literals, prefixes=prefixes, iriquote=iriquote
+    )
+    return string.Template(query).safe_substitute(mapping)
+
+
+def query_substitutions(
+    iris: "Optional[dict]" = None,
+    literals: "Optional[dict]" = None,
+    prefixes: "Optional[dict]" = None,
+    iriquote: "Optional[str]" = "<>",
+) -> "Dict[str, str]":
+    """Return a dict mapping IRI and literal variables to their properly
+    escaped SPARQL representation.
+
+    The arguments have the same meaning as for `substitute_query()`.
+
+    Examples:
+
+    >>> query_substitutions(
+    ...     iris={"cls": "owl:Class"},
+    ...     literals={"n": 1},
+    ...     prefixes={"owl": "http://www.w3.org/2002/07/owl#"},
+    ... )  # doctest: +NORMALIZE_WHITESPACE
+    {'cls': '<http://www.w3.org/2002/07/owl#Class>',
+     'n': '"1"^^<http://www.w3.org/2001/XMLSchema#integer>'}
+
+    """
     safe = "-._~:/?#@+&;="  # special IRI characters that are not escaped
     mapping = {}
 
@@ -901,7 +931,7 @@ def substitute_query(
         for k, v in literals.items():
             mapping[k] = Literal(v).n3()
 
-    return string.Template(query).safe_substitute(mapping)
+    return mapping
 
 
 def get_entry_points(group: str):